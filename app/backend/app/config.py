@@ -41,6 +41,11 @@ class Settings(BaseSettings):
     s3_presign_endpoint_url: str | None = None
 
     evaluation_event_bus_name: str = ""
+    evaluation_dependency_debounce_seconds: float = 1.0
+    evaluation_reconcile_window_hours: float = 24.0
+
+    gzip_responses: bool = True
+    gzip_minimum_size: int = 1024
 
     @property
     def cognito_region(self) -> str:
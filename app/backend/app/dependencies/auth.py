@@ -50,7 +50,7 @@ async def get_current_user(
             detail="Invalid authentication credentials",
         )
 
-    user = await user_service.get_by_email(session, email)
+    user = await user_service.get_by_email_cached(session, email)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import settings
 from app.routers import (
@@ -18,11 +19,25 @@ from app.routers import (
     teams,
     users,
 )
+from app.services import (
+    evaluation_notify_service,
+    evaluation_scheduler_service,
+    eventbridge_service,
+    storage_service,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await storage_service.start_clients()
+    await eventbridge_service.start_relay()
+    await evaluation_notify_service.start_listener()
+    await evaluation_scheduler_service.start_scheduler()
     yield
+    await evaluation_scheduler_service.stop_scheduler()
+    await evaluation_notify_service.stop_listener()
+    await eventbridge_service.stop_relay()
+    await storage_service.stop_clients()
 
 
 app = FastAPI(title="Lauter API", version="0.1.0", lifespan=lifespan)
@@ -35,6 +50,10 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization", "X-Request-ID"],
 )
 
+if settings.gzip_responses:
+    # Event streams are excluded by the middleware, so SSE is unaffected.
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
+
 app.include_router(health.router)
 app.include_router(auth.router)
 app.include_router(dashboard.router)
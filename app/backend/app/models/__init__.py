@@ -1,8 +1,13 @@
+from app.models.bedrock_rate_limit import BedrockLease, BedrockRateLimit
+from app.models.bedrock_response_cache import BedrockResponseCache
 from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
+from app.models.dashboard_counter import DashboardCounter
 from app.models.document import Document
 from app.models.enums import PipelineStage, PositionStatus
 from app.models.evaluation import Evaluation
+from app.models.evaluation_outbox import EvaluationOutbox
+from app.models.evaluation_version_counter import EvaluationVersionCounter
 from app.models.position import Position
 from app.models.position_rubric import PositionRubric, PositionRubricVersion
 from app.models.rubric_template import RubricTemplate
@@ -10,10 +15,16 @@ from app.models.team import Team
 from app.models.user import User
 
 __all__ = [
+    "BedrockLease",
+    "BedrockRateLimit",
+    "BedrockResponseCache",
     "Candidate",
     "CandidatePosition",
+    "DashboardCounter",
     "Document",
     "Evaluation",
+    "EvaluationOutbox",
+    "EvaluationVersionCounter",
     "PipelineStage",
     "Position",
     "PositionRubric",
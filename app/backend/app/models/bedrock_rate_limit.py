@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, Index, String, func
+from sqlmodel import Field, SQLModel
+
+
+class BedrockRateLimit(SQLModel, table=True):
+    """Shared admission state for Bedrock calls, one row per model ID.
+
+    Written only by the evaluation Lambdas: ``tokens`` is the token-bucket
+    level as of ``updated_at`` and ``concurrency_limit`` is the AIMD window.
+    """
+
+    __tablename__ = "bedrock_rate_limits"
+
+    model_id: str = Field(sa_column=Column(String, primary_key=True))
+    tokens: float = Field(sa_column=Column(Float, nullable=False))
+    concurrency_limit: float = Field(sa_column=Column(Float, nullable=False))
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime, nullable=False, server_default=func.now())
+    )
+
+
+class BedrockLease(SQLModel, table=True):
+    """An in-flight Bedrock call. Expired leases no longer count as in flight."""
+
+    __tablename__ = "bedrock_leases"
+    __table_args__ = (
+        Index("ix_bedrock_leases_model_expires", "model_id", "expires_at"),
+    )
+
+    id: str = Field(sa_column=Column(String, primary_key=True))
+    model_id: str = Field(sa_column=Column(String, nullable=False))
+    expires_at: datetime = Field(sa_column=Column(DateTime, nullable=False))
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy.types import JSON
+from sqlmodel import Field, SQLModel
+
+
+class BedrockResponseCache(SQLModel, table=True):
+    """A structured Bedrock result, keyed by a fingerprint of its request.
+
+    Written and read only by the evaluation Lambdas. Rows past
+    ``expires_at`` are ignored and removed on the next write, as are the
+    oldest rows beyond the configured entry limit.
+    """
+
+    __tablename__ = "bedrock_response_cache"
+
+    fingerprint: str = Field(sa_column=Column(String, primary_key=True))
+    model_id: str = Field(sa_column=Column(String, nullable=False))
+    response: dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(
+        sa_column=Column(
+            DateTime, nullable=False, server_default=func.now(), index=True
+        )
+    )
+    expires_at: datetime = Field(sa_column=Column(DateTime, nullable=False, index=True))
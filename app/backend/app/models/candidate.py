@@ -1,11 +1,30 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, func
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, func
 from sqlmodel import Field, SQLModel
 
 
 class Candidate(SQLModel, table=True):
     __tablename__ = "candidates"
+    __table_args__ = (
+        # Substring search (ILIKE '%term%') on the candidate list.
+        Index(
+            "ix_candidates_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_candidates_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        # Keyset pagination: one index per sortable column, tie-broken by id.
+        Index("ix_candidates_updated_at_id", "updated_at", "id"),
+        Index("ix_candidates_full_name_id", "full_name", "id"),
+        Index("ix_candidates_email_id", "email", "id"),
+    )
 
     id: int | None = Field(
         default=None, sa_column=Column(Integer, primary_key=True, autoincrement=True)
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlmodel import Field, SQLModel
+
+
+class DashboardCounter(SQLModel, table=True):
+    """One dashboard count, kept current by the writes that change it.
+
+    ``metric`` names the count and ``key`` narrows it: the stage for
+    ``stage`` and the position id for ``position_candidates``, empty for the
+    totals. Writers add their delta in the same transaction as the change.
+    """
+
+    __tablename__ = "dashboard_counters"
+
+    metric: str = Field(sa_column=Column(String, primary_key=True))
+    key: str = Field(
+        default="", sa_column=Column(String, primary_key=True, server_default="")
+    )
+    value: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default="0")
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(
+            DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+        )
+    )
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import (
+    Boolean,
     Column,
     DateTime,
     ForeignKey,
@@ -10,8 +11,10 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    false,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.types import JSON
 from sqlmodel import Field, SQLModel
 
@@ -52,8 +55,16 @@ class Evaluation(SQLModel, table=True):
         ),
     )
     result: dict[str, Any] | None = Field(
+        default=None,
+        sa_column=Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True),
+    )
+    token_usage: dict[str, int] | None = Field(
         default=None, sa_column=Column(JSON, nullable=True)
     )
+    skip_response_cache: bool = Field(
+        default=False,
+        sa_column=Column(Boolean, nullable=False, server_default=false()),
+    )
     error_message: str | None = Field(
         default=None, sa_column=Column(Text, nullable=True)
     )
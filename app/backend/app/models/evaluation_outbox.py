@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy.types import JSON
+from sqlmodel import Field, SQLModel
+
+
+class EvaluationOutbox(SQLModel, table=True):
+    """An ``evaluation.requested`` event waiting to be relayed to EventBridge.
+
+    Written in the same transaction as its evaluation and deleted by the relay
+    once EventBridge has accepted it.
+    """
+
+    __tablename__ = "evaluation_outbox"
+
+    id: int | None = Field(
+        default=None, sa_column=Column(Integer, primary_key=True, autoincrement=True)
+    )
+    evaluation_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("evaluations.id"), nullable=False)
+    )
+    detail: dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    attempts: int = Field(
+        default=0, sa_column=Column(Integer, nullable=False, server_default="0")
+    )
+    next_attempt_at: datetime = Field(
+        sa_column=Column(DateTime, nullable=False, index=True)
+    )
+    last_error: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
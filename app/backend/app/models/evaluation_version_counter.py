@@ -0,0 +1,20 @@
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlmodel import Field, SQLModel
+
+
+class EvaluationVersionCounter(SQLModel, table=True):
+    """Highest evaluation version handed out per candidate position and step.
+
+    Versions are allocated with an upsert on this row, so concurrent creators
+    queue on its row lock instead of racing for the evaluations unique key.
+    """
+
+    __tablename__ = "evaluation_version_counters"
+
+    candidate_position_id: int = Field(
+        sa_column=Column(
+            Integer, ForeignKey("candidate_positions.id"), primary_key=True
+        )
+    )
+    step_type: str = Field(sa_column=Column(String, primary_key=True))
+    last_version: int = Field(sa_column=Column(Integer, nullable=False))
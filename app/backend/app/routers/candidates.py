@@ -1,3 +1,5 @@
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -37,12 +39,26 @@ async def list_candidates(
     position_id: int | None = Query(default=None),
     sort_by: str | None = Query(default=None),
     sort_order: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    count: Literal["exact", "estimated"] | None = Query(default=None),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> PaginatedCandidates:
-    items, total = await candidate_service.list_candidates(
-        session, offset, limit, search, stage, position_id, sort_by, sort_order
-    )
+    try:
+        page = await candidate_service.list_candidates(
+            session,
+            offset,
+            limit,
+            search,
+            stage,
+            position_id,
+            sort_by,
+            sort_order,
+            cursor=cursor,
+            count_mode=count,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.detail) from e
     return PaginatedCandidates(
         items=[
             CandidateListItem(
@@ -52,11 +68,13 @@ async def list_candidates(
                 positions=[PositionStageItem(**pos) for pos in item["positions"]],
                 updated_at=item["updated_at"],
             )
-            for item in items
+            for item in page["items"]
         ],
-        total=total,
+        total=page["total"],
         offset=offset,
         limit=limit,
+        next_cursor=page["next_cursor"],
+        total_is_estimate=page["total_is_estimate"],
     )
 
 
@@ -91,9 +91,7 @@ async def complete_upload(
         raise HTTPException(status_code=403, detail=e.detail) from e
     except ConflictError as e:
         raise HTTPException(status_code=409, detail=e.detail) from e
-
-    enriched = await document_service.enrich_document_response(session, document)
-    return DocumentResponse(**enriched)
+    return DocumentResponse(**document)
 
 
 @router.post(
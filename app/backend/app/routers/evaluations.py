@@ -1,8 +1,10 @@
 import asyncio
 import json
+import re
 from collections.abc import AsyncGenerator
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sse_starlette.sse import EventSourceResponse
 
@@ -12,11 +14,12 @@ from app.exceptions import NotFoundException
 from app.models.enums import EvaluationStatus, EvaluationStepType
 from app.models.user import User
 from app.schemas.evaluations import (
+    BulkRerunRequest,
     EvaluationHistoryResponse,
     EvaluationListResponse,
     EvaluationResponse,
 )
-from app.services import evaluation_service
+from app.services import evaluation_notify_service, evaluation_service
 
 router = APIRouter(prefix="/api/evaluations", tags=["evaluations"])
 
@@ -31,9 +34,54 @@ TERMINAL_STATUSES = {EvaluationStatus.completed, EvaluationStatus.failed}
 POLL_INTERVAL_SECONDS = 2
 KEEPALIVE_INTERVAL_POLLS = 15
 MAX_POLL_DURATION_SECONDS = 300
+KEEPALIVE_INTERVAL_SECONDS = POLL_INTERVAL_SECONDS * KEEPALIVE_INTERVAL_POLLS
 
 VALID_STEP_TYPES = {member.value for member in EvaluationStepType}
 
+MAX_RESULT_FIELDS = 20
+_RESULT_FIELD_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+_TOP_LEVEL_FIELDS = set(EvaluationResponse.model_fields) - {"result"}
+
+FieldsQuery = Query(
+    None,
+    description=(
+        "Comma-separated result keys to return, e.g. `status,weighted_total`. "
+        "Top-level evaluation fields are always included."
+    ),
+)
+ViewQuery = Query(
+    "full", description="`summary` returns only each step's headline result keys."
+)
+FreshQuery = Query(
+    False,
+    description=(
+        "Call the model again even if an identical request has a cached result."
+    ),
+)
+
+
+def _parse_result_fields(
+    fields: str | None, view: Literal["full", "summary"]
+) -> list[str] | None:
+    if fields is None:
+        return None
+    if view == "summary":
+        raise HTTPException(
+            status_code=422, detail="Use either fields or view=summary, not both"
+        )
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    if len(names) > MAX_RESULT_FIELDS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MAX_RESULT_FIELDS} fields can be requested",
+        )
+    invalid = [name for name in names if not _RESULT_FIELD_PATTERN.match(name)]
+    if invalid:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid field names: {', '.join(invalid)}"
+        )
+    return [name for name in names if name not in _TOP_LEVEL_FIELDS]
+
 
 def _validate_step_type(step_type: str) -> None:
     if step_type not in VALID_STEP_TYPES:
@@ -46,91 +94,204 @@ def _validate_step_type(step_type: str) -> None:
         )
 
 
-@router.get("/{candidate_position_id}/stream")
-async def stream_evaluation_status(
+def _status_change_events(
+    latest_by_step: dict[str, dict[str, Any]],
+    last_known_statuses: dict[str, str],
+    last_known_progress: dict[str, str],
+) -> list[dict[str, str]]:
+    """Diff the latest evaluations against what the client was last sent.
+
+    A new status yields ``status_change``. A write that keeps the status but
+    moves ``progress`` (a partial result on a running evaluation) yields
+    ``result_update``, so the client refetches the result.
+    """
+    events: list[dict[str, str]] = []
+    for step_type in sorted(latest_by_step):
+        evaluation = latest_by_step[step_type]
+        eval_key = str(evaluation["evaluation_id"])
+        current_status = evaluation["status"]
+        progress = evaluation.get("progress")
+        data = json.dumps(
+            {
+                "evaluation_id": evaluation["evaluation_id"],
+                "step_type": step_type,
+                "status": current_status,
+            }
+        )
+
+        progressed = False
+        if progress is not None and last_known_progress.get(eval_key) != progress:
+            last_known_progress[eval_key] = progress
+            progressed = True
+
+        if last_known_statuses.get(eval_key) != current_status:
+            last_known_statuses[eval_key] = current_status
+            events.append({"event": "status_change", "data": data})
+        elif progressed:
+            events.append({"event": "result_update", "data": data})
+    return events
+
+
+def _is_stream_finished(
+    latest_by_step: dict[str, dict[str, Any]],
+    last_known_statuses: dict[str, str],
+) -> bool:
+    if latest_by_step:
+        return all(e["status"] in TERMINAL_STATUSES for e in latest_by_step.values())
+    return bool(last_known_statuses)
+
+
+async def _load_latest_by_step(candidate_position_id: int) -> dict[str, dict[str, Any]]:
+    async with async_session_factory() as poll_session:
+        evaluations = await evaluation_service.get_evaluations(
+            poll_session, candidate_position_id
+        )
+    return {
+        evaluation.step_type: {
+            "evaluation_id": evaluation.id,
+            "status": evaluation.status,
+            "version": evaluation.version,
+            "progress": evaluation.updated_at.isoformat(),
+        }
+        for evaluation in evaluations
+    }
+
+
+async def _poll_status_events(
+    candidate_position_id: int, request: Request
+) -> AsyncGenerator[dict[str, str], None]:
+    last_known_statuses: dict[str, str] = {}
+    last_known_progress: dict[str, str] = {}
+    keepalive_counter = 0
+    started_at = asyncio.get_running_loop().time()
+
+    while True:
+        elapsed = asyncio.get_running_loop().time() - started_at
+        if elapsed >= MAX_POLL_DURATION_SECONDS:
+            yield {"event": "done", "data": "{}"}
+            break
+
+        if await request.is_disconnected():
+            break
+
+        latest_by_step = await _load_latest_by_step(candidate_position_id)
+        for event in _status_change_events(
+            latest_by_step, last_known_statuses, last_known_progress
+        ):
+            yield event
+
+        if _is_stream_finished(latest_by_step, last_known_statuses):
+            yield {"event": "done", "data": "{}"}
+            break
+
+        keepalive_counter += 1
+        if keepalive_counter >= KEEPALIVE_INTERVAL_POLLS:
+            keepalive_counter = 0
+            yield {"comment": "keepalive"}
+
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+
+async def _push_status_events(
     candidate_position_id: int,
     request: Request,
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> EventSourceResponse:
-    user_id = _require_user_id(current_user)
-    try:
-        await evaluation_service.verify_access(session, candidate_position_id, user_id)
-    except NotFoundException as e:
-        raise HTTPException(status_code=404, detail=e.detail) from e
+    listener: evaluation_notify_service.EvaluationStatusListener,
+) -> AsyncGenerator[dict[str, str], None]:
+    last_known_statuses: dict[str, str] = {}
+    last_known_progress: dict[str, str] = {}
+    started_at = asyncio.get_running_loop().time()
 
-    async def event_generator() -> AsyncGenerator[dict[str, str], None]:
-        last_known_statuses: dict[str, str] = {}
-        keepalive_counter = 0
-        started_at = asyncio.get_running_loop().time()
+    # Subscribe before the initial read so no notification can slip between.
+    async with listener.subscribe(candidate_position_id) as queue:
+        latest_by_step = await _load_latest_by_step(candidate_position_id)
 
         while True:
-            elapsed = asyncio.get_running_loop().time() - started_at
-            if elapsed >= MAX_POLL_DURATION_SECONDS:
+            for event in _status_change_events(
+                latest_by_step, last_known_statuses, last_known_progress
+            ):
+                yield event
+
+            if _is_stream_finished(latest_by_step, last_known_statuses):
+                yield {"event": "done", "data": "{}"}
+                break
+
+            remaining = MAX_POLL_DURATION_SECONDS - (
+                asyncio.get_running_loop().time() - started_at
+            )
+            if remaining <= 0:
                 yield {"event": "done", "data": "{}"}
                 break
 
             if await request.is_disconnected():
                 break
 
-            async with async_session_factory() as poll_session:
-                evaluations = await evaluation_service.get_evaluations(
-                    poll_session, candidate_position_id
+            try:
+                notification = await asyncio.wait_for(
+                    queue.get(), timeout=min(KEEPALIVE_INTERVAL_SECONDS, remaining)
                 )
+            except TimeoutError:
+                yield {"comment": "keepalive"}
+                continue
 
-            for evaluation in evaluations:
-                eval_key = str(evaluation.id)
-                current_status = evaluation.status
-
-                if (
-                    eval_key not in last_known_statuses
-                    or last_known_statuses[eval_key] != current_status
-                ):
-                    last_known_statuses[eval_key] = current_status
-                    yield {
-                        "event": "status_change",
-                        "data": json.dumps(
-                            {
-                                "evaluation_id": evaluation.id,
-                                "step_type": evaluation.step_type,
-                                "status": current_status,
-                            }
-                        ),
-                    }
-
-            if evaluations and all(e.status in TERMINAL_STATUSES for e in evaluations):
-                yield {"event": "done", "data": "{}"}
-                break
+            if notification is evaluation_notify_service.RESYNC_EVENT:
+                latest_by_step = await _load_latest_by_step(candidate_position_id)
+                continue
 
-            if not evaluations and last_known_statuses:
-                yield {"event": "done", "data": "{}"}
-                break
+            step_type = notification["step_type"]
+            known = latest_by_step.get(step_type)
+            if known is None or notification["version"] >= known["version"]:
+                latest_by_step[step_type] = {
+                    "evaluation_id": notification["evaluation_id"],
+                    "status": notification["status"],
+                    "version": notification["version"],
+                    "progress": notification.get("progress"),
+                }
 
-            keepalive_counter += 1
-            if keepalive_counter >= KEEPALIVE_INTERVAL_POLLS:
-                keepalive_counter = 0
-                yield {"comment": "keepalive"}
 
-            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+@router.get("/{candidate_position_id}/stream")
+async def stream_evaluation_status(
+    candidate_position_id: int,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> EventSourceResponse:
+    user_id = _require_user_id(current_user)
+    try:
+        await evaluation_service.verify_access(session, candidate_position_id, user_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=404, detail=e.detail) from e
+    # The session dependency only closes once the stream ends. Return its
+    # connection now, since the stream reads through short-lived sessions.
+    await session.close()
 
-    return EventSourceResponse(event_generator())
+    listener = evaluation_notify_service.get_listener()
+    if listener is None:
+        return EventSourceResponse(_poll_status_events(candidate_position_id, request))
+    return EventSourceResponse(
+        _push_status_events(candidate_position_id, request, listener)
+    )
 
 
 @router.get("/{candidate_position_id}", response_model=EvaluationListResponse)
 async def list_evaluations(
     candidate_position_id: int,
+    fields: str | None = FieldsQuery,
+    view: Literal["full", "summary"] = ViewQuery,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> EvaluationListResponse:
     user_id = _require_user_id(current_user)
+    result_fields = _parse_result_fields(fields, view)
     try:
-        await evaluation_service.verify_access(session, candidate_position_id, user_id)
+        evaluations = await evaluation_service.get_evaluations(
+            session=session,
+            candidate_position_id=candidate_position_id,
+            user_id=user_id,
+            result_fields=result_fields,
+            summary=view == "summary",
+        )
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=e.detail) from e
-    evaluations = await evaluation_service.get_evaluations(
-        session=session,
-        candidate_position_id=candidate_position_id,
-    )
     return EvaluationListResponse(
         items=[EvaluationResponse.model_validate(e) for e in evaluations]
     )
@@ -143,6 +304,7 @@ async def list_evaluations(
 async def rerun_evaluation(
     candidate_position_id: int,
     step_type: str,
+    fresh: bool = FreshQuery,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> EvaluationListResponse:
@@ -154,6 +316,7 @@ async def rerun_evaluation(
             session=session,
             candidate_position_id=candidate_position_id,
             step_type=step_type,
+            fresh=fresh,
         )
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=e.detail) from e
@@ -162,6 +325,27 @@ async def rerun_evaluation(
     )
 
 
+@router.post("/rerun", response_model=EvaluationListResponse)
+async def bulk_rerun_evaluations(
+    body: BulkRerunRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> EvaluationListResponse:
+    user_id = _require_user_id(current_user)
+    evaluations = await evaluation_service.bulk_rerun_evaluations(
+        session=session,
+        step_type=body.step_type,
+        user_id=user_id,
+        position_id=body.position_id,
+        candidate_position_ids=body.candidate_position_ids,
+        latest_rubric=body.latest_rubric,
+        fresh=body.fresh,
+    )
+    return EvaluationListResponse(
+        items=[EvaluationResponse.model_validate(e) for e in evaluations]
+    )
+
+
 @router.get(
     "/{candidate_position_id}/{step_type}/history",
     response_model=EvaluationHistoryResponse,
@@ -169,20 +353,25 @@ async def rerun_evaluation(
 async def get_evaluation_history(
     candidate_position_id: int,
     step_type: str,
+    fields: str | None = FieldsQuery,
+    view: Literal["full", "summary"] = ViewQuery,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user),
 ) -> EvaluationHistoryResponse:
     _validate_step_type(step_type)
     user_id = _require_user_id(current_user)
+    result_fields = _parse_result_fields(fields, view)
     try:
-        await evaluation_service.verify_access(session, candidate_position_id, user_id)
+        evaluations = await evaluation_service.get_evaluation_history(
+            session=session,
+            candidate_position_id=candidate_position_id,
+            step_type=step_type,
+            user_id=user_id,
+            result_fields=result_fields,
+            summary=view == "summary",
+        )
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=e.detail) from e
-    evaluations = await evaluation_service.get_evaluation_history(
-        session=session,
-        candidate_position_id=candidate_position_id,
-        step_type=step_type,
-    )
     return EvaluationHistoryResponse(
         step_type=step_type,
         items=[EvaluationResponse.model_validate(e) for e in evaluations],
@@ -202,11 +391,11 @@ async def get_evaluation_by_step(
     _validate_step_type(step_type)
     user_id = _require_user_id(current_user)
     try:
-        await evaluation_service.verify_access(session, candidate_position_id, user_id)
         evaluation = await evaluation_service.get_evaluation_by_step(
             session=session,
             candidate_position_id=candidate_position_id,
             step_type=step_type,
+            user_id=user_id,
         )
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=e.detail) from e
@@ -34,6 +34,8 @@ class PaginatedCandidates(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class CandidateDetailResponse(BaseModel):
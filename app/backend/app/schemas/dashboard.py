@@ -31,3 +31,5 @@ class DashboardStats(BaseModel):
     open_positions: int
     recent_candidates: list[RecentCandidate]
     positions_summary: list[PositionSummary]
+    snapshot_refreshed_at: datetime | None = None
+    snapshot_age_seconds: float = 0.0
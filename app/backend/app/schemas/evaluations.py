@@ -1,7 +1,11 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.models.enums import EvaluationStepType
+
+MAX_BULK_RERUN_CANDIDATE_POSITIONS = 500
 
 
 class EvaluationResponse(BaseModel):
@@ -33,3 +37,20 @@ class EvaluationStatusEvent(BaseModel):
     evaluation_id: int
     step_type: str
     status: str
+
+
+class BulkRerunRequest(BaseModel):
+    step_type: EvaluationStepType
+    position_id: int | None = None
+    candidate_position_ids: list[int] | None = Field(
+        default=None, min_length=1, max_length=MAX_BULK_RERUN_CANDIDATE_POSITIONS
+    )
+    latest_rubric: bool = False
+    fresh: bool = False
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "BulkRerunRequest":
+        if (self.position_id is None) == (self.candidate_position_ids is None):
+            msg = "Provide exactly one of position_id or candidate_position_ids"
+            raise ValueError(msg)
+        return self
@@ -18,6 +18,9 @@ _jwks_cache_time: float = 0.0
 _jwks_cache_lock = asyncio.Lock()
 JWKS_CACHE_TTL = 3600
 
+# Parsed RSA public keys by ``kid``; cleared whenever the JWKS is refetched.
+_public_keys: dict[str, Any] = {}
+
 
 async def build_cognito_auth_url(
     redirect_path: str | None = None, state: str | None = None
@@ -74,6 +77,7 @@ async def get_jwks() -> dict[str, Any]:
             response.raise_for_status()
             _jwks_cache = response.json()
             _jwks_cache_time = time.monotonic()
+            _public_keys.clear()
             return _jwks_cache
 
 
@@ -81,13 +85,14 @@ def _invalidate_jwks_cache() -> None:
     global _jwks_cache, _jwks_cache_time
     _jwks_cache = None
     _jwks_cache_time = 0.0
+    _public_keys.clear()
 
 
-async def validate_cognito_id_token(id_token: str) -> dict[str, Any]:
-    unverified_header = jwt.get_unverified_header(id_token)
-    kid = unverified_header.get("kid")
-
+async def _get_public_key(kid: str | None) -> Any:
     jwks = await get_jwks()
+    if kid is not None and kid in _public_keys:
+        return _public_keys[kid]
+
     key_dict = next((k for k in jwks["keys"] if k["kid"] == kid), None)
     if not key_dict:
         _invalidate_jwks_cache()
@@ -98,6 +103,13 @@ async def validate_cognito_id_token(id_token: str) -> dict[str, Any]:
             raise ValueError(msg)
 
     public_key = PyJWK(key_dict).key
+    _public_keys[key_dict["kid"]] = public_key
+    return public_key
+
+
+async def validate_cognito_id_token(id_token: str) -> dict[str, Any]:
+    unverified_header = jwt.get_unverified_header(id_token)
+    public_key = await _get_public_key(unverified_header.get("kid"))
 
     claims = jwt.decode(
         id_token,
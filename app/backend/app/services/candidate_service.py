@@ -1,4 +1,9 @@
-from sqlalchemy import func, or_, select
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, func, literal, or_, select, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -7,6 +12,7 @@ from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
 from app.models.enums import PipelineStage
 from app.models.position import Position
+from app.services import dashboard_service
 
 
 def _escape_like(value: str) -> str:
@@ -34,6 +40,52 @@ def validate_stage_transition(current_stage: str, new_stage: str) -> bool:
     return new_stage in get_valid_next_stages(current_stage)
 
 
+CANDIDATE_SORT_COLUMNS = {"full_name", "email", "updated_at"}
+
+
+def _encode_cursor(sort_column: str, value: Any, candidate_id: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort_column, value, candidate_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_column: str) -> tuple[Any, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        column, value, candidate_id = json.loads(base64.urlsafe_b64decode(padded))
+        if column != sort_column or not isinstance(candidate_id, int):
+            raise ValueError(column)
+        if sort_column == "updated_at":
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, str):
+            raise ValueError(value)
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid or stale pagination cursor") from e
+    return value, candidate_id
+
+
+async def _estimate_count(session: AsyncSession, stmt: Select[Any]) -> int | None:
+    """Planner row estimate for ``stmt`` (Postgres only).
+
+    The statement is EXPLAINed with its values passed as driver parameters,
+    so search text never becomes part of the SQL string.
+    """
+    bind = session.bind
+    if bind is None or bind.dialect.name != "postgresql":
+        return None
+    compiled = stmt.compile(dialect=bind.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", params
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 async def list_candidates(
     session: AsyncSession,
     offset: int = 0,
@@ -43,23 +95,23 @@ async def list_candidates(
     position_id: int | None = None,
     sort_by: str | None = None,
     sort_order: str | None = None,
-) -> tuple[list[dict], int]:
-    allowed_sort_columns = {"full_name", "email", "updated_at"}
-    sort_column = sort_by if sort_by in allowed_sort_columns else "updated_at"
+    cursor: str | None = None,
+    count_mode: str | None = None,
+) -> dict[str, Any]:
+    """Return one page of candidates.
+
+    Pages are ordered by (sort column, id). Passing the previous page's
+    ``next_cursor`` seeks past it instead of using ``offset``, so deep pages
+    cost the same as the first. ``count_mode="estimated"`` replaces the exact
+    count with the Postgres planner estimate. Without a ``count_mode``, cursor
+    pages get the estimate and the first page keeps the exact count, since
+    that is where the total is shown.
+    """
+    if count_mode is None:
+        count_mode = "estimated" if cursor else "exact"
+    sort_column = sort_by if sort_by in CANDIDATE_SORT_COLUMNS else "updated_at"
     order_direction = sort_order if sort_order in {"asc", "desc"} else "desc"
 
-    count_stmt = select(func.count(Candidate.id.distinct())).select_from(Candidate)
-    stmt = select(Candidate).distinct()
-
-    needs_join = stage is not None or position_id is not None
-    if needs_join:
-        count_stmt = count_stmt.join(
-            CandidatePosition, Candidate.id == CandidatePosition.candidate_id
-        )
-        stmt = stmt.join(
-            CandidatePosition, Candidate.id == CandidatePosition.candidate_id
-        )
-
     filters = [Candidate.is_archived.is_(False)]
 
     if search:
@@ -71,25 +123,58 @@ async def list_candidates(
             )
         )
 
-    if stage:
-        filters.append(CandidatePosition.stage == stage)
-
-    if position_id:
-        filters.append(CandidatePosition.position_id == position_id)
-
-    count_stmt = count_stmt.where(*filters)
-    count_result = await session.exec(count_stmt)
-    total_count = count_result.one()[0]
+    if stage or position_id:
+        position_filters = [CandidatePosition.candidate_id == Candidate.id]
+        if stage:
+            position_filters.append(CandidatePosition.stage == stage)
+        if position_id:
+            position_filters.append(CandidatePosition.position_id == position_id)
+        filters.append(select(CandidatePosition.id).where(*position_filters).exists())
+
+    total_count: int | None = None
+    total_is_estimate = False
+    if count_mode == "estimated":
+        total_count = await _estimate_count(
+            session, select(Candidate.id).where(*filters)
+        )
+        total_is_estimate = total_count is not None
+    if total_count is None:
+        count_stmt = select(func.count()).select_from(Candidate).where(*filters)
+        total_count = (await session.exec(count_stmt)).one()[0]
 
     sort_attr = getattr(Candidate, sort_column)
-    order_clause = sort_attr.asc() if order_direction == "asc" else sort_attr.desc()
-
-    stmt = stmt.where(*filters).order_by(order_clause).offset(offset).limit(limit)
-    result = await session.exec(stmt)
+    ascending = order_direction == "asc"
+    stmt = select(Candidate).where(*filters)
+    if cursor:
+        value, last_id = _decode_cursor(cursor, sort_column)
+        key = tuple_(sort_attr, Candidate.id)
+        boundary = tuple_(literal(value, sort_attr.type), literal(last_id))
+        stmt = stmt.where(key > boundary if ascending else key < boundary)
+    else:
+        stmt = stmt.offset(offset)
+
+    if ascending:
+        stmt = stmt.order_by(sort_attr.asc(), Candidate.id.asc())
+    else:
+        stmt = stmt.order_by(sort_attr.desc(), Candidate.id.desc())
+
+    result = await session.exec(stmt.limit(limit + 1))
     candidates = list(result.scalars().all())
 
+    next_cursor = None
+    if len(candidates) > limit:
+        candidates = candidates[:limit]
+        last = candidates[-1]
+        next_cursor = _encode_cursor(sort_column, getattr(last, sort_column), last.id)
+
+    page: dict[str, Any] = {
+        "items": [],
+        "total": total_count,
+        "next_cursor": next_cursor,
+        "total_is_estimate": total_is_estimate,
+    }
     if not candidates:
-        return [], total_count
+        return page
 
     candidate_ids = [c.id for c in candidates]
 
@@ -127,7 +212,8 @@ async def list_candidates(
         for candidate in candidates
     ]
 
-    return items, total_count
+    page["items"] = items
+    return page
 
 
 async def create_candidate(
@@ -149,6 +235,7 @@ async def create_candidate(
     session.add(candidate)
 
     try:
+        await dashboard_service.record_candidate(session, 1)
         await session.commit()
         await session.refresh(candidate)
     except IntegrityError as e:
@@ -227,6 +314,7 @@ async def update_candidate(
         candidate.email = email
 
     session.add(candidate)
+    await dashboard_service.record_change(session)
     await session.commit()
     await session.refresh(candidate)
     return candidate
@@ -263,6 +351,9 @@ async def add_to_position(
     session.add(candidate_position)
 
     try:
+        await dashboard_service.record_candidate_position(
+            session, position_id, PipelineStage.new, 1
+        )
         await session.commit()
         await session.refresh(candidate_position)
     except IntegrityError as e:
@@ -290,6 +381,9 @@ async def remove_from_position(
         raise NotFoundException("Association not found")
 
     await session.delete(candidate_position)
+    await dashboard_service.record_candidate_position(
+        session, position_id, candidate_position.stage, -1
+    )
     await session.commit()
 
 
@@ -318,8 +412,10 @@ async def update_stage(
             f"Invalid stage transition from {candidate_position.stage} to {new_stage}"
         )
 
+    old_stage = candidate_position.stage
     candidate_position.stage = new_stage
     session.add(candidate_position)
+    await dashboard_service.record_stage_change(session, old_stage, new_stage)
     await session.commit()
     await session.refresh(candidate_position)
 
@@ -340,6 +436,7 @@ async def archive_candidate(session: AsyncSession, candidate_id: int) -> Candida
         raise NotFoundException("Candidate not found")
     candidate.is_archived = True
     session.add(candidate)
+    await dashboard_service.record_candidate(session, -1)
     await session.commit()
     await session.refresh(candidate)
     return candidate
@@ -1,8 +1,15 @@
-from sqlalchemy import func, select
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import String, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
+from app.models.dashboard_counter import DashboardCounter
+from app.models.enums import PipelineStage, PositionStatus
 from app.models.position import Position
 from app.models.team import Team
 from app.schemas.dashboard import (
@@ -12,36 +19,207 @@ from app.schemas.dashboard import (
     RecentCandidate,
 )
 
+CANDIDATES = "candidates"
+POSITIONS = "positions"
+OPEN_POSITIONS = "open_positions"
+STAGE = "stage"
+POSITION_CANDIDATES = "position_candidates"
+# Bumped by every write that changes what the dashboard shows.
+VERSION = "version"
 
-async def get_dashboard_stats(session: AsyncSession) -> DashboardStats:
-    pipeline_stmt = select(CandidatePosition.stage, func.count()).group_by(
-        CandidatePosition.stage
+_STAGE_ORDER = {stage.value: index for index, stage in enumerate(PipelineStage)}
+
+# Stats this process built last, with the counter version they were built at.
+_cached: tuple[int, DashboardStats] | None = None
+
+
+def invalidate_cache() -> None:
+    """Drop this process's stats so the next read rebuilds them."""
+    global _cached
+    _cached = None
+
+
+def _upsert(session: AsyncSession) -> Any:
+    bind = session.bind
+    if bind is not None and bind.dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
+
+
+async def _apply(session: AsyncSession, deltas: dict[tuple[str, str], int]) -> None:
+    """Add ``deltas`` to their counters and bump the version, in one upsert.
+
+    Runs in the caller's transaction, so the counters commit or roll back
+    with the write they describe. Rows go in key order so two writers lock
+    shared counters in the same order.
+    """
+    rows = {**deltas, (VERSION, ""): 1}
+    statement = _upsert(session)(DashboardCounter).values(
+        [
+            {"metric": metric, "key": key, "value": value}
+            for (metric, key), value in sorted(rows.items())
+        ]
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["metric", "key"],
+            set_={
+                "value": DashboardCounter.value + statement.excluded.value,
+                "updated_at": func.now(),
+            },
+        )
     )
-    pipeline_result = await session.execute(pipeline_stmt)
-    pipeline_counts = [
-        PipelineCount(stage=row[0], count=row[1]) for row in pipeline_result.all()
-    ]
 
-    total_candidates_result = await session.execute(
-        select(func.count())
-        .select_from(Candidate)
-        .where(Candidate.is_archived.is_(False))
+
+async def record_candidate(session: AsyncSession, delta: int) -> None:
+    """Count a candidate created (``+1``) or archived (``-1``)."""
+    await _apply(session, {(CANDIDATES, ""): delta})
+
+
+async def record_candidate_position(
+    session: AsyncSession, position_id: int, stage: str, delta: int
+) -> None:
+    """Count a candidate added to (``+1``) or removed from (``-1``) a position."""
+    await _apply(
+        session,
+        {(STAGE, stage): delta, (POSITION_CANDIDATES, str(position_id)): delta},
     )
-    total_candidates = total_candidates_result.scalar_one()
 
-    total_positions_result = await session.execute(
-        select(func.count())
-        .select_from(Position)
-        .where(Position.is_archived.is_(False))
+
+async def record_stage_change(
+    session: AsyncSession, old_stage: str, new_stage: str
+) -> None:
+    """Move one candidate from ``old_stage`` to ``new_stage``."""
+    deltas: dict[tuple[str, str], int] = {}
+    if old_stage != new_stage:
+        deltas = {(STAGE, old_stage): -1, (STAGE, new_stage): 1}
+    await _apply(session, deltas)
+
+
+async def record_position(session: AsyncSession, delta: int, is_open: bool) -> None:
+    """Count a position created (``+1``) or archived (``-1``)."""
+    deltas = {(POSITIONS, ""): delta}
+    if is_open:
+        deltas[(OPEN_POSITIONS, "")] = delta
+    await _apply(session, deltas)
+
+
+async def record_position_update(
+    session: AsyncSession, was_open: bool, is_open: bool
+) -> None:
+    """Follow a position edit, moving it in or out of the open count."""
+    deltas: dict[tuple[str, str], int] = {}
+    if was_open != is_open:
+        deltas[(OPEN_POSITIONS, "")] = 1 if is_open else -1
+    await _apply(session, deltas)
+
+
+async def record_change(session: AsyncSession) -> None:
+    """Note an edit that changes no count but may change a name shown."""
+    await _apply(session, {})
+
+
+async def rebuild_counters(session: AsyncSession) -> None:
+    """Recount every counter from the tables, for seeding and repair.
+
+    Commits. Bumps the version so every process drops the stats it holds.
+    """
+    await session.execute(
+        delete(DashboardCounter).where(DashboardCounter.metric != VERSION)
+    )
+    totals = (
+        await session.execute(
+            select(
+                select(func.count())
+                .select_from(Candidate)
+                .where(Candidate.is_archived.is_(False))
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(Position)
+                .where(Position.is_archived.is_(False))
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(Position)
+                .where(
+                    Position.is_archived.is_(False),
+                    Position.status == PositionStatus.open,
+                )
+                .scalar_subquery(),
+            )
+        )
+    ).one()
+    deltas = {
+        (CANDIDATES, ""): totals[0],
+        (POSITIONS, ""): totals[1],
+        (OPEN_POSITIONS, ""): totals[2],
+    }
+    stages = await session.execute(
+        select(CandidatePosition.stage, func.count()).group_by(CandidatePosition.stage)
     )
-    total_positions = total_positions_result.scalar_one()
+    deltas.update({(STAGE, stage): count for stage, count in stages.all()})
+    positions = await session.execute(
+        select(CandidatePosition.position_id, func.count()).group_by(
+            CandidatePosition.position_id
+        )
+    )
+    deltas.update(
+        {
+            (POSITION_CANDIDATES, str(position_id)): count
+            for position_id, count in positions.all()
+        }
+    )
+    await _apply(session, deltas)
+    await session.commit()
 
-    open_positions_result = await session.execute(
-        select(func.count())
-        .select_from(Position)
-        .where(Position.is_archived.is_(False), Position.status == "open")
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _with_age(stats: DashboardStats) -> DashboardStats:
+    if stats.snapshot_refreshed_at is None:
+        return stats
+    age = (_utcnow() - stats.snapshot_refreshed_at).total_seconds()
+    return stats.model_copy(update={"snapshot_age_seconds": max(age, 0.0)})
+
+
+async def get_dashboard_stats(session: AsyncSession) -> DashboardStats:
+    """Serve dashboard stats from the counters the writes keep current.
+
+    Every read checks the shared counter version with one primary-key
+    lookup. While it matches the version this process built its stats at,
+    those stats are served as they are; otherwise they are rebuilt from the
+    counters, so no worker serves stats older than the last committed write.
+    """
+    global _cached
+    version_result = await session.execute(
+        select(DashboardCounter.value, DashboardCounter.updated_at).where(
+            DashboardCounter.metric == VERSION, DashboardCounter.key == ""
+        )
     )
-    open_positions = open_positions_result.scalar_one()
+    version_row = version_result.one_or_none()
+    version, refreshed_at = version_row if version_row is not None else (0, None)
+
+    if _cached is None or _cached[0] != version:
+        stats = await _build_stats(session)
+        stats.snapshot_refreshed_at = refreshed_at
+        _cached = (version, stats)
+    return _with_age(_cached[1])
+
+
+async def _build_stats(session: AsyncSession) -> DashboardStats:
+    counters_result = await session.execute(
+        select(DashboardCounter.metric, DashboardCounter.key, DashboardCounter.value)
+    )
+    counters: dict[tuple[str, str], int] = {
+        (metric, key): value for metric, key, value in counters_result.all()
+    }
+    pipeline_counts = [
+        PipelineCount(stage=key, count=value)
+        for (metric, key), value in counters.items()
+        if metric == STAGE and value
+    ]
+    pipeline_counts.sort(key=lambda row: _STAGE_ORDER.get(row.stage, len(_STAGE_ORDER)))
 
     recent_stmt = (
         select(
@@ -74,20 +252,24 @@ async def get_dashboard_stats(session: AsyncSession) -> DashboardStats:
         for row in recent_result.all()
     ]
 
+    candidate_count = func.coalesce(DashboardCounter.value, 0)
     positions_stmt = (
         select(
             Position.id,
             Position.title,
             Position.status,
-            func.count(CandidatePosition.id).label("candidate_count"),
+            candidate_count.label("candidate_count"),
             Team.name.label("team_name"),
         )
         .select_from(Position)
         .join(Team, Team.id == Position.team_id)
-        .outerjoin(CandidatePosition, CandidatePosition.position_id == Position.id)
+        .outerjoin(
+            DashboardCounter,
+            (DashboardCounter.metric == POSITION_CANDIDATES)
+            & (DashboardCounter.key == cast(Position.id, String)),
+        )
         .where(Position.is_archived.is_(False))
-        .group_by(Position.id, Position.title, Position.status, Team.name)
-        .order_by(func.count(CandidatePosition.id).desc())
+        .order_by(candidate_count.desc())
         .limit(5)
     )
     positions_result = await session.execute(positions_stmt)
@@ -104,9 +286,9 @@ async def get_dashboard_stats(session: AsyncSession) -> DashboardStats:
 
     return DashboardStats(
         pipeline_counts=pipeline_counts,
-        total_candidates=total_candidates,
-        total_positions=total_positions,
-        open_positions=open_positions,
+        total_candidates=counters.get((CANDIDATES, ""), 0),
+        total_positions=counters.get((POSITIONS, ""), 0),
+        open_positions=counters.get((OPEN_POSITIONS, ""), 0),
         recent_candidates=recent_candidates,
         positions_summary=positions_summary,
     )
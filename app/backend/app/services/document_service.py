@@ -1,10 +1,11 @@
 import logging
 import re
 from datetime import date
+from typing import Any
 from uuid import uuid4
 
+from sqlalchemy import Select, or_, select
 from sqlalchemy.orm import aliased
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.exceptions import ConflictError, ForbiddenError, NotFoundException
@@ -94,31 +95,92 @@ async def _maybe_trigger_evaluation(session: AsyncSession, document: Document) -
     )
 
 
+def _candidate_access_clause(candidate_id: Any, user_id: int) -> Any:
+    """Whether ``user_id`` may see documents of candidate ``candidate_id``.
+
+    True when the user uploaded a document for any of the candidate's
+    positions or is the hiring manager of one of them. ``candidate_id`` may be
+    a column of an enclosing query, in which case the check is correlated.
+    """
+    AccessPosition = aliased(CandidatePosition)
+    UploadedDocument = aliased(Document)
+
+    uploaded = (
+        select(UploadedDocument.id)
+        .join(
+            AccessPosition, UploadedDocument.candidate_position_id == AccessPosition.id
+        )
+        .where(AccessPosition.candidate_id == candidate_id)
+        .where(UploadedDocument.uploaded_by_id == user_id)
+        .exists()
+    )
+    hiring_manager = (
+        select(Position.id)
+        .join(AccessPosition, AccessPosition.position_id == Position.id)
+        .where(AccessPosition.candidate_id == candidate_id)
+        .where(Position.hiring_manager_id == user_id)
+        .exists()
+    )
+    return or_(uploaded, hiring_manager)
+
+
 async def _user_can_access_candidate_documents(
     session: AsyncSession,
     candidate_id: int,
     user_id: int,
 ) -> bool:
-    uploaded_query = (
-        select(Document.id)
-        .join(CandidatePosition, Document.candidate_position_id == CandidatePosition.id)
-        .where(CandidatePosition.candidate_id == candidate_id)
-        .where(Document.uploaded_by_id == user_id)
-        .limit(1)
+    result = await session.execute(
+        select(_candidate_access_clause(candidate_id, user_id))
     )
-    uploaded_result = await session.exec(uploaded_query)
-    if uploaded_result.first() is not None:
-        return True
+    return bool(result.scalar())
 
-    hiring_manager_query = (
-        select(Position.id)
-        .join(CandidatePosition, CandidatePosition.position_id == Position.id)
-        .where(CandidatePosition.candidate_id == candidate_id)
-        .where(Position.hiring_manager_id == user_id)
-        .limit(1)
+
+def _documents_query(*columns: Any) -> Select:
+    """Documents with their interviewer's and uploader's names.
+
+    Rows are ``(Document, interviewer_name, uploaded_by_name, *columns)``.
+    ``CandidatePosition`` is joined so callers can filter or correlate on it.
+    """
+    InterviewerUser = aliased(User)
+    UploadedByUser = aliased(User)
+
+    return (
+        select(
+            Document,
+            InterviewerUser.full_name,
+            UploadedByUser.full_name,
+            *columns,
+        )
+        .join(CandidatePosition, Document.candidate_position_id == CandidatePosition.id)
+        .outerjoin(InterviewerUser, Document.interviewer_id == InterviewerUser.id)
+        .outerjoin(UploadedByUser, Document.uploaded_by_id == UploadedByUser.id)
     )
-    hm_result = await session.exec(hiring_manager_query)
-    return hm_result.first() is not None
+
+
+def _document_response(
+    document: Document,
+    interviewer_name: str | None,
+    uploaded_by_name: str | None,
+) -> dict:
+    return {
+        "id": document.id,
+        "type": document.type,
+        "candidate_position_id": document.candidate_position_id,
+        "file_name": document.file_name,
+        "file_size": document.file_size,
+        "content_type": document.content_type,
+        "status": document.status,
+        "interview_stage": document.interview_stage,
+        "interviewer_id": document.interviewer_id,
+        "interviewer_name": interviewer_name,
+        "interview_date": document.interview_date,
+        "notes": document.notes,
+        "input_method": document.input_method,
+        "uploaded_by_id": document.uploaded_by_id,
+        "uploaded_by_name": uploaded_by_name,
+        "created_at": document.created_at,
+        "updated_at": document.updated_at,
+    }
 
 
 def _sanitize_file_name(file_name: str) -> str:
@@ -189,10 +251,12 @@ async def complete_upload(
     session: AsyncSession,
     document_id: int,
     user_id: int,
-) -> Document:
-    document = await session.get(Document, document_id)
-    if document is None:
+) -> dict:
+    result = await session.execute(_documents_query().where(Document.id == document_id))
+    row = result.first()
+    if row is None:
         raise NotFoundException(f"Document {document_id} not found")
+    document, interviewer_name, uploaded_by_name = row
 
     if document.uploaded_by_id != user_id:
         raise ForbiddenError("Document not owned by current user")
@@ -215,6 +279,7 @@ async def complete_upload(
     session.add(document)
     await session.commit()
     await session.refresh(document)
+    response = _document_response(document, interviewer_name, uploaded_by_name)
 
     try:
         await _maybe_trigger_evaluation(session, document)
@@ -224,7 +289,7 @@ async def complete_upload(
             document.id,
         )
 
-    return document
+    return response
 
 
 async def create_pasted_transcript(
@@ -286,34 +351,12 @@ async def enrich_document_response(
     session: AsyncSession,
     document: Document,
 ) -> dict:
-    interviewer_name = None
-    if document.interviewer_id is not None:
-        interviewer = await session.get(User, document.interviewer_id)
-        if interviewer is not None:
-            interviewer_name = interviewer.full_name
-
-    uploaded_by = await session.get(User, document.uploaded_by_id)
-    uploaded_by_name = uploaded_by.full_name if uploaded_by is not None else None
-
-    return {
-        "id": document.id,
-        "type": document.type,
-        "candidate_position_id": document.candidate_position_id,
-        "file_name": document.file_name,
-        "file_size": document.file_size,
-        "content_type": document.content_type,
-        "status": document.status,
-        "interview_stage": document.interview_stage,
-        "interviewer_id": document.interviewer_id,
-        "interviewer_name": interviewer_name,
-        "interview_date": document.interview_date,
-        "notes": document.notes,
-        "input_method": document.input_method,
-        "uploaded_by_id": document.uploaded_by_id,
-        "uploaded_by_name": uploaded_by_name,
-        "created_at": document.created_at,
-        "updated_at": document.updated_at,
-    }
+    result = await session.execute(_documents_query().where(Document.id == document.id))
+    row = result.first()
+    if row is None:
+        return _document_response(document, None, None)
+    _, interviewer_name, uploaded_by_name = row
+    return _document_response(document, interviewer_name, uploaded_by_name)
 
 
 async def get_document(
@@ -321,31 +364,25 @@ async def get_document(
     document_id: int,
     user_id: int,
 ) -> dict:
-    document = await session.get(Document, document_id)
-    if document is None:
-        raise NotFoundException(f"Document {document_id} not found")
-
-    candidate_position = await session.get(
-        CandidatePosition, document.candidate_position_id
+    result = await session.execute(
+        _documents_query(
+            _candidate_access_clause(CandidatePosition.candidate_id, user_id)
+        ).where(Document.id == document_id)
     )
-    if candidate_position is None:
-        raise NotFoundException(
-            f"Document {document_id} references missing candidate position"
-        )
-    if not await _user_can_access_candidate_documents(
-        session, candidate_position.candidate_id, user_id
-    ):
+    row = result.first()
+    if row is None:
+        raise NotFoundException(f"Document {document_id} not found")
+    document, interviewer_name, uploaded_by_name, can_access = row
+    if not can_access:
         raise ForbiddenError("Not authorized to view this document")
 
-    result = await enrich_document_response(session, document)
-
-    view_url = await storage_service.generate_view_url(
+    response = _document_response(document, interviewer_name, uploaded_by_name)
+    response["view_url"] = await storage_service.generate_view_url(
         s3_key=document.s3_key,
         expiration=3600,
     )
-    result["view_url"] = view_url
 
-    return result
+    return response
 
 
 async def list_candidate_documents(
@@ -359,14 +396,8 @@ async def list_candidate_documents(
     if not await _user_can_access_candidate_documents(session, candidate_id, user_id):
         raise ForbiddenError("Not authorized to view documents for this candidate")
 
-    InterviewerUser = aliased(User)
-    UploadedByUser = aliased(User)
-
     query = (
-        select(Document, InterviewerUser, UploadedByUser)
-        .join(CandidatePosition, Document.candidate_position_id == CandidatePosition.id)
-        .outerjoin(InterviewerUser, Document.interviewer_id == InterviewerUser.id)
-        .outerjoin(UploadedByUser, Document.uploaded_by_id == UploadedByUser.id)
+        _documents_query()
         .where(CandidatePosition.candidate_id == candidate_id)
         .where(Document.status == DocumentStatus.active)
     )
@@ -383,33 +414,7 @@ async def list_candidate_documents(
     query = query.order_by(Document.created_at.desc())
 
     result = await session.execute(query)
-    rows = result.all()
-
-    documents = []
-    for document, interviewer, uploaded_by in rows:
-        interviewer_name = interviewer.full_name if interviewer is not None else None
-        uploaded_by_name = uploaded_by.full_name if uploaded_by is not None else None
-
-        documents.append(
-            {
-                "id": document.id,
-                "type": document.type,
-                "candidate_position_id": document.candidate_position_id,
-                "file_name": document.file_name,
-                "file_size": document.file_size,
-                "content_type": document.content_type,
-                "status": document.status,
-                "interview_stage": document.interview_stage,
-                "interviewer_id": document.interviewer_id,
-                "interviewer_name": interviewer_name,
-                "interview_date": document.interview_date,
-                "notes": document.notes,
-                "input_method": document.input_method,
-                "uploaded_by_id": document.uploaded_by_id,
-                "uploaded_by_name": uploaded_by_name,
-                "created_at": document.created_at,
-                "updated_at": document.updated_at,
-            }
-        )
-
-    return documents
+    return [
+        _document_response(document, interviewer_name, uploaded_by_name)
+        for document, interviewer_name, uploaded_by_name in result.all()
+    ]
@@ -0,0 +1,248 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+
+import asyncpg
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import make_url
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.models.evaluation import Evaluation
+
+logger = logging.getLogger(__name__)
+
+EVALUATION_STATUS_CHANNEL = "evaluation_status"
+RESYNC_EVENT: dict[str, Any] = {"type": "resync"}
+
+_QUEUE_MAX_SIZE = 100
+_RECONNECT_INITIAL_DELAY_SECONDS = 1.0
+_RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+
+def _supports_notify(session: AsyncSession) -> bool:
+    bind = session.bind
+    return bind is not None and bind.dialect.name == "postgresql"
+
+
+def _status_payload(evaluation: Evaluation) -> str:
+    return json.dumps(
+        {
+            "evaluation_id": evaluation.id,
+            "candidate_position_id": evaluation.candidate_position_id,
+            "step_type": evaluation.step_type,
+            "status": evaluation.status,
+            "version": evaluation.version,
+        }
+    )
+
+
+async def notify_status_change(session: AsyncSession, evaluation: Evaluation) -> None:
+    """Queue a NOTIFY for the evaluation's current status.
+
+    Postgres delivers the notification when the surrounding transaction
+    commits, so call this before ``session.commit()``. No-op on other dialects.
+    """
+    if evaluation.id is None or not _supports_notify(session):
+        return
+
+    payload = _status_payload(evaluation)
+    await session.execute(select(func.pg_notify(EVALUATION_STATUS_CHANNEL, payload)))
+
+
+async def notify_status_changes(
+    session: AsyncSession, evaluations: list[Evaluation]
+) -> None:
+    """Like :func:`notify_status_change` for many evaluations in one statement."""
+    if not evaluations or not _supports_notify(session):
+        return
+
+    payloads = [
+        _status_payload(evaluation)
+        for evaluation in evaluations
+        if evaluation.id is not None
+    ]
+    await session.execute(
+        text(
+            "SELECT pg_notify(:channel, payload) "
+            "FROM unnest(CAST(:payloads AS text[])) AS payload"
+        ),
+        {"channel": EVALUATION_STATUS_CHANNEL, "payloads": payloads},
+    )
+
+
+class EvaluationStatusListener:
+    """Single LISTEN connection per process, fanned out to in-memory queues.
+
+    Subscribers are keyed by candidate_position_id. After a reconnect every
+    subscriber receives ``RESYNC_EVENT`` because notifications sent while the
+    connection was down are lost. Observers see every event regardless of
+    candidate position, and ``RESYNC_EVENT`` after every connect, including
+    the first, since nothing listened before it either.
+    """
+
+    def __init__(self, dsn: str) -> None:
+        self._dsn = dsn
+        self._subscribers: dict[int, set[asyncio.Queue[dict[str, Any]]]] = defaultdict(
+            set
+        )
+        self._observers: list[Callable[[dict[str, Any]], None]] = []
+        self._connection: Any = None
+        self._connected = asyncio.Event()
+        self._disconnected = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected.is_set()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._close_connection()
+
+    @asynccontextmanager
+    async def subscribe(
+        self, candidate_position_id: int
+    ) -> AsyncIterator[asyncio.Queue[dict[str, Any]]]:
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_QUEUE_MAX_SIZE)
+        self._subscribers[candidate_position_id].add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(candidate_position_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[candidate_position_id]
+
+    def observe(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        self._observers.append(callback)
+
+    def dispatch(self, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+            candidate_position_id = int(event["candidate_position_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed evaluation notification: %r", payload)
+            return
+
+        for queue in self._subscribers.get(candidate_position_id, ()):
+            _put_or_resync(queue, event)
+        self._notify_observers(event)
+
+    def _notify_observers(self, event: dict[str, Any]) -> None:
+        for observer in self._observers:
+            try:
+                observer(event)
+            except Exception:
+                logger.exception("Evaluation status observer failed")
+
+    def _broadcast_resync(self) -> None:
+        for queues in self._subscribers.values():
+            for queue in queues:
+                _put_or_resync(queue, RESYNC_EVENT)
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        self.dispatch(payload)
+
+    def _on_termination(self, connection: Any) -> None:
+        self._connected.clear()
+        self._disconnected.set()
+
+    async def _close_connection(self) -> None:
+        self._connected.clear()
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+
+    async def _run(self) -> None:
+        delay = _RECONNECT_INITIAL_DELAY_SECONDS
+        first_connect = True
+        while True:
+            self._disconnected.clear()
+            try:
+                self._connection = await asyncpg.connect(self._dsn)
+                self._connection.add_termination_listener(self._on_termination)
+                await self._connection.add_listener(
+                    EVALUATION_STATUS_CHANNEL, self._on_notification
+                )
+                self._connected.set()
+                delay = _RECONNECT_INITIAL_DELAY_SECONDS
+                if not first_connect:
+                    self._broadcast_resync()
+                self._notify_observers(RESYNC_EVENT)
+                first_connect = False
+                logger.info("Listening on %s", EVALUATION_STATUS_CHANNEL)
+
+                await self._disconnected.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "Evaluation status listener connection failed", exc_info=True
+                )
+
+            await self._close_connection()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_DELAY_SECONDS)
+
+
+def _put_or_resync(queue: asyncio.Queue[dict[str, Any]], event: dict[str, Any]) -> None:
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC_EVENT)
+
+
+_listener: EvaluationStatusListener | None = None
+
+
+def get_listener() -> EvaluationStatusListener | None:
+    """Return the process-wide listener if it is currently connected."""
+    if _listener is not None and _listener.is_connected:
+        return _listener
+    return None
+
+
+def observe(callback: Callable[[dict[str, Any]], None]) -> bool:
+    """Register ``callback`` for every status event this process receives.
+
+    Returns ``False`` when no listener runs, e.g. on non-Postgres databases.
+    """
+    if _listener is None:
+        return False
+    _listener.observe(callback)
+    return True
+
+
+async def start_listener() -> None:
+    global _listener
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "postgresql" or _listener is not None:
+        return
+    dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+    _listener = EvaluationStatusListener(dsn)
+    await _listener.start()
+
+
+async def stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        await _listener.stop()
+        _listener = None
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from collections.abc import Coroutine
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.database import async_session_factory
+from app.models.enums import EvaluationStatus
+from app.services import evaluation_notify_service, evaluation_service
+
+logger = logging.getLogger(__name__)
+
+_UPSTREAM_STEP_TYPES = frozenset(
+    dependency
+    for dependencies in evaluation_service.STEP_DEPENDENCIES.values()
+    for dependency in dependencies
+)
+
+
+class DependencyScheduler:
+    """Queues dependent steps when the evaluations they read from complete.
+
+    Completions arrive as status notifications. Each candidate position gets
+    a trailing debounce, so a burst of completions costs one check. The check
+    itself is serialized in the database by
+    :func:`evaluation_service.trigger_dependent_evaluations`, which keeps
+    schedulers in other processes from queueing the same run.
+
+    Notifications sent while no listener was connected (a deploy, restart or
+    reconnect) are lost, so each resync event starts a :meth:`reconcile`
+    sweep instead. The sweep looks back ``evaluation_reconcile_window_hours``,
+    which should outlast any gap between listeners.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        debounce_seconds: float | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._debounce_seconds = (
+            settings.evaluation_dependency_debounce_seconds
+            if debounce_seconds is None
+            else debounce_seconds
+        )
+        self._timers: dict[int, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def on_status_change(self, event: dict[str, Any]) -> None:
+        if event is evaluation_notify_service.RESYNC_EVENT:
+            self._spawn(self.reconcile())
+            return
+        if (
+            event.get("status") != EvaluationStatus.completed
+            or event.get("step_type") not in _UPSTREAM_STEP_TYPES
+        ):
+            return
+
+        candidate_position_id = int(event["candidate_position_id"])
+        timer = self._timers.pop(candidate_position_id, None)
+        if timer is not None:
+            timer.cancel()
+        self._timers[candidate_position_id] = asyncio.get_running_loop().call_later(
+            self._debounce_seconds, self._fire, candidate_position_id
+        )
+
+    def _fire(self, candidate_position_id: int) -> None:
+        self._timers.pop(candidate_position_id, None)
+        self._spawn(self.schedule(candidate_position_id))
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def reconcile(self) -> None:
+        """Check candidate positions with recent upstream results not acted on."""
+        completed_since = datetime.now(UTC).replace(tzinfo=None) - timedelta(
+            hours=settings.evaluation_reconcile_window_hours
+        )
+        try:
+            async with self._session_factory() as session:
+                candidate_position_ids = await (
+                    evaluation_service.candidate_positions_to_reconcile(
+                        session, completed_since
+                    )
+                )
+        except Exception:
+            logger.exception("Failed to find candidate positions to reconcile")
+            return
+
+        if candidate_position_ids:
+            logger.info(
+                "Reconciling dependent evaluations for %d candidate positions",
+                len(candidate_position_ids),
+            )
+        for candidate_position_id in candidate_position_ids:
+            await self.schedule(candidate_position_id)
+
+    async def schedule(self, candidate_position_id: int) -> None:
+        try:
+            async with self._session_factory() as session:
+                await evaluation_service.trigger_dependent_evaluations(
+                    session, candidate_position_id
+                )
+        except Exception:
+            logger.exception(
+                "Failed to schedule dependent evaluations for candidate_position %s",
+                candidate_position_id,
+            )
+
+    async def stop(self) -> None:
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        # Let checks already running commit or roll back.
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+_scheduler: DependencyScheduler | None = None
+
+
+async def start_scheduler() -> None:
+    """Attach a scheduler to this process's status listener.
+
+    Call after :func:`evaluation_notify_service.start_listener`. The
+    listener's first connect starts the sweep that catches up on completions
+    from before this process started. Without a listener (non-Postgres
+    databases) nothing is scheduled automatically.
+    """
+    global _scheduler
+    if _scheduler is not None:
+        return
+    scheduler = DependencyScheduler()
+    if evaluation_notify_service.observe(scheduler.on_status_change):
+        _scheduler = scheduler
+        if evaluation_notify_service.get_listener() is not None:
+            # Already connected, so the connect resync has been sent.
+            scheduler.on_status_change(evaluation_notify_service.RESYNC_EVENT)
+
+
+async def stop_scheduler() -> None:
+    global _scheduler
+    scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        await scheduler.stop()
@@ -1,21 +1,139 @@
 import logging
-
-from sqlalchemy import func, select
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, case, func, insert, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.exceptions import NotFoundException
 from app.models.candidate_position import CandidatePosition
-from app.models.enums import EvaluationStatus, EvaluationStepType
+from app.models.document import Document
+from app.models.enums import (
+    DocumentStatus,
+    DocumentType,
+    EvaluationStatus,
+    EvaluationStepType,
+    InterviewStage,
+)
 from app.models.evaluation import Evaluation
-from app.services import eventbridge_service
+from app.models.evaluation_version_counter import EvaluationVersionCounter
+from app.models.position import Position
+from app.models.position_rubric import PositionRubric, PositionRubricVersion
+from app.services import evaluation_notify_service, eventbridge_service
 
 logger = logging.getLogger(__name__)
 
+# Result keys kept by the summary view, matching what the candidate page's
+# step summaries read. Reasoning, thinking and evidence text are left out.
+SUMMARY_RESULT_FIELDS: dict[str, tuple[str, ...]] = {
+    EvaluationStepType.cv_analysis: ("skills_match", "overall_fit"),
+    EvaluationStepType.screening_eval: ("key_topics", "strengths"),
+    EvaluationStepType.technical_eval: ("weighted_total", "strengths_summary"),
+    EvaluationStepType.recommendation: ("recommendation", "confidence", "reasoning"),
+    EvaluationStepType.feedback_gen: ("rejection_stage",),
+}
+
+# Steps queued automatically once the steps they read from have settled.
+STEP_DEPENDENCIES: dict[EvaluationStepType, tuple[EvaluationStepType, ...]] = {
+    EvaluationStepType.recommendation: (
+        EvaluationStepType.cv_analysis,
+        EvaluationStepType.screening_eval,
+        EvaluationStepType.technical_eval,
+    ),
+}
+
+
+def access_clause(
+    candidate_position_id: int | ColumnElement[int], user_id: int
+) -> ColumnElement[bool]:
+    """EXISTS check that ``user_id`` may see the candidate position's evaluations.
+
+    The user must be the position's hiring manager or have uploaded a
+    document to the candidate position. Add it to the WHERE clause of an
+    evaluation query to authorize in the same round trip. Pass a column as
+    ``candidate_position_id`` to check each row of the enclosing query.
+    """
+    AccessPosition = aliased(CandidatePosition)
+    UploadedDocument = aliased(Document)
+
+    uploaded = (
+        select(UploadedDocument.id)
+        .where(UploadedDocument.candidate_position_id == AccessPosition.id)
+        .where(UploadedDocument.uploaded_by_id == user_id)
+        .exists()
+    )
+    return (
+        select(AccessPosition.id)
+        .join(Position, AccessPosition.position_id == Position.id)
+        .where(AccessPosition.id == candidate_position_id)
+        .where(or_(Position.hiring_manager_id == user_id, uploaded))
+        .exists()
+    )
+
+
+async def _fetch_evaluations(
+    session: AsyncSession,
+    query: Select[tuple[Evaluation]],
+    result_fields: Sequence[str] | None,
+    summary: bool,
+) -> list[Evaluation]:
+    """Run an evaluation query, optionally fetching only some ``result`` keys.
+
+    With ``result_fields`` or ``summary`` the keys are extracted by the
+    database, so full results never leave it. The projected evaluations are
+    detached copies for read-only use.
+    """
+    if result_fields is None and not summary:
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    if summary:
+        keys = sorted({key for keys in SUMMARY_RESULT_FIELDS.values() for key in keys})
+    else:
+        keys = sorted(set(result_fields or ()))
+    table = Evaluation.__table__
+    columns = [column for column in table.c if column.key != "result"]
+    projected = query.with_only_columns(
+        *columns,
+        *(table.c.result[key].label(f"result_{i}") for i, key in enumerate(keys)),
+    )
+
+    rows = (await session.execute(projected)).mappings().all()
+    evaluations = []
+    for row in rows:
+        wanted = SUMMARY_RESULT_FIELDS.get(row["step_type"], ()) if summary else keys
+        values = {
+            key: row[f"result_{i}"]
+            for i, key in enumerate(keys)
+            if key in wanted and row[f"result_{i}"] is not None
+        }
+        evaluations.append(
+            Evaluation.model_validate(
+                {
+                    **{column.key: row[column.key] for column in columns},
+                    "result": values or None,
+                }
+            )
+        )
+    return evaluations
+
 
 async def get_evaluations(
     session: AsyncSession,
     candidate_position_id: int,
+    user_id: int | None = None,
+    result_fields: Sequence[str] | None = None,
+    summary: bool = False,
 ) -> list[Evaluation]:
+    """Latest version of each step. With ``user_id`` access is checked too.
+
+    ``result_fields`` limits ``result`` to the listed keys; ``summary`` keeps
+    only each step's :data:`SUMMARY_RESULT_FIELDS`.
+    """
     max_version_subq = (
         select(
             Evaluation.step_type,
@@ -36,15 +154,20 @@ async def get_evaluations(
         .where(Evaluation.candidate_position_id == candidate_position_id)
         .order_by(Evaluation.step_type)
     )
+    if user_id is not None:
+        query = query.where(access_clause(candidate_position_id, user_id))
 
-    result = await session.execute(query)
-    return list(result.scalars().all())
+    evaluations = await _fetch_evaluations(session, query, result_fields, summary)
+    if not evaluations and user_id is not None:
+        await verify_access(session, candidate_position_id, user_id)
+    return evaluations
 
 
 async def get_evaluation_by_step(
     session: AsyncSession,
     candidate_position_id: int,
     step_type: str,
+    user_id: int | None = None,
 ) -> Evaluation:
     query = (
         select(Evaluation)
@@ -53,11 +176,15 @@ async def get_evaluation_by_step(
         .order_by(Evaluation.version.desc())
         .limit(1)
     )
+    if user_id is not None:
+        query = query.where(access_clause(candidate_position_id, user_id))
 
     result = await session.execute(query)
     evaluation = result.scalar_one_or_none()
 
     if evaluation is None:
+        if user_id is not None:
+            await verify_access(session, candidate_position_id, user_id)
         raise NotFoundException(
             f"No evaluation found for step '{step_type}' "
             f"on candidate position {candidate_position_id}"
@@ -70,6 +197,9 @@ async def get_evaluation_history(
     session: AsyncSession,
     candidate_position_id: int,
     step_type: str,
+    user_id: int | None = None,
+    result_fields: Sequence[str] | None = None,
+    summary: bool = False,
 ) -> list[Evaluation]:
     query = (
         select(Evaluation)
@@ -77,9 +207,60 @@ async def get_evaluation_history(
         .where(Evaluation.step_type == step_type)
         .order_by(Evaluation.version.desc())
     )
+    if user_id is not None:
+        query = query.where(access_clause(candidate_position_id, user_id))
 
-    result = await session.execute(query)
-    return list(result.scalars().all())
+    evaluations = await _fetch_evaluations(session, query, result_fields, summary)
+    if not evaluations and user_id is not None:
+        await verify_access(session, candidate_position_id, user_id)
+    return evaluations
+
+
+def _upsert(session: AsyncSession) -> Any:
+    bind = session.bind
+    if bind is not None and bind.dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
+
+
+def _bump_counter(statement: Any) -> Any:
+    """Make a counter INSERT take the next version when the row already exists.
+
+    The inserted ``last_version`` is computed from ``evaluations``. It wins
+    only if the counter lags behind rows that were written without it.
+    """
+    bumped = EvaluationVersionCounter.last_version + 1
+    proposed = statement.excluded.last_version
+    return statement.on_conflict_do_update(
+        index_elements=["candidate_position_id", "step_type"],
+        set_={"last_version": case((proposed > bumped, proposed), else_=bumped)},
+    )
+
+
+async def _allocate_version(
+    session: AsyncSession, candidate_position_id: int, step_type: str
+) -> int:
+    """Reserve the next version in one atomic upsert ... RETURNING.
+
+    The counter row stays locked until the caller's transaction ends, so a
+    concurrent creator for the same step waits for it and then takes the
+    following version.
+    """
+    next_from_evaluations = (
+        select(func.coalesce(func.max(Evaluation.version), 0) + 1)
+        .where(Evaluation.candidate_position_id == candidate_position_id)
+        .where(Evaluation.step_type == step_type)
+        .scalar_subquery()
+    )
+    statement = _upsert(session)(EvaluationVersionCounter).values(
+        candidate_position_id=candidate_position_id,
+        step_type=step_type,
+        last_version=next_from_evaluations,
+    )
+    result = await session.execute(
+        _bump_counter(statement).returning(EvaluationVersionCounter.last_version)
+    )
+    return result.scalar_one()
 
 
 async def create_evaluation(
@@ -88,46 +269,38 @@ async def create_evaluation(
     step_type: str,
     source_document_id: int | None = None,
     rubric_version_id: int | None = None,
-    _max_retries: int = 3,
+    enqueue_event: bool = False,
+    skip_response_cache: bool = False,
 ) -> Evaluation:
-    from sqlalchemy.exc import IntegrityError
+    """Create the next version of an evaluation in ``pending`` status.
 
+    With ``enqueue_event`` its EventBridge event is written to the outbox in
+    the same transaction. ``skip_response_cache`` makes the Lambda call the
+    model even when the Bedrock response cache holds an identical request.
+    """
     candidate_position = await session.get(CandidatePosition, candidate_position_id)
     if candidate_position is None:
         raise NotFoundException(f"Candidate position {candidate_position_id} not found")
 
-    for attempt in range(_max_retries):
-        latest_version_query = (
-            select(Evaluation.version)
-            .where(Evaluation.candidate_position_id == candidate_position_id)
-            .where(Evaluation.step_type == step_type)
-            .order_by(Evaluation.version.desc())
-            .limit(1)
-        )
-        result = await session.execute(latest_version_query)
-        latest_version = result.scalar_one_or_none()
-        next_version = (latest_version or 0) + 1
-
-        evaluation = Evaluation(
-            candidate_position_id=candidate_position_id,
-            step_type=EvaluationStepType(step_type),
-            status=EvaluationStatus.pending,
-            version=next_version,
-            source_document_id=source_document_id,
-            rubric_version_id=rubric_version_id,
-        )
-
-        session.add(evaluation)
-        try:
-            await session.commit()
-            await session.refresh(evaluation)
-            return evaluation
-        except IntegrityError:
-            await session.rollback()
-            if attempt == _max_retries - 1:
-                raise
+    step = EvaluationStepType(step_type)
+    evaluation = Evaluation(
+        candidate_position_id=candidate_position_id,
+        step_type=step,
+        status=EvaluationStatus.pending,
+        version=await _allocate_version(session, candidate_position_id, step),
+        source_document_id=source_document_id,
+        rubric_version_id=rubric_version_id,
+        skip_response_cache=skip_response_cache,
+    )
 
-    raise RuntimeError("Unreachable: retry loop exited without return or raise")
+    session.add(evaluation)
+    await session.flush()
+    if enqueue_event:
+        await eventbridge_service.enqueue_evaluation_event(session, evaluation)
+    await evaluation_notify_service.notify_status_change(session, evaluation)
+    await session.commit()
+    await session.refresh(evaluation)
+    return evaluation
 
 
 async def trigger_evaluation(
@@ -136,6 +309,7 @@ async def trigger_evaluation(
     step_type: str,
     source_document_id: int | None = None,
     rubric_version_id: int | None = None,
+    skip_response_cache: bool = False,
 ) -> Evaluation:
     evaluation = await create_evaluation(
         session=session,
@@ -143,30 +317,29 @@ async def trigger_evaluation(
         step_type=step_type,
         source_document_id=source_document_id,
         rubric_version_id=rubric_version_id,
+        enqueue_event=True,
+        skip_response_cache=skip_response_cache,
     )
+    eventbridge_service.wake_relay()
+    return evaluation
+
+
+async def mark_publish_failed(session: AsyncSession, evaluation_ids: list[int]) -> None:
+    """Mark still-pending evaluations failed after their event was dropped.
 
-    try:
-        await eventbridge_service.publish_evaluation_event(
-            evaluation_id=evaluation.id,
-            candidate_position_id=candidate_position_id,
-            step_type=step_type,
-            source_document_id=source_document_id,
-            rubric_version_id=rubric_version_id,
+    Changes are left for the caller to commit.
+    """
+    result = await session.execute(
+        select(Evaluation).where(
+            Evaluation.id.in_(evaluation_ids),
+            Evaluation.status == EvaluationStatus.pending,
         )
-    except Exception:
+    )
+    for evaluation in result.scalars().all():
         evaluation.status = EvaluationStatus.failed
         evaluation.error_message = "Failed to publish evaluation event"
         session.add(evaluation)
-        await session.commit()
-        await session.refresh(evaluation)
-        logger.error(
-            "Failed to publish event for evaluation_id=%s step_type=%s — marked failed",
-            evaluation.id,
-            step_type,
-            exc_info=True,
-        )
-
-    return evaluation
+        await evaluation_notify_service.notify_status_change(session, evaluation)
 
 
 async def trigger_feedback_gen(
@@ -194,33 +367,197 @@ async def trigger_feedback_gen(
     )
 
 
-async def verify_access(
-    session: AsyncSession,
-    candidate_position_id: int,
-    user_id: int,
+async def _lock_step(
+    session: AsyncSession, candidate_position_id: int, step_type: str
 ) -> None:
-    from app.models.document import Document
-    from app.models.position import Position
+    """Lock the step's version counter row until the transaction ends.
 
-    cp = await session.get(CandidatePosition, candidate_position_id)
-    if cp is None:
-        raise NotFoundException(f"Candidate position {candidate_position_id} not found")
+    The no-op upsert creates the row if needed, so the first scheduling of a
+    step is serialized too. A later :func:`_allocate_version` in the same
+    transaction reuses the lock.
+    """
+    statement = _upsert(session)(EvaluationVersionCounter).values(
+        candidate_position_id=candidate_position_id,
+        step_type=step_type,
+        last_version=0,
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["candidate_position_id", "step_type"],
+            set_={"last_version": EvaluationVersionCounter.last_version},
+        )
+    )
 
-    position = await session.get(Position, cp.position_id)
-    if position is not None and position.hiring_manager_id == user_id:
-        return
 
-    doc_query = (
-        select(Document.id)
+async def _expected_steps(
+    session: AsyncSession, candidate_position_id: int
+) -> set[EvaluationStepType]:
+    """Steps the candidate position's active documents queue on upload.
+
+    Mirrors ``document_service``: a CV queues cv_analysis, a screening
+    transcript screening_eval, and a technical transcript technical_eval
+    when the position has a rubric.
+    """
+    result = await session.execute(
+        select(Document.type, Document.interview_stage)
         .where(Document.candidate_position_id == candidate_position_id)
-        .where(Document.uploaded_by_id == user_id)
-        .limit(1)
+        .where(Document.status == DocumentStatus.active)
+        .distinct()
+    )
+    expected: set[EvaluationStepType] = set()
+    for doc_type, interview_stage in result.all():
+        if doc_type == DocumentType.cv:
+            expected.add(EvaluationStepType.cv_analysis)
+        elif interview_stage == InterviewStage.screening:
+            expected.add(EvaluationStepType.screening_eval)
+        elif interview_stage == InterviewStage.technical:
+            expected.add(EvaluationStepType.technical_eval)
+
+    if EvaluationStepType.technical_eval in expected:
+        rubric_version_id = await session.execute(
+            select(_latest_rubric_version_for(literal(candidate_position_id)))
+        )
+        if rubric_version_id.scalar() is None:
+            expected.discard(EvaluationStepType.technical_eval)
+    return expected
+
+
+async def _dependencies_ready(
+    session: AsyncSession,
+    candidate_position_id: int,
+    step_type: EvaluationStepType,
+) -> bool:
+    """Whether ``step_type`` has new upstream results and nothing left to wait for.
+
+    An upstream step counts once it has run, or once a document that queues
+    it is on file. The step waits while a counted step has no evaluation yet
+    or its latest version is pending or running. It is ready when one
+    completed after the step's own latest version was created.
+
+    A step that completes later, for example a screening transcript uploaded
+    after the recommendation ran, makes the step ready again, so it runs once
+    more with the new results.
+    """
+    expected = await _expected_steps(session, candidate_position_id)
+    upstream: list[Evaluation] = []
+    for dependency in STEP_DEPENDENCIES[step_type]:
+        latest = await _latest_evaluation_for_step(
+            session, candidate_position_id, dependency
+        )
+        if latest is not None:
+            upstream.append(latest)
+        elif dependency in expected:
+            return False
+
+    if any(
+        latest.status in (EvaluationStatus.pending, EvaluationStatus.running)
+        for latest in upstream
+    ):
+        return False
+
+    completed_at = [
+        latest.completed_at
+        for latest in upstream
+        if latest.status == EvaluationStatus.completed
+        and latest.completed_at is not None
+    ]
+    if not completed_at:
+        return False
+
+    current = await _latest_evaluation_for_step(
+        session, candidate_position_id, step_type
     )
-    result = await session.execute(doc_query)
-    if result.scalar_one_or_none() is not None:
-        return
+    if current is None:
+        return True
+    if current.status == EvaluationStatus.pending:
+        # Not started yet, so it will read the newest upstream results.
+        return False
+    return current.created_at < max(completed_at)
+
+
+async def trigger_dependent_evaluations(
+    session: AsyncSession, candidate_position_id: int
+) -> list[Evaluation]:
+    """Queue every step in ``STEP_DEPENDENCIES`` whose upstream steps settled.
+
+    Each check runs under the step's counter row lock, so concurrent callers
+    reacting to the same completions queue at most one run per step.
+    """
+    triggered: list[Evaluation] = []
+    for step_type in STEP_DEPENDENCIES:
+        await _lock_step(session, candidate_position_id, step_type)
+        if not await _dependencies_ready(session, candidate_position_id, step_type):
+            # Release the lock; a counter row left at 0 is harmless.
+            await session.commit()
+            continue
+
+        logger.info(
+            "Upstream steps settled, triggering %s for candidate_position %s",
+            step_type,
+            candidate_position_id,
+        )
+        triggered.append(
+            await trigger_evaluation(
+                session=session,
+                candidate_position_id=candidate_position_id,
+                step_type=step_type,
+            )
+        )
+    return triggered
+
 
-    raise NotFoundException(f"Candidate position {candidate_position_id} not found")
+async def candidate_positions_to_reconcile(
+    session: AsyncSession,
+    completed_since: datetime,
+) -> list[int]:
+    """Candidate positions where an upstream step completed after its dependent.
+
+    These are the candidate positions :func:`trigger_dependent_evaluations`
+    may act on, for a sweep that catches up on completions nobody reacted to.
+    Only completions at or after ``completed_since`` count, so the sweep
+    covers recent gaps rather than all history. The readiness check itself is
+    left to that function.
+    """
+    candidate_position_ids: set[int] = set()
+    for step_type, dependencies in STEP_DEPENDENCIES.items():
+        Dependent = aliased(Evaluation)
+        latest_dependent = (
+            select(func.max(Dependent.created_at))
+            .where(Dependent.candidate_position_id == Evaluation.candidate_position_id)
+            .where(Dependent.step_type == step_type)
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            select(Evaluation.candidate_position_id)
+            .where(Evaluation.step_type.in_(dependencies))
+            .where(Evaluation.status == EvaluationStatus.completed)
+            .where(Evaluation.completed_at >= literal(completed_since))
+            .where(
+                or_(
+                    latest_dependent.is_(None),
+                    Evaluation.completed_at > latest_dependent,
+                )
+            )
+            .distinct()
+        )
+        candidate_position_ids.update(result.scalars().all())
+    return sorted(candidate_position_ids)
+
+
+async def verify_access(
+    session: AsyncSession,
+    candidate_position_id: int,
+    user_id: int,
+) -> None:
+    """Raise ``NotFoundException`` unless ``user_id`` may see the evaluations.
+
+    Unauthorized users get the same error as for a missing candidate position.
+    """
+    result = await session.execute(
+        select(access_clause(candidate_position_id, user_id))
+    )
+    if not result.scalar():
+        raise NotFoundException(f"Candidate position {candidate_position_id} not found")
 
 
 async def _latest_evaluation_for_step(
@@ -243,7 +580,13 @@ async def rerun_evaluation(
     session: AsyncSession,
     candidate_position_id: int,
     step_type: str,
+    fresh: bool = False,
 ) -> list[Evaluation]:
+    """Queue the next version of a step with the latest run's inputs.
+
+    Unchanged inputs produce byte-identical prompts, so unless ``fresh`` is
+    set the Lambda may answer from the Bedrock response cache.
+    """
     step = EvaluationStepType(step_type)
 
     latest = await _latest_evaluation_for_step(session, candidate_position_id, step)
@@ -259,6 +602,165 @@ async def rerun_evaluation(
         step_type=step_type,
         source_document_id=latest.source_document_id,
         rubric_version_id=latest.rubric_version_id,
+        skip_response_cache=fresh,
     )
 
     return [rerun]
+
+
+def _latest_rubric_version_for(
+    candidate_position_id: ColumnElement[int],
+) -> ColumnElement[int]:
+    return (
+        select(PositionRubricVersion.id)
+        .join(
+            PositionRubric,
+            PositionRubricVersion.position_rubric_id == PositionRubric.id,
+        )
+        .join(
+            CandidatePosition,
+            CandidatePosition.position_id == PositionRubric.position_id,
+        )
+        .where(CandidatePosition.id == candidate_position_id)
+        .order_by(PositionRubricVersion.version_number.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+async def bulk_rerun_evaluations(
+    session: AsyncSession,
+    step_type: str,
+    user_id: int,
+    position_id: int | None = None,
+    candidate_position_ids: list[int] | None = None,
+    latest_rubric: bool = False,
+    fresh: bool = False,
+) -> list[Evaluation]:
+    """Rerun ``step_type`` for many candidate positions with set-based INSERTs.
+
+    Targets the candidate positions of ``position_id`` or those listed in
+    ``candidate_position_ids``. Only positions that ``user_id`` can access
+    and that already have an evaluation for the step are rerun. One upsert
+    allocates every next version from the counter rows, and one INSERT ...
+    SELECT creates the evaluations, each keeping the source document of its
+    latest run. With ``latest_rubric`` the rubric version becomes the
+    position's newest one; otherwise the latest run's version is kept.
+    ``fresh`` bypasses the Bedrock response cache as in
+    :func:`rerun_evaluation`. All events are written to the outbox in the
+    same transaction.
+    """
+    step = EvaluationStepType(step_type)
+
+    max_versions = (
+        select(
+            Evaluation.candidate_position_id,
+            func.max(Evaluation.version).label("max_version"),
+        )
+        .where(Evaluation.step_type == step)
+        .group_by(Evaluation.candidate_position_id)
+    )
+    if position_id is not None:
+        max_versions = max_versions.join(
+            CandidatePosition,
+            Evaluation.candidate_position_id == CandidatePosition.id,
+        ).where(CandidatePosition.position_id == position_id)
+    if candidate_position_ids is not None:
+        max_versions = max_versions.where(
+            Evaluation.candidate_position_id.in_(candidate_position_ids)
+        )
+    latest_subq = max_versions.subquery()
+
+    Latest = aliased(Evaluation)
+    targets = (
+        select(
+            Latest.candidate_position_id,
+            Latest.step_type,
+            Latest.version + 1,
+        )
+        .join(
+            latest_subq,
+            (Latest.candidate_position_id == latest_subq.c.candidate_position_id)
+            & (Latest.version == latest_subq.c.max_version),
+        )
+        .where(Latest.step_type == step)
+        .where(access_clause(Latest.candidate_position_id, user_id))
+    )
+    counters = _upsert(session)(EvaluationVersionCounter).from_select(
+        ["candidate_position_id", "step_type", "last_version"], targets
+    )
+    result = await session.execute(
+        _bump_counter(counters).returning(
+            EvaluationVersionCounter.candidate_position_id
+        )
+    )
+    allocated = list(result.scalars().all())
+    if not allocated:
+        return []
+
+    rubric_version_id = (
+        func.coalesce(
+            _latest_rubric_version_for(Latest.candidate_position_id),
+            Latest.rubric_version_id,
+        )
+        if latest_rubric
+        else Latest.rubric_version_id
+    )
+    rows = (
+        select(
+            Latest.candidate_position_id,
+            Latest.step_type,
+            literal(EvaluationStatus.pending.value),
+            EvaluationVersionCounter.last_version,
+            Latest.source_document_id,
+            rubric_version_id,
+            literal(fresh),
+        )
+        .join(
+            latest_subq,
+            (Latest.candidate_position_id == latest_subq.c.candidate_position_id)
+            & (Latest.version == latest_subq.c.max_version),
+        )
+        .join(
+            EvaluationVersionCounter,
+            (
+                EvaluationVersionCounter.candidate_position_id
+                == Latest.candidate_position_id
+            )
+            & (EvaluationVersionCounter.step_type == Latest.step_type),
+        )
+        .where(Latest.step_type == step)
+        .where(Latest.candidate_position_id.in_(allocated))
+    )
+    inserted = await session.execute(
+        insert(Evaluation)
+        .from_select(
+            [
+                "candidate_position_id",
+                "step_type",
+                "status",
+                "version",
+                "source_document_id",
+                "rubric_version_id",
+                "skip_response_cache",
+            ],
+            rows,
+        )
+        .returning(Evaluation.id)
+    )
+    evaluation_ids = list(inserted.scalars().all())
+
+    evaluations_result = await session.execute(
+        select(Evaluation)
+        .where(Evaluation.id.in_(evaluation_ids))
+        .order_by(Evaluation.candidate_position_id)
+    )
+    evaluations = list(evaluations_result.scalars().all())
+    for evaluation in evaluations:
+        await eventbridge_service.enqueue_evaluation_event(session, evaluation)
+    await evaluation_notify_service.notify_status_changes(session, evaluations)
+    await session.commit()
+
+    logger.info("Bulk rerun created %d %s evaluations", len(evaluations), step.value)
+    eventbridge_service.wake_relay()
+    return evaluations
@@ -1,52 +1,263 @@
+import asyncio
 import json
 import logging
+import secrets
+from contextlib import AsyncExitStack, suppress
+from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import aioboto3
+from botocore.exceptions import BotoCoreError, ClientError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import settings
+from app.database import async_session_factory
+from app.models.evaluation import Evaluation
+from app.models.evaluation_outbox import EvaluationOutbox
 
 logger = logging.getLogger(__name__)
 
 _session = aioboto3.Session()
+_random = secrets.SystemRandom()
 
+MAX_BATCH_SIZE = 10  # PutEvents limit
+MAX_ATTEMPTS = 8
+POLL_INTERVAL_SECONDS = 2.0
+# Longer than a PutEvents call with botocore's retries can take.
+CLAIM_TIMEOUT = timedelta(minutes=5)
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_CAP_SECONDS = 300.0
 
-async def publish_evaluation_event(
-    evaluation_id: int,
-    candidate_position_id: int,
-    step_type: str,
-    source_document_id: int | None = None,
-    rubric_version_id: int | None = None,
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _build_entry(detail: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "Source": "lauter.api",
+        "DetailType": "evaluation.requested",
+        "Detail": json.dumps(detail),
+        "EventBusName": settings.evaluation_event_bus_name,
+    }
+
+
+async def enqueue_evaluation_event(
+    session: AsyncSession, evaluation: Evaluation
 ) -> None:
+    """Add the evaluation's ``evaluation.requested`` event to the outbox.
+
+    The row is part of the caller's transaction, so the event exists exactly
+    when the evaluation does. ``evaluation`` must already be flushed.
+    """
+    if not settings.evaluation_event_bus_name and settings.debug:
+        logger.info(
+            "EventBridge skipped (no bus name configured, DEBUG=true) — "
+            "evaluation_id=%s step_type=%s",
+            evaluation.id,
+            evaluation.step_type,
+        )
+        return
+
+    if evaluation.id is None:
+        raise ValueError("Evaluation must be flushed before enqueueing its event")
+    session.add(
+        EvaluationOutbox(
+            evaluation_id=evaluation.id,
+            detail={
+                "evaluation_id": evaluation.id,
+                "candidate_position_id": evaluation.candidate_position_id,
+                "step_type": evaluation.step_type,
+                "source_document_id": evaluation.source_document_id,
+                "rubric_version_id": evaluation.rubric_version_id,
+            },
+            next_attempt_at=_utcnow(),
+        )
+    )
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    ceiling = min(_RETRY_CAP_SECONDS, _RETRY_BASE_SECONDS * 2**attempts)
+    return timedelta(seconds=_random.uniform(ceiling / 2, ceiling))
+
+
+class OutboxRelay:
+    """Drains ``evaluation_outbox`` to EventBridge in ``PutEvents`` batches.
+
+    Due rows are leased with ``FOR UPDATE SKIP LOCKED`` in a short
+    transaction, so relays in other processes skip them. The ``PutEvents``
+    call runs outside any transaction. A second transaction then deletes
+    the accepted rows and backs off the rejected ones. After
+    ``MAX_ATTEMPTS`` a row's evaluation is marked failed.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ) -> None:
+        self._client = client
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._in_flight: asyncio.Future[int] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        # Let a batch already handed to EventBridge commit its deletes.
+        if self._in_flight is not None:
+            with suppress(Exception):
+                await self._in_flight
+            self._in_flight = None
+
+    async def _run(self) -> None:
+        while True:
+            relayed = 0
+            self._in_flight = asyncio.ensure_future(self.relay_once())
+            try:
+                relayed = await asyncio.shield(self._in_flight)
+            except Exception:
+                logger.exception("Evaluation outbox relay cycle failed")
+            self._in_flight = None
+
+            if relayed < MAX_BATCH_SIZE:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), POLL_INTERVAL_SECONDS)
+                self._wakeup.clear()
+
+    async def relay_once(self) -> int:
+        """Send one batch of due outbox rows. Returns the number of rows claimed."""
+        rows = await self._claim()
+        if not rows:
+            return 0
+
+        errors: dict[int | None, str] = {}
+        try:
+            response = await self._client.put_events(
+                Entries=[_build_entry(row.detail) for row in rows]
+            )
+            # Result entries line up with the request; failed ones carry ErrorCode.
+            for row, entry in zip(rows, response["Entries"], strict=True):
+                if entry.get("ErrorCode"):
+                    errors[row.id] = (
+                        f"{entry['ErrorCode']}: {entry.get('ErrorMessage', '')}"
+                    )
+        except (BotoCoreError, ClientError) as err:
+            errors = {row.id: str(err) for row in rows}
+
+        await self._settle(rows, errors)
+        return len(rows)
+
+    async def _claim(self) -> list[EvaluationOutbox]:
+        """Lease due rows in a short transaction of their own.
+
+        Claimed rows get ``next_attempt_at`` pushed out by ``CLAIM_TIMEOUT``,
+        so no relay picks them up while this one publishes. If this process
+        dies before settling, they become due again when the lease runs out.
+        """
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(EvaluationOutbox)
+                .where(EvaluationOutbox.next_attempt_at <= _utcnow())
+                .order_by(EvaluationOutbox.id)
+                .limit(MAX_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            rows = list(result.scalars().all())
+            lease_until = _utcnow() + CLAIM_TIMEOUT
+            for row in rows:
+                row.next_attempt_at = lease_until
+                session.add(row)
+            await session.commit()
+            return rows
+
+    async def _settle(
+        self, rows: list[EvaluationOutbox], errors: dict[int | None, str]
+    ) -> None:
+        """Delete delivered rows and back off rejected ones."""
+        async with self._session_factory() as session:
+            exhausted: list[int] = []
+            for claimed in rows:
+                row = await session.get(EvaluationOutbox, claimed.id)
+                if row is None:
+                    continue
+                error = errors.get(row.id)
+                if error is None:
+                    await session.delete(row)
+                    continue
+                row.attempts += 1
+                row.last_error = error
+                if row.attempts >= MAX_ATTEMPTS:
+                    exhausted.append(row.evaluation_id)
+                    await session.delete(row)
+                else:
+                    row.next_attempt_at = _utcnow() + _retry_delay(row.attempts)
+                    session.add(row)
+
+            if errors:
+                logger.warning(
+                    "EventBridge rejected %d of %d outbox events",
+                    len(errors),
+                    len(rows),
+                )
+            if exhausted:
+                logger.error(
+                    "Giving up publishing events for evaluation_ids=%s", exhausted
+                )
+                from app.services import evaluation_service
+
+                await evaluation_service.mark_publish_failed(session, exhausted)
+
+            await session.commit()
+
+
+_exit_stack: AsyncExitStack | None = None
+_relay: OutboxRelay | None = None
+
+
+async def start_relay() -> None:
+    global _exit_stack, _relay
+    if _relay is not None:
+        return
     if not settings.evaluation_event_bus_name:
         if settings.debug:
-            logger.info(
-                "EventBridge skipped (no bus name configured, DEBUG=true) — "
-                "evaluation_id=%s step_type=%s",
-                evaluation_id,
-                step_type,
-            )
             return
-        raise RuntimeError(
-            f"EVALUATION_EVENT_BUS_NAME is not configured — cannot publish event "
-            f"for evaluation_id={evaluation_id} step_type={step_type}"
-        )
+        # Outside debug, triggers write outbox rows that nothing would send.
+        msg = "EVALUATION_EVENT_BUS_NAME must be set when DEBUG is false"
+        raise RuntimeError(msg)
+    stack = AsyncExitStack()
+    client = await stack.enter_async_context(
+        _session.client("events", region_name=settings.s3_region)
+    )
+    _exit_stack = stack
+    _relay = OutboxRelay(client)
+    _relay.start()
 
-    detail = {
-        "evaluation_id": evaluation_id,
-        "candidate_position_id": candidate_position_id,
-        "step_type": step_type,
-        "source_document_id": source_document_id,
-        "rubric_version_id": rubric_version_id,
-    }
 
-    async with _session.client("events", region_name=settings.s3_region) as client:
-        await client.put_events(
-            Entries=[
-                {
-                    "Source": "lauter.api",
-                    "DetailType": "evaluation.requested",
-                    "Detail": json.dumps(detail),
-                    "EventBusName": settings.evaluation_event_bus_name,
-                }
-            ]
-        )
+async def stop_relay() -> None:
+    global _exit_stack, _relay
+    relay, _relay = _relay, None
+    stack, _exit_stack = _exit_stack, None
+    if relay is not None:
+        await relay.stop()
+    if stack is not None:
+        await stack.aclose()
+
+
+def wake_relay() -> None:
+    """Nudge this process's relay after committing new outbox rows."""
+    if _relay is not None:
+        _relay.wake()
@@ -7,6 +7,7 @@ from app.models.enums import PositionStatus
 from app.models.position import Position
 from app.models.team import Team
 from app.models.user import User
+from app.services import dashboard_service
 
 
 async def list_positions(
@@ -102,6 +103,7 @@ async def create_position(
         status=PositionStatus.open,
     )
     session.add(position)
+    await dashboard_service.record_position(session, 1, is_open=True)
     await session.commit()
     await session.refresh(position)
     return position
@@ -196,6 +198,7 @@ async def update_position(
         except ValueError:
             raise ValidationError(f"Invalid status: {status}") from None
 
+    was_open = position.status == PositionStatus.open
     if title is not None:
         position.title = title
     if requirements is not None:
@@ -210,6 +213,9 @@ async def update_position(
         position.status = status
 
     session.add(position)
+    await dashboard_service.record_position_update(
+        session, was_open, position.status == PositionStatus.open
+    )
     await session.commit()
     await session.refresh(position)
     return position
@@ -221,6 +227,9 @@ async def archive_position(session: AsyncSession, position_id: int) -> Position:
         raise NotFoundException("Position not found")
     position.is_archived = True
     session.add(position)
+    await dashboard_service.record_position(
+        session, -1, is_open=position.status == PositionStatus.open
+    )
     await session.commit()
     await session.refresh(position)
     return position
@@ -1,9 +1,10 @@
 import logging
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Any
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import BotoCoreError, ClientError
 
 from app.config import settings
@@ -11,16 +12,70 @@ from app.exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
 
+_MAX_POOL_CONNECTIONS = 50
 
-@asynccontextmanager
-async def _s3_client(*, for_presign: bool = False) -> AsyncIterator[Any]:
-    session = aioboto3.Session()
-    kwargs: dict[str, str] = {"region_name": settings.s3_region}
+_exit_stack: AsyncExitStack | None = None
+_data_client: Any = None
+_presign_client: Any = None
+
+
+def _client_kwargs(*, for_presign: bool) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"region_name": settings.s3_region}
     if for_presign and settings.s3_presign_endpoint_url:
         kwargs["endpoint_url"] = settings.s3_presign_endpoint_url
     elif settings.s3_endpoint_url:
         kwargs["endpoint_url"] = settings.s3_endpoint_url
-    async with session.client("s3", **kwargs) as client:
+    return kwargs
+
+
+async def start_clients() -> None:
+    """Open the process-wide S3 clients. Called once from the app lifespan.
+
+    Credentials and endpoints are resolved here, so presigning later is pure
+    local computation and data-plane calls reuse pooled connections.
+    """
+    global _exit_stack, _data_client, _presign_client
+    if _exit_stack is not None:
+        return
+    session = aioboto3.Session()
+    stack = AsyncExitStack()
+    try:
+        _data_client = await stack.enter_async_context(
+            session.client(
+                "s3",
+                config=AioConfig(max_pool_connections=_MAX_POOL_CONNECTIONS),
+                **_client_kwargs(for_presign=False),
+            )
+        )
+        _presign_client = await stack.enter_async_context(
+            session.client("s3", **_client_kwargs(for_presign=True))
+        )
+    except BaseException:
+        await stack.aclose()
+        _data_client = _presign_client = None
+        raise
+    _exit_stack = stack
+
+
+async def stop_clients() -> None:
+    global _exit_stack, _data_client, _presign_client
+    stack, _exit_stack = _exit_stack, None
+    _data_client = _presign_client = None
+    if stack is not None:
+        await stack.aclose()
+
+
+@asynccontextmanager
+async def _s3_client(*, for_presign: bool = False) -> AsyncIterator[Any]:
+    shared = _presign_client if for_presign else _data_client
+    if shared is not None:
+        yield shared
+        return
+    # Outside the app lifespan (scripts, tests): fall back to a one-off client.
+    session = aioboto3.Session()
+    async with session.client(
+        "s3", **_client_kwargs(for_presign=for_presign)
+    ) as client:
         yield client
 
 
@@ -1,8 +1,16 @@
+import time
+from collections import OrderedDict
+
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.user import User
 
+USER_CACHE_TTL = 60
+USER_CACHE_MAX_SIZE = 1024
+
+_user_cache: OrderedDict[str, tuple[float, User]] = OrderedDict()
+
 
 async def get_by_email(session: AsyncSession, email: str) -> User | None:
     statement = select(User).where(User.email == email)
@@ -10,6 +18,40 @@ async def get_by_email(session: AsyncSession, email: str) -> User | None:
     return result.scalar_one_or_none()
 
 
+def _detached_copy(user: User) -> User:
+    return User.model_validate(user.model_dump())
+
+
+async def get_by_email_cached(session: AsyncSession, email: str) -> User | None:
+    """Like :func:`get_by_email`, served from a small per-process TTL cache.
+
+    Returns a detached copy for read-only use; don't add it to a session.
+    """
+    entry = _user_cache.get(email)
+    if entry is not None and time.monotonic() - entry[0] < USER_CACHE_TTL:
+        _user_cache.move_to_end(email)
+        return _detached_copy(entry[1])
+
+    user = await get_by_email(session, email)
+    if user is None:
+        _user_cache.pop(email, None)
+        return None
+
+    _user_cache[email] = (time.monotonic(), _detached_copy(user))
+    _user_cache.move_to_end(email)
+    while len(_user_cache) > USER_CACHE_MAX_SIZE:
+        _user_cache.popitem(last=False)
+    return user
+
+
+def invalidate_cached_user(email: str | None = None) -> None:
+    """Drop one cached user, or the whole cache when ``email`` is None."""
+    if email is None:
+        _user_cache.clear()
+    else:
+        _user_cache.pop(email, None)
+
+
 async def create_or_update(
     session: AsyncSession,
     email: str,
@@ -35,4 +77,5 @@ async def create_or_update(
 
     await session.commit()
     await session.refresh(user)
+    invalidate_cached_user(email)
     return user
@@ -0,0 +1,52 @@
+"""add bedrock rate limit tables
+
+Revision ID: e36d71b57615
+Revises: 62cf86c12093
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e36d71b57615"
+down_revision: str | Sequence[str] | None = "62cf86c12093"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bedrock_rate_limits",
+        sa.Column("model_id", sa.String(), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("concurrency_limit", sa.Float(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("model_id"),
+    )
+    op.create_table(
+        "bedrock_leases",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("model_id", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_bedrock_leases_model_expires",
+        "bedrock_leases",
+        ["model_id", "expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bedrock_leases_model_expires", table_name="bedrock_leases")
+    op.drop_table("bedrock_leases")
+    op.drop_table("bedrock_rate_limits")
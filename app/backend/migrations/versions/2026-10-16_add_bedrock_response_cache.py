@@ -0,0 +1,68 @@
+"""add bedrock response cache
+
+Revision ID: 4a9c2e7d1f30
+Revises: 1f6b3d8a92c4
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "4a9c2e7d1f30"
+down_revision: str | Sequence[str] | None = "1f6b3d8a92c4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bedrock_response_cache",
+        sa.Column("fingerprint", sa.String(), nullable=False),
+        sa.Column("model_id", sa.String(), nullable=False),
+        sa.Column("response", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("fingerprint"),
+    )
+    op.create_index(
+        op.f("ix_bedrock_response_cache_created_at"),
+        "bedrock_response_cache",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_bedrock_response_cache_expires_at"),
+        "bedrock_response_cache",
+        ["expires_at"],
+        unique=False,
+    )
+    op.add_column(
+        "evaluations",
+        sa.Column(
+            "skip_response_cache",
+            sa.Boolean(),
+            server_default=sa.false(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("evaluations", "skip_response_cache")
+    op.drop_index(
+        op.f("ix_bedrock_response_cache_expires_at"),
+        table_name="bedrock_response_cache",
+    )
+    op.drop_index(
+        op.f("ix_bedrock_response_cache_created_at"),
+        table_name="bedrock_response_cache",
+    )
+    op.drop_table("bedrock_response_cache")
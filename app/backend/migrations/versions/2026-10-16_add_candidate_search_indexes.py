@@ -0,0 +1,62 @@
+"""add candidate search and keyset indexes
+
+Revision ID: 5b8e2c41d9a7
+Revises: e36d71b57615
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "5b8e2c41d9a7"
+down_revision: str | Sequence[str] | None = "e36d71b57615"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_candidates_full_name_trgm",
+        "candidates",
+        ["full_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"full_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_candidates_email_trgm",
+        "candidates",
+        ["email"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_candidates_updated_at_id",
+        "candidates",
+        ["updated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_candidates_full_name_id",
+        "candidates",
+        ["full_name", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_candidates_email_id",
+        "candidates",
+        ["email", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_candidates_email_id", table_name="candidates")
+    op.drop_index("ix_candidates_full_name_id", table_name="candidates")
+    op.drop_index("ix_candidates_updated_at_id", table_name="candidates")
+    op.drop_index("ix_candidates_email_trgm", table_name="candidates")
+    op.drop_index("ix_candidates_full_name_trgm", table_name="candidates")
@@ -0,0 +1,36 @@
+"""add dashboard snapshots
+
+Revision ID: 9d41f0c7ab23
+Revises: 5b8e2c41d9a7
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "9d41f0c7ab23"
+down_revision: str | Sequence[str] | None = "5b8e2c41d9a7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("generation", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("built_generation", sa.Integer(), nullable=True),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Seed the single row so writes can bump its generation before the
+    # dashboard is first read.
+    op.execute("INSERT INTO dashboard_snapshots (id, generation) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    op.drop_table("dashboard_snapshots")
@@ -0,0 +1,38 @@
+"""add evaluation version counters
+
+Revision ID: 7e2f94b0c1d6
+Revises: 3c7a9e15f2b8
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "7e2f94b0c1d6"
+down_revision: str | Sequence[str] | None = "3c7a9e15f2b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evaluation_version_counters",
+        sa.Column("candidate_position_id", sa.Integer(), nullable=False),
+        sa.Column("step_type", sa.String(), nullable=False),
+        sa.Column("last_version", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["candidate_position_id"], ["candidate_positions.id"]),
+        sa.PrimaryKeyConstraint("candidate_position_id", "step_type"),
+    )
+    op.execute(
+        "INSERT INTO evaluation_version_counters "
+        "(candidate_position_id, step_type, last_version) "
+        "SELECT candidate_position_id, step_type, max(version) "
+        "FROM evaluations GROUP BY candidate_position_id, step_type"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("evaluation_version_counters")
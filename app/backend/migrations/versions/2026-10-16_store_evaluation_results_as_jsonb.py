@@ -0,0 +1,40 @@
+"""store evaluation results as jsonb
+
+Revision ID: 1f6b3d8a92c4
+Revises: 7e2f94b0c1d6
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "1f6b3d8a92c4"
+down_revision: str | Sequence[str] | None = "7e2f94b0c1d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "evaluations",
+        "result",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="result::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "evaluations",
+        "result",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="result::json",
+    )
@@ -0,0 +1,65 @@
+"""replace dashboard snapshots with counters
+
+Revision ID: 8b3f6d2a4c91
+Revises: 4a9c2e7d1f30
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "8b3f6d2a4c91"
+down_revision: str | Sequence[str] | None = "4a9c2e7d1f30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_counters",
+        sa.Column("metric", sa.String(), nullable=False),
+        sa.Column("key", sa.String(), server_default="", nullable=False),
+        sa.Column("value", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("metric", "key"),
+    )
+    # Start the counters from the current data; writes keep them current.
+    op.execute(
+        """
+        INSERT INTO dashboard_counters (metric, key, value)
+        SELECT 'candidates', '', count(*) FROM candidates WHERE NOT is_archived
+        UNION ALL
+        SELECT 'positions', '', count(*) FROM positions WHERE NOT is_archived
+        UNION ALL
+        SELECT 'open_positions', '', count(*) FROM positions
+        WHERE NOT is_archived AND status = 'open'
+        UNION ALL
+        SELECT 'stage', stage, count(*) FROM candidate_positions GROUP BY stage
+        UNION ALL
+        SELECT 'position_candidates', CAST(position_id AS VARCHAR), count(*)
+        FROM candidate_positions GROUP BY position_id
+        """
+    )
+    op.drop_table("dashboard_snapshots")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "dashboard_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("generation", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("built_generation", sa.Integer(), nullable=True),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("INSERT INTO dashboard_snapshots (id, generation) VALUES (1, 0)")
+    op.drop_table("dashboard_counters")
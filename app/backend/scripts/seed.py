@@ -20,6 +20,7 @@ from app.models import (
     User,
 )
 from app.models.enums import PipelineStage, PositionStatus
+from app.services import dashboard_service
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -250,6 +251,8 @@ async def seed() -> None:
         session.add_all(cp_records)
         await session.commit()
 
+        await dashboard_service.rebuild_counters(session)
+
     print(
         f"Seeded: {len(teams)} teams, {len(users)} users, "
         f"{len(positions)} positions, {len(candidates)} candidates, "
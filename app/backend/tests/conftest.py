@@ -1,5 +1,6 @@
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
+from unittest.mock import patch
 
 os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-for-tests-only-32chars")
 
@@ -10,6 +11,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.config import settings
 from app.database import get_session
 from app.dependencies.auth import get_current_user
 from app.main import app
@@ -18,6 +20,7 @@ from app.models.candidate_position import CandidatePosition
 from app.models.position import Position
 from app.models.team import Team
 from app.models.user import User
+from app.services import dashboard_service, user_service
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
@@ -36,6 +39,8 @@ async_session_factory = sessionmaker(
 
 @pytest.fixture(autouse=True)
 async def setup_database():
+    dashboard_service.invalidate_cache()
+    user_service.invalidate_cached_user()
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
     yield
@@ -43,6 +48,13 @@ async def setup_database():
         await conn.run_sync(SQLModel.metadata.drop_all)
 
 
+@pytest.fixture
+def event_bus() -> Generator[str, None, None]:
+    """Configure an event bus so triggered evaluations write outbox rows."""
+    with patch.object(settings, "evaluation_event_bus_name", "test-bus"):
+        yield "test-bus"
+
+
 @pytest.fixture
 async def session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
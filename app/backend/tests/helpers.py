@@ -1,5 +1,13 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.models.evaluation_outbox import EvaluationOutbox
 from app.models.position import Position
 from app.models.rubric_template import RubricTemplate
 from app.models.team import Team
@@ -81,3 +89,23 @@ async def create_test_template(
     await session.commit()
     await session.refresh(template)
     return template
+
+
+async def get_outbox_events(session: AsyncSession) -> list[EvaluationOutbox]:
+    result = await session.exec(select(EvaluationOutbox).order_by(EvaluationOutbox.id))
+    return list(result.all())
+
+
+@contextmanager
+def count_statements() -> Generator[list[str], None, None]:
+    """Collect the SQL statements executed inside the block."""
+    statements: list[str] = []
+
+    def _record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
@@ -4,10 +4,11 @@ from unittest.mock import AsyncMock, patch
 
 import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
 from httpx import AsyncClient
 
 from app.config import settings
-from app.services import auth_service
+from app.services import auth_service, user_service
 
 
 @pytest.mark.asyncio
@@ -70,6 +71,83 @@ async def test_auth_me_with_valid_cookie(client: AsyncClient):
         assert data["full_name"] == "Test User"
 
 
+@pytest.mark.asyncio
+async def test_auth_me_serves_user_from_cache(client: AsyncClient):
+    with patch.object(settings, "debug", True):
+        await client.post(
+            "/api/auth/dev-login",
+            json={"email": "test@provectus.com", "name": "Test User"},
+        )
+
+        with patch.object(
+            user_service, "get_by_email", wraps=user_service.get_by_email
+        ) as mock_get_by_email:
+            first = await client.get("/api/auth/me")
+            second = await client.get("/api/auth/me")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert mock_get_by_email.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_auth_me_cache_invalidated_on_login_update(client: AsyncClient):
+    with patch.object(settings, "debug", True):
+        await client.post(
+            "/api/auth/dev-login",
+            json={"email": "test@provectus.com", "name": "Test User"},
+        )
+        assert (await client.get("/api/auth/me")).json()["full_name"] == "Test User"
+
+        await client.post(
+            "/api/auth/dev-login",
+            json={"email": "test@provectus.com", "name": "Renamed User"},
+        )
+        me_response = await client.get("/api/auth/me")
+
+    assert me_response.json()["full_name"] == "Renamed User"
+
+
+@pytest.mark.asyncio
+async def test_cognito_public_key_parsed_once_per_kid():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": "key-1", "alg": "RS256", "use": "sig"})
+    now = datetime.now(UTC)
+
+    auth_service._invalidate_jwks_cache()
+    with (
+        patch.object(settings, "cognito_client_id", "test_client_id"),
+        patch.object(settings, "cognito_user_pool_id", "us-east-1_TestPool"),
+        patch.object(
+            auth_service,
+            "get_jwks",
+            new_callable=AsyncMock,
+            return_value={"keys": [jwk]},
+        ),
+        patch.object(auth_service, "PyJWK", wraps=auth_service.PyJWK) as mock_pyjwk,
+    ):
+        token = jwt.encode(
+            {
+                "sub": "abc",
+                "email": "test@provectus.com",
+                "aud": settings.cognito_client_id,
+                "iss": settings.cognito_issuer,
+                "iat": now,
+                "exp": now + timedelta(minutes=5),
+            },
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "key-1"},
+        )
+        first = await auth_service.validate_cognito_id_token(token)
+        second = await auth_service.validate_cognito_id_token(token)
+
+    auth_service._invalidate_jwks_cache()
+    assert first["email"] == second["email"] == "test@provectus.com"
+    mock_pyjwk.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_auth_me_with_no_cookie(client: AsyncClient):
     response = await client.get("/api/auth/me")
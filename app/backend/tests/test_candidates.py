@@ -1,9 +1,13 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from httpx import AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.dependencies.auth import get_current_user
 from app.main import app
+from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
 from app.models.position import Position
 from app.models.team import Team
@@ -27,7 +31,14 @@ async def test_list_candidates_empty(client: AsyncClient):
     response = await client.get("/api/candidates")
     assert response.status_code == 200
     data = response.json()
-    assert data == {"items": [], "total": 0, "offset": 0, "limit": 20}
+    assert data == {
+        "items": [],
+        "total": 0,
+        "offset": 0,
+        "limit": 20,
+        "next_cursor": None,
+        "total_is_estimate": False,
+    }
 
 
 async def test_create_candidate(client: AsyncClient):
@@ -1491,6 +1502,123 @@ async def test_combined_search_and_filter(client: AsyncClient, session: AsyncSes
     assert data["items"][0]["full_name"] == "Alice Smith"
 
 
+async def test_list_candidates_cursor_pagination(client: AsyncClient):
+    for name in ["Dave", "Alice", "Carol", "Bob", "Eve"]:
+        await client.post(
+            "/api/candidates",
+            json={"full_name": name, "email": f"{name.lower()}@example.com"},
+        )
+
+    names: list[str] = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 2, "sort_by": "full_name", "sort_order": "asc"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/candidates", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        names.extend(item["full_name"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == ["Alice", "Bob", "Carol", "Dave", "Eve"]
+    assert cursor is None
+
+
+async def test_list_candidates_cursor_pagination_desc_updated_at(
+    client: AsyncClient, session: AsyncSession
+):
+    updated_at = datetime(2026, 1, 1, 12, 0, 0)
+    for name in ["Alice", "Bob", "Carol"]:
+        resp = await client.post(
+            "/api/candidates",
+            json={"full_name": name, "email": f"{name.lower()}@example.com"},
+        )
+        candidate = await session.get(Candidate, resp.json()["id"])
+        assert candidate is not None
+        # Two candidates share a timestamp so the id tie-breaker is exercised.
+        candidate.updated_at = updated_at
+        updated_at += timedelta(seconds=1) if name == "Bob" else timedelta(0)
+        session.add(candidate)
+    await session.commit()
+
+    first = (await client.get("/api/candidates?limit=2")).json()
+    assert first["next_cursor"] is not None
+    second = (
+        await client.get(
+            "/api/candidates", params={"limit": 2, "cursor": first["next_cursor"]}
+        )
+    ).json()
+
+    first_ids = [item["id"] for item in first["items"]]
+    second_ids = [item["id"] for item in second["items"]]
+    assert len(second_ids) == 1
+    assert not set(first_ids) & set(second_ids)
+    assert second["next_cursor"] is None
+
+
+async def test_list_candidates_invalid_cursor(client: AsyncClient):
+    response = await client.get("/api/candidates?cursor=not-a-cursor")
+    assert response.status_code == 422
+
+
+async def test_list_candidates_cursor_for_other_sort_rejected(client: AsyncClient):
+    for name in ["Alice", "Bob"]:
+        await client.post(
+            "/api/candidates",
+            json={"full_name": name, "email": f"{name.lower()}@example.com"},
+        )
+    cursor = (await client.get("/api/candidates?limit=1")).json()["next_cursor"]
+
+    response = await client.get(
+        "/api/candidates", params={"cursor": cursor, "sort_by": "email"}
+    )
+    assert response.status_code == 422
+
+
+async def test_list_candidates_estimated_count_falls_back_to_exact(
+    client: AsyncClient,
+):
+    await client.post(
+        "/api/candidates",
+        json={"full_name": "Alice", "email": "alice@example.com"},
+    )
+
+    response = await client.get("/api/candidates?count=estimated")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["total_is_estimate"] is False
+
+
+async def test_list_candidates_estimates_count_on_cursor_pages(
+    client: AsyncClient,
+):
+    for name in ("Alice", "Bob"):
+        await client.post(
+            "/api/candidates",
+            json={"full_name": name, "email": f"{name.lower()}@example.com"},
+        )
+
+    with patch(
+        "app.services.candidate_service._estimate_count",
+        new=AsyncMock(return_value=42),
+    ) as estimate:
+        first = (await client.get("/api/candidates?limit=1")).json()
+        second = (
+            await client.get(
+                "/api/candidates", params={"limit": 1, "cursor": first["next_cursor"]}
+            )
+        ).json()
+
+    assert (first["total"], first["total_is_estimate"]) == (2, False)
+    assert (second["total"], second["total_is_estimate"]) == (42, True)
+    estimate.assert_awaited_once()
+
+
 async def test_sort_candidates_by_name_asc(client: AsyncClient):
     await client.post(
         "/api/candidates",
@@ -1,11 +1,14 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
+from app.models.dashboard_counter import DashboardCounter
 from app.models.position import Position
 from app.models.team import Team
+from app.services import dashboard_service
 
 
 @pytest.mark.asyncio
@@ -53,6 +56,8 @@ async def test_dashboard_stats_with_data(
     )
     session.add(cp)
     await session.commit()
+    # Written directly, so recount what the services would have counted.
+    await dashboard_service.rebuild_counters(session)
 
     response = await authenticated_client.get("/api/dashboard/stats")
     assert response.status_code == 200
@@ -74,3 +79,200 @@ async def test_dashboard_stats_with_data(
 async def test_dashboard_stats_requires_auth(client: AsyncClient):
     response = await client.get("/api/dashboard/stats")
     assert response.status_code == 401
+
+
+async def _counters(session: AsyncSession) -> dict[tuple[str, str], int]:
+    result = await session.execute(
+        select(DashboardCounter.metric, DashboardCounter.key, DashboardCounter.value)
+        .where(DashboardCounter.metric != dashboard_service.VERSION)
+        .execution_options(populate_existing=True)
+    )
+    return {(metric, key): value for metric, key, value in result.all()}
+
+
+@pytest.fixture
+async def position(session: AsyncSession) -> Position:
+    team = Team(name="Engineering")
+    session.add(team)
+    await session.flush()
+    position = Position(
+        title="Backend Engineer",
+        status="open",
+        team_id=team.id,
+        hiring_manager_id=1,
+    )
+    session.add(position)
+    await session.commit()
+    await dashboard_service.rebuild_counters(session)
+    return position
+
+
+@pytest.mark.asyncio
+async def test_dashboard_stats_reports_snapshot_age(
+    authenticated_client: AsyncClient,
+):
+    response = await authenticated_client.post(
+        "/api/candidates",
+        json={"full_name": "Jane Doe", "email": "jane@example.com"},
+    )
+    assert response.status_code == 201
+
+    response = await authenticated_client.get("/api/dashboard/stats")
+    data = response.json()
+    assert data["snapshot_refreshed_at"] is not None
+    assert data["snapshot_age_seconds"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_counters_change_in_the_write_transaction(
+    authenticated_client: AsyncClient,
+    session: AsyncSession,
+    position: Position,
+):
+    response = await authenticated_client.post(
+        "/api/candidates",
+        json={"full_name": "Jane Doe", "email": "jane@example.com"},
+    )
+    candidate_id = response.json()["id"]
+    await authenticated_client.post(
+        f"/api/candidates/{candidate_id}/positions",
+        json={"position_id": position.id},
+    )
+
+    assert await _counters(session) == {
+        ("candidates", ""): 1,
+        ("positions", ""): 1,
+        ("open_positions", ""): 1,
+        ("stage", "new"): 1,
+        ("position_candidates", str(position.id)): 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_counters_roll_back_with_the_write(session: AsyncSession):
+    session.add(Candidate(full_name="Jane Doe", email="jane@example.com"))
+    await dashboard_service.record_candidate(session, 1)
+    await session.rollback()
+
+    assert await _counters(session) == {}
+
+
+@pytest.mark.asyncio
+async def test_stage_change_moves_the_pipeline_count(
+    authenticated_client: AsyncClient,
+    position: Position,
+):
+    response = await authenticated_client.post(
+        "/api/candidates",
+        json={"full_name": "Jane Doe", "email": "jane@example.com"},
+    )
+    candidate_id = response.json()["id"]
+    await authenticated_client.post(
+        f"/api/candidates/{candidate_id}/positions",
+        json={"position_id": position.id},
+    )
+    await authenticated_client.get("/api/dashboard/stats")
+
+    response = await authenticated_client.patch(
+        f"/api/candidates/{candidate_id}/positions/{position.id}",
+        json={"stage": "screening"},
+    )
+    assert response.status_code == 200
+
+    data = (await authenticated_client.get("/api/dashboard/stats")).json()
+    assert data["pipeline_counts"] == [{"stage": "screening", "count": 1}]
+    assert data["recent_candidates"][0]["stage"] == "screening"
+
+    await authenticated_client.delete(
+        f"/api/candidates/{candidate_id}/positions/{position.id}"
+    )
+    data = (await authenticated_client.get("/api/dashboard/stats")).json()
+    assert data["pipeline_counts"] == []
+    assert data["positions_summary"][0]["candidate_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_position_status_and_archive_update_counts(
+    authenticated_client: AsyncClient,
+    position: Position,
+):
+    response = await authenticated_client.patch(
+        f"/api/positions/{position.id}", json={"status": "closed"}
+    )
+    assert response.status_code == 200
+    data = (await authenticated_client.get("/api/dashboard/stats")).json()
+    assert data["total_positions"] == 1
+    assert data["open_positions"] == 0
+
+    response = await authenticated_client.post(f"/api/positions/{position.id}/archive")
+    assert response.status_code == 200
+    data = (await authenticated_client.get("/api/dashboard/stats")).json()
+    assert data["total_positions"] == 0
+    assert data["positions_summary"] == []
+
+
+@pytest.mark.asyncio
+async def test_candidate_rename_and_archive_refresh_cached_stats(
+    authenticated_client: AsyncClient,
+):
+    response = await authenticated_client.post(
+        "/api/candidates",
+        json={"full_name": "Jane Doe", "email": "jane@example.com"},
+    )
+    candidate_id = response.json()["id"]
+    await authenticated_client.get("/api/dashboard/stats")
+
+    await authenticated_client.patch(
+        f"/api/candidates/{candidate_id}", json={"full_name": "Jane Smith"}
+    )
+    data = (await authenticated_client.get("/api/dashboard/stats")).json()
+    assert data["recent_candidates"][0]["full_name"] == "Jane Smith"
+
+    await authenticated_client.post(f"/api/candidates/{candidate_id}/archive")
+    data = (await authenticated_client.get("/api/dashboard/stats")).json()
+    assert data["total_candidates"] == 0
+    assert data["recent_candidates"] == []
+
+
+@pytest.mark.asyncio
+async def test_write_from_another_process_refreshes_cached_stats(
+    authenticated_client: AsyncClient,
+    session: AsyncSession,
+):
+    await authenticated_client.get("/api/dashboard/stats")
+
+    # Another worker's write: it bumps the shared version, not this cache.
+    session.add(Candidate(full_name="Jane Doe", email="jane@example.com"))
+    await dashboard_service.record_candidate(session, 1)
+    await session.commit()
+
+    response = await authenticated_client.get("/api/dashboard/stats")
+    assert response.json()["total_candidates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_counters_matches_the_tables(
+    session: AsyncSession,
+    position: Position,
+):
+    candidate = Candidate(full_name="Jane Doe", email="jane@example.com")
+    session.add(candidate)
+    await session.flush()
+    session.add(
+        CandidatePosition(
+            candidate_id=candidate.id, position_id=position.id, stage="technical"
+        )
+    )
+    await session.commit()
+    await dashboard_service.record_candidate(session, 5)
+    await session.commit()
+
+    await dashboard_service.rebuild_counters(session)
+
+    assert await _counters(session) == {
+        ("candidates", ""): 1,
+        ("positions", ""): 1,
+        ("open_positions", ""): 1,
+        ("stage", "technical"): 1,
+        ("position_candidates", str(position.id)): 1,
+    }
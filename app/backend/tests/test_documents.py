@@ -8,10 +8,12 @@ from app.dependencies.auth import get_current_user
 from app.main import app
 from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
+from app.models.document import Document
 from app.models.enums import DocumentStatus
 from app.models.position import Position
 from app.models.team import Team
 from app.models.user import User
+from tests.helpers import count_statements
 
 
 @pytest.fixture
@@ -750,6 +752,107 @@ async def test_get_nonexistent_document(client: AsyncClient):
     assert "not found" in data["detail"].lower()
 
 
+@patch("app.services.storage_service.generate_view_url")
+@patch("app.services.storage_service.generate_upload_url")
+async def test_get_document_is_a_single_query(
+    mock_generate_upload_url: AsyncMock,
+    mock_generate_view_url: AsyncMock,
+    client: AsyncClient,
+    candidate_position: CandidatePosition,
+    interviewer: User,
+):
+    mock_generate_upload_url.return_value = "https://s3.amazonaws.com/fake-upload-url"
+    mock_generate_view_url.return_value = "https://s3.example.com/view-url"
+
+    presign_response = await client.post(
+        "/api/documents/presign",
+        json={
+            "type": "transcript",
+            "candidate_position_id": candidate_position.id,
+            "file_name": "transcript.txt",
+            "content_type": "text/plain",
+            "file_size": 512000,
+            "interview_stage": "screening",
+            "interviewer_id": interviewer.id,
+            "interview_date": "2025-01-15",
+        },
+    )
+    document_id = presign_response.json()["document_id"]
+    await client.post(f"/api/documents/{document_id}/complete")
+
+    with count_statements() as statements:
+        get_response = await client.get(f"/api/documents/{document_id}")
+
+    assert get_response.status_code == 200
+    data = get_response.json()
+    assert data["interviewer_name"] == "Jane Interviewer"
+    assert data["uploaded_by_name"] == "Test User"
+    assert len(statements) == 1
+
+
+@patch("app.services.storage_service.generate_view_url")
+async def test_get_document_allowed_for_uploader_on_sibling_position(
+    mock_generate_view_url: AsyncMock,
+    client: AsyncClient,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+    test_user: User,
+):
+    mock_generate_view_url.return_value = "https://s3.example.com/view-url"
+
+    other_manager = User(
+        email="other-hm@provectus.com",
+        google_id="otherhm123",
+        full_name="Other Manager",
+    )
+    session.add(other_manager)
+    await session.flush()
+    position = await session.get(Position, candidate_position.position_id)
+    other_position = Position(
+        title="Data Engineer",
+        team_id=position.team_id,
+        hiring_manager_id=other_manager.id,
+        status="open",
+    )
+    session.add(other_position)
+    await session.flush()
+    other_cp = CandidatePosition(
+        candidate_id=candidate_position.candidate_id,
+        position_id=other_position.id,
+        stage="new",
+    )
+    session.add(other_cp)
+    await session.flush()
+
+    own_document = Document(
+        type="cv",
+        candidate_position_id=candidate_position.id,
+        file_name="resume.pdf",
+        s3_key="documents/own/resume.pdf",
+        content_type="application/pdf",
+        status=DocumentStatus.active,
+        input_method="file",
+        uploaded_by_id=test_user.id,
+    )
+    sibling_document = Document(
+        type="cv",
+        candidate_position_id=other_cp.id,
+        file_name="resume-v2.pdf",
+        s3_key="documents/sibling/resume-v2.pdf",
+        content_type="application/pdf",
+        status=DocumentStatus.active,
+        input_method="file",
+        uploaded_by_id=other_manager.id,
+    )
+    session.add_all([own_document, sibling_document])
+    await session.commit()
+
+    response = await client.get(f"/api/documents/{sibling_document.id}")
+
+    assert response.status_code == 200
+    assert response.json()["uploaded_by_name"] == "Other Manager"
+
+
 @patch("app.services.storage_service.generate_upload_url")
 async def test_list_candidate_documents(
     mock_generate_upload_url: AsyncMock,
@@ -0,0 +1,110 @@
+"""Tests for evaluation status NOTIFY emission and listener fan-out."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.candidate_position import CandidatePosition
+from app.models.enums import EvaluationStatus, EvaluationStepType
+from app.models.evaluation import Evaluation
+from app.services import evaluation_notify_service
+from app.services.evaluation_notify_service import (
+    RESYNC_EVENT,
+    EvaluationStatusListener,
+)
+
+
+def _payload(candidate_position_id: int, status: str = "running") -> str:
+    return json.dumps(
+        {
+            "evaluation_id": 1,
+            "candidate_position_id": candidate_position_id,
+            "step_type": "cv_analysis",
+            "status": status,
+            "version": 1,
+        }
+    )
+
+
+class TestNotifyStatusChange:
+    async def test_noop_on_non_postgres_dialect(
+        self, session: AsyncSession, candidate_position: CandidatePosition
+    ) -> None:
+        evaluation = Evaluation(
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+            status=EvaluationStatus.pending,
+            version=1,
+        )
+        session.add(evaluation)
+        await session.flush()
+
+        await evaluation_notify_service.notify_status_change(session, evaluation)
+        await session.commit()
+
+    async def test_issues_pg_notify_on_postgres(self) -> None:
+        session = MagicMock()
+        session.bind.dialect.name = "postgresql"
+        session.execute = AsyncMock()
+        evaluation = Evaluation(
+            id=7,
+            candidate_position_id=3,
+            step_type=EvaluationStepType.technical_eval,
+            status=EvaluationStatus.running,
+            version=2,
+        )
+
+        await evaluation_notify_service.notify_status_change(session, evaluation)
+
+        stmt = session.execute.await_args.args[0]
+        params = stmt.compile().params
+        payload = json.loads(next(v for v in params.values() if v.startswith("{")))
+        assert "evaluation_status" in params.values()
+        assert payload == {
+            "evaluation_id": 7,
+            "candidate_position_id": 3,
+            "step_type": "technical_eval",
+            "status": "running",
+            "version": 2,
+        }
+
+
+class TestListenerFanOut:
+    async def test_dispatches_only_to_matching_subscribers(self) -> None:
+        listener = EvaluationStatusListener("postgresql://unused")
+
+        async with (
+            listener.subscribe(1) as first,
+            listener.subscribe(1) as second,
+            listener.subscribe(2) as other,
+        ):
+            listener.dispatch(_payload(1))
+
+            assert first.get_nowait()["candidate_position_id"] == 1
+            assert second.get_nowait()["candidate_position_id"] == 1
+            assert other.empty()
+
+        assert listener._subscribers == {}
+
+    async def test_ignores_malformed_payloads(self) -> None:
+        listener = EvaluationStatusListener("postgresql://unused")
+
+        async with listener.subscribe(1) as queue:
+            listener.dispatch("not json")
+            listener.dispatch(json.dumps({"status": "running"}))
+
+            assert queue.empty()
+
+    async def test_full_queue_collapses_to_resync(self) -> None:
+        listener = EvaluationStatusListener("postgresql://unused")
+
+        async with listener.subscribe(1) as queue:
+            for _ in range(queue.maxsize + 1):
+                listener.dispatch(_payload(1))
+
+            assert queue.qsize() == 1
+            assert queue.get_nowait() is RESYNC_EVENT
+
+    async def test_get_listener_requires_live_connection(self) -> None:
+        assert evaluation_notify_service.get_listener() is None
@@ -0,0 +1,232 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.models.candidate_position import CandidatePosition
+from app.models.enums import EvaluationStatus
+from app.models.evaluation import Evaluation
+from app.services import evaluation_service, eventbridge_service
+from app.services.eventbridge_service import OutboxRelay
+from tests.conftest import async_session_factory
+from tests.helpers import get_outbox_events
+
+
+def _accept_all(Entries: list[dict]) -> dict:
+    return {"FailedEntryCount": 0, "Entries": [{"EventId": "x"} for _ in Entries]}
+
+
+def _sent_evaluation_ids(call) -> list[int]:
+    return [json.loads(e["Detail"])["evaluation_id"] for e in call.kwargs["Entries"]]
+
+
+async def _trigger(
+    session: AsyncSession, candidate_position: CandidatePosition, count: int
+) -> list[Evaluation]:
+    return [
+        await evaluation_service.trigger_evaluation(
+            session=session,
+            candidate_position_id=candidate_position.id,
+            step_type="cv_analysis",
+        )
+        for _ in range(count)
+    ]
+
+
+async def test_relay_sends_batches_and_deletes_delivered_rows(
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+):
+    evaluations = await _trigger(session, candidate_position, 12)
+    client = AsyncMock()
+    client.put_events.side_effect = _accept_all
+    relay = OutboxRelay(client, async_session_factory)
+
+    assert await relay.relay_once() == 10
+    assert await relay.relay_once() == 2
+    assert await relay.relay_once() == 0
+
+    sent = [
+        evaluation_id
+        for call in client.put_events.call_args_list
+        for evaluation_id in _sent_evaluation_ids(call)
+    ]
+    assert sent == [evaluation.id for evaluation in evaluations]
+    entry = client.put_events.call_args_list[0].kwargs["Entries"][0]
+    assert entry["EventBusName"] == event_bus
+    assert entry["DetailType"] == "evaluation.requested"
+    assert await get_outbox_events(session) == []
+
+
+async def test_relay_publishes_outside_the_claim_transaction(
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+):
+    await _trigger(session, candidate_position, 2)
+    other_relay = OutboxRelay(AsyncMock(), async_session_factory)
+    seen_during_publish: list[int] = []
+
+    async def put_events(Entries: list[dict]) -> dict:
+        # Rows stay leased to us while no transaction holds them.
+        seen_during_publish.append(await other_relay.relay_once())
+        async with async_session_factory() as other_session:
+            events = await get_outbox_events(other_session)
+            events[0].last_error = "touched while publishing"
+            other_session.add(events[0])
+            await other_session.commit()
+        return _accept_all(Entries)
+
+    client = AsyncMock()
+    client.put_events.side_effect = put_events
+    relay = OutboxRelay(client, async_session_factory)
+
+    assert await relay.relay_once() == 2
+    assert seen_during_publish == [0]
+    assert await get_outbox_events(session) == []
+
+
+async def test_relay_reclaims_rows_after_lease_expires(
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+):
+    await _trigger(session, candidate_position, 1)
+    client = AsyncMock()
+    client.put_events.side_effect = RuntimeError("process died mid-publish")
+    relay = OutboxRelay(client, async_session_factory)
+
+    with pytest.raises(RuntimeError):
+        await relay.relay_once()
+    assert await relay.relay_once() == 0
+
+    session.expire_all()
+    (event,) = await get_outbox_events(session)
+    event.next_attempt_at -= eventbridge_service.CLAIM_TIMEOUT
+    session.add(event)
+    await session.commit()
+
+    client.put_events.side_effect = _accept_all
+    assert await relay.relay_once() == 1
+
+
+async def test_relay_retries_only_rejected_entries_later(
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+):
+    evaluations = await _trigger(session, candidate_position, 3)
+    rejected_id = evaluations[1].id
+    (original,) = [
+        e for e in await get_outbox_events(session) if e.evaluation_id == rejected_id
+    ]
+    enqueued_at = original.next_attempt_at
+    client = AsyncMock()
+    client.put_events.return_value = {
+        "FailedEntryCount": 1,
+        "Entries": [
+            {"EventId": "a"},
+            {"ErrorCode": "ThrottlingException", "ErrorMessage": "slow down"},
+            {"EventId": "c"},
+        ],
+    }
+    relay = OutboxRelay(client, async_session_factory)
+
+    assert await relay.relay_once() == 3
+    # The rejected row is backed off, so nothing is due yet.
+    assert await relay.relay_once() == 0
+
+    session.expire_all()
+    events = await get_outbox_events(session)
+    assert len(events) == 1
+    assert events[0].evaluation_id == rejected_id
+    assert events[0].attempts == 1
+    assert events[0].last_error == "ThrottlingException: slow down"
+    assert events[0].next_attempt_at > enqueued_at
+
+
+async def test_relay_keeps_rows_when_put_events_fails(
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+):
+    await _trigger(session, candidate_position, 2)
+    client = AsyncMock()
+    client.put_events.side_effect = ClientError(
+        {"Error": {"Code": "InternalException", "Message": "boom"}}, "PutEvents"
+    )
+    relay = OutboxRelay(client, async_session_factory)
+
+    await relay.relay_once()
+
+    session.expire_all()
+    events = await get_outbox_events(session)
+    assert [event.attempts for event in events] == [1, 1]
+
+
+async def test_relay_fails_evaluation_after_max_attempts(
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+):
+    (evaluation,) = await _trigger(session, candidate_position, 1)
+    (event,) = await get_outbox_events(session)
+    event.attempts = eventbridge_service.MAX_ATTEMPTS - 1
+    session.add(event)
+    await session.commit()
+
+    client = AsyncMock()
+    client.put_events.return_value = {
+        "FailedEntryCount": 1,
+        "Entries": [{"ErrorCode": "InternalFailure"}],
+    }
+    relay = OutboxRelay(client, async_session_factory)
+
+    await relay.relay_once()
+
+    assert await get_outbox_events(session) == []
+    await session.refresh(evaluation)
+    assert evaluation.status == EvaluationStatus.failed
+    assert evaluation.error_message == "Failed to publish evaluation event"
+
+
+async def test_trigger_evaluation_does_not_call_eventbridge(
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+):
+    session_cls = AsyncMock()
+    original = eventbridge_service._session
+    eventbridge_service._session = session_cls
+    try:
+        await _trigger(session, candidate_position, 1)
+    finally:
+        eventbridge_service._session = original
+
+    session_cls.client.assert_not_called()
+    assert len(await get_outbox_events(session)) == 1
+
+
+async def test_start_relay_fails_without_bus_outside_debug():
+    with (
+        patch.object(settings, "debug", False),
+        patch.object(settings, "evaluation_event_bus_name", ""),
+        pytest.raises(RuntimeError, match="EVALUATION_EVENT_BUS_NAME"),
+    ):
+        await eventbridge_service.start_relay()
+
+    assert eventbridge_service._relay is None
+
+
+async def test_start_relay_skipped_without_bus_in_debug():
+    with (
+        patch.object(settings, "debug", True),
+        patch.object(settings, "evaluation_event_bus_name", ""),
+    ):
+        await eventbridge_service.start_relay()
+
+    assert eventbridge_service._relay is None
@@ -1,16 +1,18 @@
-from unittest.mock import AsyncMock, patch
-
 import pytest
 from httpx import AsyncClient
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.exceptions import NotFoundException
+from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
 from app.models.enums import EvaluationStatus, EvaluationStepType
 from app.models.evaluation import Evaluation
+from app.models.position import Position
+from app.models.position_rubric import PositionRubric, PositionRubricVersion
+from app.models.user import User
 from app.services import evaluation_service
-
-_PUBLISH_PATH = "app.services.eventbridge_service.publish_evaluation_event"
+from tests.helpers import VALID_RUBRIC_STRUCTURE, get_outbox_events
 
 
 async def _seed_evaluation(
@@ -36,10 +38,8 @@ async def _seed_evaluation(
 
 
 class TestRerunEvaluation:
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_rerun_creates_new_version_incrementing_from_latest(
         self,
-        mock_publish: AsyncMock,
         session: AsyncSession,
         candidate_position: CandidatePosition,
     ) -> None:
@@ -63,10 +63,9 @@ class TestRerunEvaluation:
         assert rerun.source_document_id == 10
         assert rerun.rubric_version_id == 5
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_rerun_publishes_eventbridge_event(
         self,
-        mock_publish: AsyncMock,
+        event_bus: str,
         session: AsyncSession,
         candidate_position: CandidatePosition,
     ) -> None:
@@ -82,18 +81,20 @@ class TestRerunEvaluation:
             step_type=EvaluationStepType.cv_analysis,
         )
 
-        mock_publish.assert_called_once_with(
-            evaluation_id=result[0].id,
-            candidate_position_id=candidate_position.id,
-            step_type=EvaluationStepType.cv_analysis,
-            source_document_id=10,
-            rubric_version_id=5,
-        )
+        events = await get_outbox_events(session)
+        assert len(events) == 1
+        assert events[0].evaluation_id == result[0].id
+        assert events[0].detail == {
+            "evaluation_id": result[0].id,
+            "candidate_position_id": candidate_position.id,
+            "step_type": EvaluationStepType.cv_analysis,
+            "source_document_id": 10,
+            "rubric_version_id": 5,
+        }
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_rerun_does_not_cascade_to_recommendation(
         self,
-        mock_publish: AsyncMock,
+        event_bus: str,
         session: AsyncSession,
         candidate_position: CandidatePosition,
     ) -> None:
@@ -117,12 +118,11 @@ class TestRerunEvaluation:
 
         assert len(result) == 1
         assert result[0].step_type == EvaluationStepType.cv_analysis
-        mock_publish.assert_called_once()
+        assert len(await get_outbox_events(session)) == 1
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_rerun_recommendation_has_no_cascade(
         self,
-        mock_publish: AsyncMock,
+        event_bus: str,
         session: AsyncSession,
         candidate_position: CandidatePosition,
     ) -> None:
@@ -143,12 +143,11 @@ class TestRerunEvaluation:
         assert len(result) == 1
         assert result[0].step_type == EvaluationStepType.recommendation
         assert result[0].version == 2
-        mock_publish.assert_called_once()
+        assert len(await get_outbox_events(session)) == 1
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_rerun_feedback_gen_has_no_cascade(
         self,
-        mock_publish: AsyncMock,
+        event_bus: str,
         session: AsyncSession,
         candidate_position: CandidatePosition,
     ) -> None:
@@ -168,7 +167,7 @@ class TestRerunEvaluation:
 
         assert len(result) == 1
         assert result[0].step_type == EvaluationStepType.feedback_gen
-        mock_publish.assert_called_once()
+        assert len(await get_outbox_events(session)) == 1
 
     async def test_rerun_raises_not_found_when_no_evaluation_exists(
         self,
@@ -182,10 +181,8 @@ class TestRerunEvaluation:
                 step_type=EvaluationStepType.cv_analysis,
             )
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_old_versions_preserved_in_history(
         self,
-        mock_publish: AsyncMock,
         session: AsyncSession,
         candidate_position: CandidatePosition,
     ) -> None:
@@ -213,10 +210,8 @@ class TestRerunEvaluation:
 
 
 class TestRerunEvaluationEndpoint:
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_post_rerun_returns_200_with_created_evaluations(
         self,
-        mock_publish: AsyncMock,
         authenticated_client: AsyncClient,
         session: AsyncSession,
         candidate_position: CandidatePosition,
@@ -240,10 +235,34 @@ class TestRerunEvaluationEndpoint:
         assert item["version"] == 2
         assert item["status"] == EvaluationStatus.pending
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
+    async def test_post_rerun_fresh_skips_response_cache(
+        self,
+        authenticated_client: AsyncClient,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+        )
+        step = EvaluationStepType.cv_analysis
+        url = f"/api/evaluations/{candidate_position.id}/{step}/rerun"
+
+        cached = await authenticated_client.post(url)
+        fresh = await authenticated_client.post(url, params={"fresh": "true"})
+
+        assert cached.status_code == 200
+        assert fresh.status_code == 200
+        reruns = {
+            e.version: e
+            for e in (await session.execute(select(Evaluation))).scalars().all()
+        }
+        assert reruns[2].skip_response_cache is False
+        assert reruns[3].skip_response_cache is True
+
     async def test_post_rerun_returns_404_when_no_prior_evaluation(
         self,
-        mock_publish: AsyncMock,
         authenticated_client: AsyncClient,
         candidate_position: CandidatePosition,
     ) -> None:
@@ -264,10 +283,8 @@ class TestRerunEvaluationEndpoint:
 
         assert response.status_code == 401
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_post_rerun_technical_eval_returns_single_item_no_cascade(
         self,
-        mock_publish: AsyncMock,
         authenticated_client: AsyncClient,
         session: AsyncSession,
         candidate_position: CandidatePosition,
@@ -287,10 +304,8 @@ class TestRerunEvaluationEndpoint:
         assert len(data["items"]) == 1
         assert data["items"][0]["step_type"] == EvaluationStepType.technical_eval
 
-    @patch(_PUBLISH_PATH, new_callable=AsyncMock)
     async def test_history_endpoint_shows_all_versions_after_rerun(
         self,
-        mock_publish: AsyncMock,
         authenticated_client: AsyncClient,
         session: AsyncSession,
         candidate_position: CandidatePosition,
@@ -314,3 +329,264 @@ class TestRerunEvaluationEndpoint:
         assert len(data["items"]) == 2
         assert data["items"][0]["version"] == 2
         assert data["items"][1]["version"] == 1
+
+
+async def _add_candidate_position(
+    session: AsyncSession, position_id: int, email: str
+) -> CandidatePosition:
+    candidate = Candidate(full_name=email.split("@")[0], email=email)
+    session.add(candidate)
+    await session.flush()
+    cp = CandidatePosition(
+        candidate_id=candidate.id, position_id=position_id, stage="new"
+    )
+    session.add(cp)
+    await session.commit()
+    await session.refresh(cp)
+    return cp
+
+
+class TestBulkRerunEvaluations:
+    async def test_reruns_every_evaluated_candidate_on_position(
+        self,
+        event_bus: str,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        second = await _add_candidate_position(
+            session, candidate_position.position_id, "bob@example.com"
+        )
+        unevaluated = await _add_candidate_position(
+            session, candidate_position.position_id, "carol@example.com"
+        )
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.technical_eval
+        )
+        await _seed_evaluation(session, second.id, EvaluationStepType.technical_eval)
+        await _seed_evaluation(
+            session,
+            second.id,
+            EvaluationStepType.technical_eval,
+            source_document_id=11,
+        )
+        await _seed_evaluation(session, second.id, EvaluationStepType.cv_analysis)
+
+        result = await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.technical_eval,
+            user_id=test_user.id,
+            position_id=candidate_position.position_id,
+        )
+
+        by_cp = {e.candidate_position_id: e for e in result}
+        assert set(by_cp) == {candidate_position.id, second.id}
+        assert unevaluated.id not in by_cp
+        assert by_cp[candidate_position.id].version == 2
+        assert by_cp[second.id].version == 3
+        assert by_cp[second.id].source_document_id == 11
+        assert all(e.status == EvaluationStatus.pending for e in result)
+
+        events = await get_outbox_events(session)
+        assert sorted(e.evaluation_id for e in events) == sorted(
+            by_cp[cp].id for cp in by_cp
+        )
+
+    async def test_reruns_only_listed_candidate_positions(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        second = await _add_candidate_position(
+            session, candidate_position.position_id, "bob@example.com"
+        )
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+        await _seed_evaluation(session, second.id, EvaluationStepType.cv_analysis)
+
+        result = await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.cv_analysis,
+            user_id=test_user.id,
+            candidate_position_ids=[second.id],
+        )
+
+        assert [e.candidate_position_id for e in result] == [second.id]
+
+    async def test_fresh_bulk_rerun_skips_response_cache(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+
+        cached = await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.cv_analysis,
+            user_id=test_user.id,
+            position_id=candidate_position.position_id,
+        )
+        fresh = await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.cv_analysis,
+            user_id=test_user.id,
+            position_id=candidate_position.position_id,
+            fresh=True,
+        )
+
+        assert [e.skip_response_cache for e in cached] == [False]
+        assert [e.skip_response_cache for e in fresh] == [True]
+
+    async def test_single_creates_continue_after_bulk_rerun(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+        await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.cv_analysis,
+            user_id=test_user.id,
+            candidate_position_ids=[candidate_position.id],
+        )
+
+        evaluation = await evaluation_service.create_evaluation(
+            session=session,
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+        )
+
+        assert evaluation.version == 3
+
+    async def test_skips_candidate_positions_without_access(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        other_manager = User(
+            email="other-hm@provectus.com",
+            google_id="otherhm123",
+            full_name="Other Manager",
+        )
+        session.add(other_manager)
+        await session.flush()
+        position = await session.get(Position, candidate_position.position_id)
+        other_position = Position(
+            title="Data Engineer",
+            team_id=position.team_id,
+            hiring_manager_id=other_manager.id,
+            status="open",
+        )
+        session.add(other_position)
+        await session.commit()
+        foreign = await _add_candidate_position(
+            session, other_position.id, "dave@example.com"
+        )
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+        await _seed_evaluation(session, foreign.id, EvaluationStepType.cv_analysis)
+
+        result = await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.cv_analysis,
+            user_id=test_user.id,
+            candidate_position_ids=[candidate_position.id, foreign.id],
+        )
+
+        assert [e.candidate_position_id for e in result] == [candidate_position.id]
+
+    async def test_latest_rubric_uses_newest_rubric_version(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        rubric = PositionRubric(position_id=candidate_position.position_id)
+        session.add(rubric)
+        await session.flush()
+        versions = [
+            PositionRubricVersion(
+                position_rubric_id=rubric.id,
+                version_number=number,
+                structure=VALID_RUBRIC_STRUCTURE,
+                created_by_id=test_user.id,
+            )
+            for number in (1, 2)
+        ]
+        session.add_all(versions)
+        await session.commit()
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.technical_eval,
+            rubric_version_id=versions[0].id,
+        )
+
+        kept = await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.technical_eval,
+            user_id=test_user.id,
+            position_id=candidate_position.position_id,
+        )
+        refreshed = await evaluation_service.bulk_rerun_evaluations(
+            session=session,
+            step_type=EvaluationStepType.technical_eval,
+            user_id=test_user.id,
+            position_id=candidate_position.position_id,
+            latest_rubric=True,
+        )
+
+        assert kept[0].rubric_version_id == versions[0].id
+        assert refreshed[0].rubric_version_id == versions[1].id
+        assert refreshed[0].version == 3
+
+
+class TestBulkRerunEndpoint:
+    async def test_post_bulk_rerun_returns_created_evaluations(
+        self,
+        authenticated_client: AsyncClient,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+
+        response = await authenticated_client.post(
+            "/api/evaluations/rerun",
+            json={
+                "step_type": EvaluationStepType.cv_analysis,
+                "position_id": candidate_position.position_id,
+            },
+        )
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert len(items) == 1
+        assert items[0]["version"] == 2
+
+    @pytest.mark.parametrize(
+        "target",
+        [{}, {"position_id": 1, "candidate_position_ids": [1]}],
+    )
+    async def test_post_bulk_rerun_requires_exactly_one_target(
+        self,
+        authenticated_client: AsyncClient,
+        target: dict[str, object],
+    ) -> None:
+        response = await authenticated_client.post(
+            "/api/evaluations/rerun",
+            json={"step_type": EvaluationStepType.cv_analysis, **target},
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,518 @@
+"""Tests for automatic scheduling of dependent evaluation steps."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.models.candidate_position import CandidatePosition
+from app.models.document import Document
+from app.models.enums import (
+    DocumentStatus,
+    DocumentType,
+    EvaluationStatus,
+    EvaluationStepType,
+    InterviewStage,
+)
+from app.models.evaluation import Evaluation
+from app.models.user import User
+from app.services import evaluation_service
+from app.services.evaluation_notify_service import (
+    RESYNC_EVENT,
+    EvaluationStatusListener,
+)
+from app.services.evaluation_scheduler_service import DependencyScheduler
+from tests.conftest import async_session_factory
+from tests.helpers import get_outbox_events
+
+
+async def _seed_evaluation(
+    session: AsyncSession,
+    candidate_position_id: int,
+    step_type: EvaluationStepType,
+    status: EvaluationStatus = EvaluationStatus.completed,
+    completed_at: datetime | None = None,
+) -> Evaluation:
+    evaluation = await evaluation_service.create_evaluation(
+        session=session,
+        candidate_position_id=candidate_position_id,
+        step_type=step_type,
+    )
+    evaluation.status = status
+    if status == EvaluationStatus.completed:
+        evaluation.completed_at = completed_at or evaluation.created_at
+    session.add(evaluation)
+    await session.commit()
+    await session.refresh(evaluation)
+    return evaluation
+
+
+async def _add_document(
+    session: AsyncSession,
+    candidate_position_id: int,
+    uploaded_by_id: int,
+    doc_type: DocumentType,
+    interview_stage: InterviewStage | None = None,
+) -> None:
+    session.add(
+        Document(
+            type=doc_type,
+            candidate_position_id=candidate_position_id,
+            s3_key=f"documents/{doc_type}-{interview_stage}",
+            content_type="text/plain",
+            status=DocumentStatus.active,
+            interview_stage=interview_stage,
+            uploaded_by_id=uploaded_by_id,
+        )
+    )
+    await session.commit()
+
+
+async def _recommendations(
+    session: AsyncSession, candidate_position_id: int
+) -> list[Evaluation]:
+    result = await session.exec(
+        select(Evaluation)
+        .where(
+            Evaluation.candidate_position_id == candidate_position_id,
+            Evaluation.step_type == EvaluationStepType.recommendation,
+        )
+        .order_by(Evaluation.version)
+    )
+    return list(result.all())
+
+
+class TestTriggerDependentEvaluations:
+    async def test_triggers_recommendation_once_upstream_steps_complete(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        event_bus: str,
+    ) -> None:
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.screening_eval
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+
+        assert [evaluation.step_type for evaluation in triggered] == [
+            EvaluationStepType.recommendation
+        ]
+        assert triggered[0].status == EvaluationStatus.pending
+        assert triggered[0].version == 1
+        events = await get_outbox_events(session)
+        assert [event.detail["step_type"] for event in events] == ["recommendation"]
+
+    async def test_waits_for_upstream_steps_in_flight(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.technical_eval,
+            status=EvaluationStatus.running,
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+
+        assert triggered == []
+        assert await _recommendations(session, candidate_position.id) == []
+
+    async def test_skips_when_no_upstream_step_completed(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+            status=EvaluationStatus.failed,
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+
+        assert triggered == []
+
+    async def test_repeated_checks_queue_a_single_run(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+
+        for _ in range(3):
+            await evaluation_service.trigger_dependent_evaluations(
+                session, candidate_position.id
+            )
+
+        recommendations = await _recommendations(session, candidate_position.id)
+        assert len(recommendations) == 1
+
+    async def test_skips_when_recommendation_postdates_upstream_results(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        recommendation = await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.recommendation
+        )
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+            completed_at=recommendation.created_at - timedelta(minutes=1),
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+
+        assert triggered == []
+
+    async def test_reruns_recommendation_after_newer_upstream_result(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        recommendation = await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.recommendation
+        )
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.screening_eval,
+            completed_at=recommendation.created_at + timedelta(minutes=1),
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+
+        assert [evaluation.version for evaluation in triggered] == [2]
+
+    async def test_skips_while_recommendation_is_pending(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        recommendation = await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.recommendation,
+            status=EvaluationStatus.pending,
+        )
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+            completed_at=recommendation.created_at + timedelta(minutes=1),
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+
+        assert triggered == []
+
+    async def test_waits_for_step_queued_by_an_uploaded_document(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        await _add_document(
+            session, candidate_position.id, test_user.id, DocumentType.cv
+        )
+        await _add_document(
+            session,
+            candidate_position.id,
+            test_user.id,
+            DocumentType.transcript,
+            InterviewStage.screening,
+        )
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+        assert triggered == []
+
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.screening_eval
+        )
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+        assert [evaluation.version for evaluation in triggered] == [1]
+
+    async def test_technical_transcript_without_rubric_is_not_awaited(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        await _add_document(
+            session,
+            candidate_position.id,
+            test_user.id,
+            DocumentType.transcript,
+            InterviewStage.technical,
+        )
+        await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+
+        triggered = await evaluation_service.trigger_dependent_evaluations(
+            session, candidate_position.id
+        )
+
+        assert [evaluation.step_type for evaluation in triggered] == [
+            EvaluationStepType.recommendation
+        ]
+
+    async def test_late_upstream_result_runs_recommendation_again(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        cv = await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.cv_analysis
+        )
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.recommendation,
+            completed_at=cv.completed_at,
+        )
+        recommendation = (await _recommendations(session, candidate_position.id))[0]
+
+        # A screening transcript uploaded after the first recommendation.
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.screening_eval,
+            completed_at=recommendation.created_at + timedelta(minutes=1),
+        )
+        for _ in range(2):
+            await evaluation_service.trigger_dependent_evaluations(
+                session, candidate_position.id
+            )
+
+        recommendations = await _recommendations(session, candidate_position.id)
+        assert [evaluation.version for evaluation in recommendations] == [1, 2]
+
+
+_SINCE = datetime(2025, 12, 1)
+
+
+class TestCandidatePositionsToReconcile:
+    async def test_finds_upstream_results_newer_than_the_recommendation(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+            completed_at=datetime(2026, 1, 1),
+        )
+
+        assert await evaluation_service.candidate_positions_to_reconcile(
+            session, _SINCE
+        ) == [candidate_position.id]
+
+        recommendation = await _seed_evaluation(
+            session, candidate_position.id, EvaluationStepType.recommendation
+        )
+        assert (
+            await evaluation_service.candidate_positions_to_reconcile(session, _SINCE)
+            == []
+        )
+
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.technical_eval,
+            completed_at=recommendation.created_at + timedelta(minutes=1),
+        )
+        assert await evaluation_service.candidate_positions_to_reconcile(
+            session, _SINCE
+        ) == [candidate_position.id]
+
+    async def test_ignores_upstream_steps_that_did_not_complete(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+            status=EvaluationStatus.failed,
+        )
+
+        assert (
+            await evaluation_service.candidate_positions_to_reconcile(session, _SINCE)
+            == []
+        )
+
+    async def test_skips_completions_before_the_window(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+            completed_at=datetime(2025, 6, 1),
+        )
+
+        assert (
+            await evaluation_service.candidate_positions_to_reconcile(session, _SINCE)
+            == []
+        )
+        assert await evaluation_service.candidate_positions_to_reconcile(
+            session, datetime(2025, 1, 1)
+        ) == [candidate_position.id]
+
+
+def _event(
+    candidate_position_id: int,
+    step_type: str = "cv_analysis",
+    status: str = "completed",
+) -> dict[str, object]:
+    return {
+        "evaluation_id": 1,
+        "candidate_position_id": candidate_position_id,
+        "step_type": step_type,
+        "status": status,
+        "version": 1,
+    }
+
+
+class TestDependencyScheduler:
+    async def test_debounces_completions_per_candidate_position(self) -> None:
+        scheduler = DependencyScheduler(debounce_seconds=0.01)
+        with patch.object(scheduler, "schedule", new=AsyncMock()) as schedule:
+            scheduler.on_status_change(_event(1))
+            scheduler.on_status_change(_event(1, step_type="screening_eval"))
+            scheduler.on_status_change(_event(2))
+            await asyncio.sleep(0.05)
+            await scheduler.stop()
+
+        assert sorted(call.args[0] for call in schedule.await_args_list) == [1, 2]
+
+    async def test_ignores_other_statuses_and_downstream_steps(self) -> None:
+        scheduler = DependencyScheduler(debounce_seconds=0)
+        with patch.object(scheduler, "schedule", new=AsyncMock()) as schedule:
+            scheduler.on_status_change(_event(1, status="running"))
+            scheduler.on_status_change(_event(1, step_type="recommendation"))
+            await asyncio.sleep(0.01)
+            await scheduler.stop()
+
+        schedule.assert_not_awaited()
+
+    async def test_listener_forwards_events_to_observers(self) -> None:
+        listener = EvaluationStatusListener("postgresql://unused")
+        received: list[dict[str, object]] = []
+        listener.observe(received.append)
+
+        listener.dispatch(
+            '{"candidate_position_id": 4, "status": "completed", '
+            '"step_type": "cv_analysis"}'
+        )
+
+        assert received == [
+            {
+                "candidate_position_id": 4,
+                "status": "completed",
+                "step_type": "cv_analysis",
+            }
+        ]
+
+    async def test_resync_reconciles_candidate_positions(self) -> None:
+        @asynccontextmanager
+        async def session_factory():  # type: ignore[no-untyped-def]
+            yield MagicMock()
+
+        scheduler = DependencyScheduler(session_factory=session_factory)
+        with (
+            patch.object(
+                evaluation_service,
+                "candidate_positions_to_reconcile",
+                new=AsyncMock(return_value=[3, 5]),
+            ),
+            patch.object(scheduler, "schedule", new=AsyncMock()) as schedule,
+        ):
+            scheduler.on_status_change(RESYNC_EVENT)
+            await scheduler.stop()
+
+        assert [call.args[0] for call in schedule.await_args_list] == [3, 5]
+
+    async def test_reconcile_leaves_pre_existing_history_alone(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        # Completed long before the scheduler existed, never followed up.
+        await _seed_evaluation(
+            session,
+            candidate_position.id,
+            EvaluationStepType.cv_analysis,
+            completed_at=datetime.now(UTC).replace(tzinfo=None) - timedelta(days=30),
+        )
+        scheduler = DependencyScheduler(session_factory=async_session_factory)
+
+        with (
+            patch.object(settings, "evaluation_reconcile_window_hours", 24.0),
+            patch.object(scheduler, "schedule", new=AsyncMock()) as schedule,
+        ):
+            await scheduler.reconcile()
+            schedule.assert_not_awaited()
+
+            with patch.object(settings, "evaluation_reconcile_window_hours", 24.0 * 60):
+                await scheduler.reconcile()
+            schedule.assert_awaited_once_with(candidate_position.id)
+
+    async def test_listener_sends_resync_to_observers_on_connect(self) -> None:
+        listener = EvaluationStatusListener("postgresql://unused")
+        received: list[dict[str, object]] = []
+        listener.observe(received.append)
+        connection = MagicMock()
+        connection.add_listener = AsyncMock()
+        connection.close = AsyncMock()
+
+        with patch(
+            "app.services.evaluation_notify_service.asyncpg.connect",
+            new=AsyncMock(return_value=connection),
+        ):
+            await listener.start()
+            await asyncio.wait_for(listener._connected.wait(), timeout=1)
+            await listener.stop()
+
+        assert received == [RESYNC_EVENT]
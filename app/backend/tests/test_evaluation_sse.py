@@ -1,7 +1,9 @@
 """Tests for the SSE evaluation status stream endpoint."""
 
+import asyncio
 import json
 from contextlib import asynccontextmanager
+from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
 from httpx import AsyncClient
@@ -10,6 +12,9 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models.candidate_position import CandidatePosition
 from app.models.enums import EvaluationStatus, EvaluationStepType
 from app.models.evaluation import Evaluation
+from app.models.position import Position
+from app.models.user import User
+from app.services.evaluation_notify_service import EvaluationStatusListener
 
 
 def _parse_sse_events(raw: str) -> list[dict[str, str]]:
@@ -94,6 +99,7 @@ class TestSSENoEvaluations:
                     step_type=EvaluationStepType.cv_analysis,
                     status=EvaluationStatus.completed,
                     version=1,
+                    updated_at=datetime(2026, 1, 1),
                 )
                 return [terminal]
             return []
@@ -213,3 +219,329 @@ class TestSSETerminalState:
     ) -> None:
         response = await client.get(f"/api/evaluations/{candidate_position.id}/stream")
         assert response.status_code == 401
+
+    async def test_revoked_access_applies_to_the_next_stream(
+        self,
+        authenticated_client: AsyncClient,
+        candidate_position: CandidatePosition,
+        session: AsyncSession,
+    ) -> None:
+        session.add(
+            Evaluation(
+                candidate_position_id=candidate_position.id,
+                step_type=EvaluationStepType.cv_analysis,
+                status=EvaluationStatus.completed,
+                version=1,
+            )
+        )
+        await session.commit()
+        url = f"/api/evaluations/{candidate_position.id}/stream"
+
+        with (
+            patch(
+                "app.routers.evaluations.async_session_factory",
+                make_session_factory_mock(session),
+            ),
+            patch("app.routers.evaluations.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            async with authenticated_client.stream("GET", url) as response:
+                assert response.status_code == 200
+                await response.aread()
+
+        other_manager = User(
+            email="other@provectus.com", google_id="other", full_name="Other"
+        )
+        session.add(other_manager)
+        await session.flush()
+        position = await session.get(Position, candidate_position.position_id)
+        assert position is not None
+        position.hiring_manager_id = other_manager.id
+        session.add(position)
+        await session.commit()
+
+        response = await authenticated_client.get(url)
+        assert response.status_code == 404
+
+
+async def _dispatch_when_subscribed(
+    listener: EvaluationStatusListener,
+    candidate_position_id: int,
+    payloads: list[dict[str, object]],
+) -> None:
+    while candidate_position_id not in listener._subscribers:
+        await asyncio.sleep(0)
+    for payload in payloads:
+        listener.dispatch(json.dumps(payload))
+
+
+class TestSSEPushMode:
+    async def test_streams_notified_transitions_without_polling(
+        self,
+        authenticated_client: AsyncClient,
+        candidate_position: CandidatePosition,
+        session: AsyncSession,
+    ) -> None:
+        evaluation = Evaluation(
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+            status=EvaluationStatus.pending,
+            version=1,
+        )
+        session.add(evaluation)
+        await session.commit()
+        await session.refresh(evaluation)
+
+        listener = EvaluationStatusListener("postgresql://unused")
+        listener._connected.set()
+        base = {
+            "evaluation_id": evaluation.id,
+            "candidate_position_id": candidate_position.id,
+            "step_type": EvaluationStepType.cv_analysis,
+            "version": 1,
+        }
+        dispatcher = asyncio.create_task(
+            _dispatch_when_subscribed(
+                listener,
+                candidate_position.id,
+                [
+                    {**base, "status": EvaluationStatus.running},
+                    {**base, "status": EvaluationStatus.completed},
+                ],
+            )
+        )
+
+        get_evaluations = AsyncMock(return_value=[evaluation])
+        with (
+            patch(
+                "app.routers.evaluations.async_session_factory",
+                make_session_factory_mock(session),
+            ),
+            patch(
+                "app.routers.evaluations.evaluation_notify_service.get_listener",
+                return_value=listener,
+            ),
+            patch(
+                "app.routers.evaluations.evaluation_service.get_evaluations",
+                get_evaluations,
+            ),
+        ):
+            async with authenticated_client.stream(
+                "GET",
+                f"/api/evaluations/{candidate_position.id}/stream",
+            ) as response:
+                assert response.status_code == 200
+                body = (await response.aread()).decode()
+        await dispatcher
+
+        events = _parse_sse_events(body)
+        statuses = [
+            json.loads(e["data"])["status"]
+            for e in events
+            if e.get("event") == "status_change"
+        ]
+        assert statuses == [
+            EvaluationStatus.pending,
+            EvaluationStatus.running,
+            EvaluationStatus.completed,
+        ]
+        assert events[-1]["event"] == "done"
+        assert get_evaluations.await_count == 1
+        assert candidate_position.id not in listener._subscribers
+
+    async def test_ignores_notifications_for_older_versions(
+        self,
+        authenticated_client: AsyncClient,
+        candidate_position: CandidatePosition,
+        session: AsyncSession,
+    ) -> None:
+        evaluation = Evaluation(
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+            status=EvaluationStatus.running,
+            version=2,
+        )
+        session.add(evaluation)
+        await session.commit()
+        await session.refresh(evaluation)
+
+        listener = EvaluationStatusListener("postgresql://unused")
+        listener._connected.set()
+        dispatcher = asyncio.create_task(
+            _dispatch_when_subscribed(
+                listener,
+                candidate_position.id,
+                [
+                    {
+                        "evaluation_id": 1000,
+                        "candidate_position_id": candidate_position.id,
+                        "step_type": EvaluationStepType.cv_analysis,
+                        "status": EvaluationStatus.failed,
+                        "version": 1,
+                    },
+                    {
+                        "evaluation_id": evaluation.id,
+                        "candidate_position_id": candidate_position.id,
+                        "step_type": EvaluationStepType.cv_analysis,
+                        "status": EvaluationStatus.completed,
+                        "version": 2,
+                    },
+                ],
+            )
+        )
+
+        with (
+            patch(
+                "app.routers.evaluations.async_session_factory",
+                make_session_factory_mock(session),
+            ),
+            patch(
+                "app.routers.evaluations.evaluation_notify_service.get_listener",
+                return_value=listener,
+            ),
+        ):
+            async with authenticated_client.stream(
+                "GET",
+                f"/api/evaluations/{candidate_position.id}/stream",
+            ) as response:
+                body = (await response.aread()).decode()
+        await dispatcher
+
+        events = _parse_sse_events(body)
+        status_changes = [
+            json.loads(e["data"]) for e in events if e.get("event") == "status_change"
+        ]
+        assert {e["evaluation_id"] for e in status_changes} == {evaluation.id}
+        assert status_changes[-1]["status"] == EvaluationStatus.completed
+
+    async def test_partial_result_emits_result_update(
+        self,
+        authenticated_client: AsyncClient,
+        candidate_position: CandidatePosition,
+        session: AsyncSession,
+    ) -> None:
+        evaluation = Evaluation(
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.technical_eval,
+            status=EvaluationStatus.running,
+            version=1,
+        )
+        session.add(evaluation)
+        await session.commit()
+        await session.refresh(evaluation)
+
+        listener = EvaluationStatusListener("postgresql://unused")
+        listener._connected.set()
+        base = {
+            "evaluation_id": evaluation.id,
+            "candidate_position_id": candidate_position.id,
+            "step_type": EvaluationStepType.technical_eval,
+            "version": 1,
+        }
+        dispatcher = asyncio.create_task(
+            _dispatch_when_subscribed(
+                listener,
+                candidate_position.id,
+                [
+                    {
+                        **base,
+                        "status": EvaluationStatus.running,
+                        "progress": "2026-01-01T12:00:01",
+                    },
+                    {
+                        **base,
+                        "status": EvaluationStatus.running,
+                        "progress": "2026-01-01T12:00:02",
+                    },
+                    {
+                        **base,
+                        "status": EvaluationStatus.completed,
+                        "progress": "2026-01-01T12:00:03",
+                    },
+                ],
+            )
+        )
+
+        with (
+            patch(
+                "app.routers.evaluations.async_session_factory",
+                make_session_factory_mock(session),
+            ),
+            patch(
+                "app.routers.evaluations.evaluation_notify_service.get_listener",
+                return_value=listener,
+            ),
+        ):
+            async with authenticated_client.stream(
+                "GET",
+                f"/api/evaluations/{candidate_position.id}/stream",
+            ) as response:
+                body = (await response.aread()).decode()
+        await dispatcher
+
+        events = [
+            (e["event"], json.loads(e["data"])["status"])
+            for e in _parse_sse_events(body)
+            if e.get("event") in ("status_change", "result_update")
+        ]
+        assert events == [
+            ("status_change", EvaluationStatus.running),
+            ("result_update", EvaluationStatus.running),
+            ("result_update", EvaluationStatus.running),
+            ("status_change", EvaluationStatus.completed),
+        ]
+
+
+class TestSSEPollResultUpdate:
+    async def test_partial_result_emits_result_update(
+        self,
+        authenticated_client: AsyncClient,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        snapshots = [
+            (EvaluationStatus.running, datetime(2026, 1, 1, 12, 0, 0)),
+            (EvaluationStatus.running, datetime(2026, 1, 1, 12, 0, 0)),
+            (EvaluationStatus.running, datetime(2026, 1, 1, 12, 0, 5)),
+            (EvaluationStatus.completed, datetime(2026, 1, 1, 12, 0, 9)),
+        ]
+
+        async def get_evaluations(session, candidate_position_id):  # type: ignore[no-untyped-def]
+            status, updated_at = snapshots.pop(0)
+            return [
+                Evaluation(
+                    id=7,
+                    candidate_position_id=candidate_position_id,
+                    step_type=EvaluationStepType.technical_eval,
+                    status=status,
+                    version=1,
+                    updated_at=updated_at,
+                )
+            ]
+
+        @asynccontextmanager
+        async def fake_session_factory():
+            yield AsyncMock()
+
+        with (
+            patch(
+                "app.routers.evaluations.async_session_factory",
+                fake_session_factory,
+            ),
+            patch(
+                "app.routers.evaluations.evaluation_service.get_evaluations",
+                get_evaluations,
+            ),
+            patch("app.routers.evaluations.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            async with authenticated_client.stream(
+                "GET",
+                f"/api/evaluations/{candidate_position.id}/stream",
+            ) as response:
+                body = (await response.aread()).decode()
+
+        event_names = [e.get("event") for e in _parse_sse_events(body)]
+        assert event_names == [
+            "status_change",
+            "result_update",
+            "status_change",
+            "done",
+        ]
@@ -13,8 +13,8 @@ from app.models.position_rubric import PositionRubric, PositionRubricVersion
 from app.models.team import Team
 from app.models.user import User
 from app.services import document_service
+from tests.helpers import get_outbox_events
 
-_PUBLISH_PATH = "app.services.eventbridge_service.publish_evaluation_event"
 _UPLOAD_URL_PATH = "app.services.storage_service.generate_upload_url"
 _OBJECT_SIZE_PATH = "app.services.storage_service.get_object_size"
 _PUT_TEXT_PATH = "app.services.storage_service.put_text_object"
@@ -98,13 +98,11 @@ async def candidate_position_with_rubric(
     return candidate_position, version
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 @patch(_OBJECT_SIZE_PATH, new_callable=AsyncMock, return_value=0)
 @patch(_UPLOAD_URL_PATH, new_callable=AsyncMock)
 async def test_complete_cv_upload_creates_cv_analysis_evaluation(
     mock_upload_url: AsyncMock,
     mock_object_size: AsyncMock,
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
     test_user: User,
@@ -140,13 +138,11 @@ async def test_complete_cv_upload_creates_cv_analysis_evaluation(
     assert evaluations[0].source_document_id == document.id
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 @patch(_OBJECT_SIZE_PATH, new_callable=AsyncMock, return_value=0)
 @patch(_UPLOAD_URL_PATH, new_callable=AsyncMock)
 async def test_complete_technical_transcript_without_rubric_skips_evaluation(
     mock_upload_url: AsyncMock,
     mock_object_size: AsyncMock,
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
     test_user: User,
@@ -181,14 +177,12 @@ async def test_complete_technical_transcript_without_rubric_skips_evaluation(
     evaluations = list(result.all())
 
     assert len(evaluations) == 0
-    mock_publish.assert_not_called()
+    assert await get_outbox_events(session) == []
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 @patch(_PUT_TEXT_PATH, new_callable=AsyncMock)
 async def test_paste_screening_transcript_creates_screening_eval(
     mock_put_text: AsyncMock,
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
     test_user: User,
@@ -216,19 +210,58 @@ async def test_paste_screening_transcript_creates_screening_eval(
     assert evaluations[0].status == "pending"
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
+@patch(_OBJECT_SIZE_PATH, new_callable=AsyncMock, return_value=0)
+@patch(_UPLOAD_URL_PATH, new_callable=AsyncMock)
+async def test_complete_cv_upload_writes_outbox_event(
+    mock_upload_url: AsyncMock,
+    mock_object_size: AsyncMock,
+    event_bus: str,
+    session: AsyncSession,
+    candidate_position: CandidatePosition,
+    test_user: User,
+) -> None:
+    mock_upload_url.return_value = "https://s3.example.com/upload"
+
+    document, _ = await document_service.create_presigned_upload(
+        session=session,
+        type="cv",
+        candidate_position_id=candidate_position.id,
+        file_name="resume.pdf",
+        content_type="application/pdf",
+        file_size=1024,
+        uploaded_by_id=test_user.id,
+    )
+
+    await document_service.complete_upload(
+        session=session,
+        document_id=document.id,
+        user_id=test_user.id,
+    )
+
+    result = await session.exec(select(Evaluation))
+    evaluation = result.one()
+    events = await get_outbox_events(session)
+    assert len(events) == 1
+    assert events[0].evaluation_id == evaluation.id
+    assert events[0].detail == {
+        "evaluation_id": evaluation.id,
+        "candidate_position_id": candidate_position.id,
+        "step_type": "cv_analysis",
+        "source_document_id": document.id,
+        "rubric_version_id": None,
+    }
+
+
 @patch(_OBJECT_SIZE_PATH, new_callable=AsyncMock, return_value=0)
 @patch(_UPLOAD_URL_PATH, new_callable=AsyncMock)
 async def test_eventbridge_skipped_when_bus_name_empty(
     mock_upload_url: AsyncMock,
     mock_object_size: AsyncMock,
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
     test_user: User,
 ) -> None:
     from app.config import settings
-    from app.services import eventbridge_service
 
     mock_upload_url.return_value = "https://s3.example.com/upload"
 
@@ -249,17 +282,6 @@ async def test_eventbridge_skipped_when_bus_name_empty(
     )
 
     assert settings.evaluation_event_bus_name == ""
-    mock_publish.assert_called_once()
-
-    import aioboto3
-
-    with (
-        patch.object(settings, "evaluation_event_bus_name", ""),
-        patch.object(aioboto3, "Session") as mock_session_cls,
-    ):
-        await eventbridge_service.publish_evaluation_event(
-            evaluation_id=1,
-            candidate_position_id=candidate_position.id,
-            step_type="cv_analysis",
-        )
-        mock_session_cls.assert_not_called()
+    result = await session.exec(select(Evaluation))
+    assert result.one().status == "pending"
+    assert await get_outbox_events(session) == []
@@ -4,9 +4,13 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.exceptions import NotFoundException
 from app.models.candidate_position import CandidatePosition
-from app.models.enums import EvaluationStatus, EvaluationStepType
+from app.models.document import Document
+from app.models.enums import DocumentStatus, EvaluationStatus, EvaluationStepType
 from app.models.evaluation import Evaluation
+from app.models.evaluation_version_counter import EvaluationVersionCounter
+from app.models.user import User
 from app.services import evaluation_service
+from tests.helpers import count_statements
 
 
 class TestEvaluationModel:
@@ -111,6 +115,49 @@ class TestCreateEvaluation:
         assert evaluation.source_document_id == 42
         assert evaluation.rubric_version_id == 7
 
+    async def test_allocates_version_from_counter_row(
+        self, session: AsyncSession, candidate_position: CandidatePosition
+    ) -> None:
+        for _ in range(2):
+            await evaluation_service.create_evaluation(
+                session=session,
+                candidate_position_id=candidate_position.id,
+                step_type=EvaluationStepType.cv_analysis,
+            )
+
+        counter = await session.get(
+            EvaluationVersionCounter,
+            (candidate_position.id, EvaluationStepType.cv_analysis),
+        )
+        assert counter is not None
+        assert counter.last_version == 2
+
+    async def test_counter_catches_up_with_versions_written_without_it(
+        self, session: AsyncSession, candidate_position: CandidatePosition
+    ) -> None:
+        await evaluation_service.create_evaluation(
+            session=session,
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+        )
+        session.add(
+            Evaluation(
+                candidate_position_id=candidate_position.id,
+                step_type=EvaluationStepType.cv_analysis,
+                status=EvaluationStatus.completed,
+                version=5,
+            )
+        )
+        await session.commit()
+
+        evaluation = await evaluation_service.create_evaluation(
+            session=session,
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+        )
+
+        assert evaluation.version == 6
+
 
 class TestGetEvaluations:
     async def test_returns_empty_list_when_no_evaluations_exist(
@@ -484,3 +531,204 @@ class TestGetEvaluationHistoryEndpoint:
         )
 
         assert response.status_code == 401
+
+
+class TestEvaluationAccess:
+    async def _create_user(self, session: AsyncSession) -> User:
+        user = User(
+            email="stranger@provectus.com",
+            google_id="stranger123",
+            full_name="Stranger User",
+        )
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+        return user
+
+    async def test_unrelated_user_gets_not_found(
+        self, session: AsyncSession, candidate_position: CandidatePosition
+    ) -> None:
+        await evaluation_service.create_evaluation(
+            session=session,
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+        )
+        stranger = await self._create_user(session)
+
+        with pytest.raises(NotFoundException, match="Candidate position"):
+            await evaluation_service.get_evaluations(
+                session, candidate_position.id, user_id=stranger.id
+            )
+        with pytest.raises(NotFoundException, match="Candidate position"):
+            await evaluation_service.get_evaluation_by_step(
+                session,
+                candidate_position.id,
+                EvaluationStepType.cv_analysis,
+                user_id=stranger.id,
+            )
+
+    async def test_document_uploader_has_access(
+        self, session: AsyncSession, candidate_position: CandidatePosition
+    ) -> None:
+        uploader = await self._create_user(session)
+        session.add(
+            Document(
+                type="cv",
+                candidate_position_id=candidate_position.id,
+                file_name="resume.pdf",
+                s3_key="documents/uploader/resume.pdf",
+                content_type="application/pdf",
+                status=DocumentStatus.active,
+                input_method="file",
+                uploaded_by_id=uploader.id,
+            )
+        )
+        await session.commit()
+
+        await evaluation_service.verify_access(
+            session, candidate_position.id, uploader.id
+        )
+        evaluations = await evaluation_service.get_evaluations(
+            session, candidate_position.id, user_id=uploader.id
+        )
+        assert evaluations == []
+
+    async def test_fetch_and_authorization_share_one_query(
+        self,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+        test_user: User,
+    ) -> None:
+        await evaluation_service.create_evaluation(
+            session=session,
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.cv_analysis,
+        )
+
+        with count_statements() as statements:
+            evaluation = await evaluation_service.get_evaluation_by_step(
+                session,
+                candidate_position.id,
+                EvaluationStepType.cv_analysis,
+                user_id=test_user.id,
+            )
+
+        assert evaluation.step_type == EvaluationStepType.cv_analysis
+        assert len(statements) == 1
+
+
+TECHNICAL_RESULT = {
+    "thinking": "Long internal reasoning " * 50,
+    "criteria_scores": [
+        {"criterion_name": "Coding", "score": 4, "evidence": "..." * 100},
+    ],
+    "weighted_total": 4.0,
+    "strengths_summary": ["Solid fundamentals"],
+    "improvement_areas": ["System design"],
+}
+
+
+class TestEvaluationResultProjection:
+    async def _seed_completed(
+        self, session: AsyncSession, candidate_position: CandidatePosition
+    ) -> Evaluation:
+        evaluation = Evaluation(
+            candidate_position_id=candidate_position.id,
+            step_type=EvaluationStepType.technical_eval,
+            status=EvaluationStatus.completed,
+            version=1,
+            result=TECHNICAL_RESULT,
+        )
+        session.add(evaluation)
+        await session.commit()
+        return evaluation
+
+    async def test_fields_limits_result_keys(
+        self,
+        authenticated_client: AsyncClient,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await self._seed_completed(session, candidate_position)
+
+        response = await authenticated_client.get(
+            f"/api/evaluations/{candidate_position.id}",
+            params={"fields": "status,weighted_total,missing_key"},
+        )
+
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert item["status"] == EvaluationStatus.completed
+        assert item["result"] == {"weighted_total": 4.0}
+
+    async def test_summary_view_drops_heavy_result_keys(
+        self,
+        authenticated_client: AsyncClient,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await self._seed_completed(session, candidate_position)
+
+        response = await authenticated_client.get(
+            f"/api/evaluations/{candidate_position.id}/technical_eval/history",
+            params={"view": "summary"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["items"][0]["result"] == {
+            "weighted_total": 4.0,
+            "strengths_summary": ["Solid fundamentals"],
+        }
+
+    async def test_projection_leaves_stored_result_untouched(
+        self, session: AsyncSession, candidate_position: CandidatePosition
+    ) -> None:
+        seeded = await self._seed_completed(session, candidate_position)
+
+        projected = await evaluation_service.get_evaluations(
+            session, candidate_position.id, summary=True
+        )
+        await session.commit()
+        await session.refresh(seeded)
+
+        assert projected[0].result == {
+            "weighted_total": 4.0,
+            "strengths_summary": ["Solid fundamentals"],
+        }
+        assert seeded.result == TECHNICAL_RESULT
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"fields": "weighted_total", "view": "summary"},
+            {"fields": "result->>'x'"},
+        ],
+    )
+    async def test_rejects_invalid_projection(
+        self,
+        authenticated_client: AsyncClient,
+        candidate_position: CandidatePosition,
+        params: dict[str, str],
+    ) -> None:
+        response = await authenticated_client.get(
+            f"/api/evaluations/{candidate_position.id}", params=params
+        )
+
+        assert response.status_code == 422
+
+    async def test_large_responses_are_gzipped(
+        self,
+        authenticated_client: AsyncClient,
+        session: AsyncSession,
+        candidate_position: CandidatePosition,
+    ) -> None:
+        await self._seed_completed(session, candidate_position)
+
+        response = await authenticated_client.get(
+            f"/api/evaluations/{candidate_position.id}",
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["items"][0]["result"] == TECHNICAL_RESULT
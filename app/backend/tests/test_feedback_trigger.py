@@ -1,5 +1,3 @@
-from unittest.mock import AsyncMock, patch
-
 import pytest
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -11,8 +9,7 @@ from app.models.position import Position
 from app.models.team import Team
 from app.models.user import User
 from app.services import evaluation_service
-
-_PUBLISH_PATH = "app.services.eventbridge_service.publish_evaluation_event"
+from tests.helpers import get_outbox_events
 
 
 @pytest.fixture
@@ -60,9 +57,7 @@ async def candidate_position(
     return cp
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 async def test_trigger_feedback_gen_creates_pending_evaluation(
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
 ) -> None:
@@ -86,9 +81,8 @@ async def test_trigger_feedback_gen_creates_pending_evaluation(
     assert evaluations[0].rubric_version_id is None
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 async def test_trigger_feedback_gen_publishes_event(
-    mock_publish: AsyncMock,
+    event_bus: str,
     session: AsyncSession,
     candidate_position: CandidatePosition,
 ) -> None:
@@ -97,15 +91,13 @@ async def test_trigger_feedback_gen_publishes_event(
         candidate_position_id=candidate_position.id,
     )
 
-    mock_publish.assert_called_once()
-    call_kwargs = mock_publish.call_args.kwargs
-    assert call_kwargs["step_type"] == "feedback_gen"
-    assert call_kwargs["candidate_position_id"] == candidate_position.id
+    events = await get_outbox_events(session)
+    assert len(events) == 1
+    assert events[0].detail["step_type"] == "feedback_gen"
+    assert events[0].detail["candidate_position_id"] == candidate_position.id
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 async def test_rejecting_candidate_at_screening_creates_feedback_gen_evaluation(
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
 ) -> None:
@@ -134,9 +126,7 @@ async def test_rejecting_candidate_at_screening_creates_feedback_gen_evaluation(
     assert evaluations[0].step_type == "feedback_gen"
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 async def test_rejecting_candidate_does_not_break_stage_transition(
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
 ) -> None:
@@ -156,9 +146,7 @@ async def test_rejecting_candidate_does_not_break_stage_transition(
     assert updated_cp.id == candidate_position.id
 
 
-@patch(_PUBLISH_PATH, new_callable=AsyncMock)
 async def test_non_rejection_stage_transition_does_not_trigger_feedback_gen(
-    mock_publish: AsyncMock,
     session: AsyncSession,
     candidate_position: CandidatePosition,
 ) -> None:
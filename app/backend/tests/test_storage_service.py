@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.config import settings
+from app.services import storage_service
+
+
+@pytest.fixture
+async def shared_clients(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with (
+        patch.object(settings, "s3_bucket_name", "test-bucket"),
+        patch.object(settings, "s3_endpoint_url", "http://minio:9000"),
+        patch.object(settings, "s3_presign_endpoint_url", "http://localhost:9000"),
+    ):
+        await storage_service.start_clients()
+        yield
+        await storage_service.stop_clients()
+
+
+async def test_shared_clients_are_reused(shared_clients):
+    async with storage_service._s3_client() as first:
+        pass
+    async with storage_service._s3_client() as second:
+        pass
+    async with storage_service._s3_client(for_presign=True) as presign:
+        pass
+
+    assert first is second
+    assert presign is not first
+    assert first.meta.endpoint_url == "http://minio:9000"
+    assert presign.meta.endpoint_url == "http://localhost:9000"
+
+
+async def test_presign_uses_shared_client_without_new_session(shared_clients):
+    with patch.object(storage_service.aioboto3, "Session") as mock_session_cls:
+        url = await storage_service.generate_view_url("documents/cv.pdf")
+
+    mock_session_cls.assert_not_called()
+    assert url.startswith("http://localhost:9000/test-bucket/documents/cv.pdf?")
+
+
+async def test_start_clients_is_idempotent(shared_clients):
+    async with storage_service._s3_client() as before:
+        pass
+    await storage_service.start_clients()
+    async with storage_service._s3_client() as after:
+        pass
+
+    assert before is after
+
+
+async def test_stop_clients_falls_back_to_per_call_client(shared_clients):
+    await storage_service.stop_clients()
+
+    with patch.object(storage_service.aioboto3, "Session") as mock_session_cls:
+        mock_session_cls.return_value.client.return_value.__aenter__.return_value = (
+            "client"
+        )
+        async with storage_service._s3_client() as client:
+            assert client == "client"
+
+    mock_session_cls.assert_called_once()
@@ -74,6 +74,12 @@ export function useEvaluationStream(
         invalidateEvaluations();
       });
 
+      // A running evaluation saved part of its result.
+      es.addEventListener("result_update", () => {
+        retriesRef.current = 0;
+        invalidateEvaluations();
+      });
+
       es.onerror = () => {
         es.close();
         esRef.current = null;
@@ -6,10 +6,17 @@ sys.path.insert(0, "/opt/python")
 sys.path.insert(0, "/var/task")
 
 from shared import bedrock as bedrock_module
+from shared import config
 from shared import s3 as s3_module
-from shared.evaluation_lifecycle import complete_evaluation, run_evaluation
-from shared.models import CandidatePosition, Document, Position
+from shared.evaluation_lifecycle import (
+    complete_evaluation,
+    run_evaluation,
+    save_partial_result,
+)
+from shared.models import Position
+from shared.prompts.budget import PromptBudget
 from shared.prompts.cv_analysis import TOOL_NAME, TOOL_SCHEMA, build_cv_analysis_prompt
+from shared.queries import load_evaluation_context
 
 logger = logging.getLogger(__name__)
 
@@ -31,46 +38,49 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     evaluation_id: int = detail["evaluation_id"]
     logger.info("cv_analysis handler started", extra={"evaluation_id": evaluation_id})
 
-    with run_evaluation(evaluation_id) as (session, evaluation):
+    with run_evaluation(evaluation_id) as claimed:
+        if claimed is None:
+            return {}
+        session, evaluation = claimed
         if evaluation.source_document_id is None:
             raise ValueError(f"Evaluation {evaluation_id} has no source_document_id")
 
-        document = session.get(Document, evaluation.source_document_id)
+        eval_context = load_evaluation_context(session, evaluation)
+        document = eval_context.source_document
         if document is None:
             raise ValueError(f"Document {evaluation.source_document_id} not found")
-
-        candidate_position = session.get(
-            CandidatePosition, evaluation.candidate_position_id
-        )
-        if candidate_position is None:
-            raise ValueError(
-                f"CandidatePosition {evaluation.candidate_position_id} not found"
-            )
-
-        position = session.get(Position, candidate_position.position_id)
-        if position is None:
-            raise ValueError(f"Position {candidate_position.position_id} not found")
+        position = eval_context.position
 
         cv_text = s3_module.get_document_text(document.s3_key)
         required_skills = _extract_required_skills(position)
 
+        budget = PromptBudget(config.PROMPT_TOKEN_BUDGET)
         system_prompt, user_prompt = build_cv_analysis_prompt(
             position_title=position.title,
             position_description=position.requirements or "",
             required_skills=required_skills,
             cv_text=cv_text,
             evaluation_instructions=position.evaluation_instructions or "",
+            budget=budget,
         )
 
+        usage = bedrock_module.TokenUsage()
         result = bedrock_module.invoke_claude_structured(
             prompt=user_prompt,
             tool_name=TOOL_NAME,
             tool_schema=TOOL_SCHEMA,
             system_prompt=system_prompt,
             step_type="cv_analysis",
+            usage=usage,
+            use_cache=not evaluation.skip_response_cache,
+            on_partial=lambda partial: save_partial_result(
+                session, evaluation, partial
+            ),
         )
 
-        complete_evaluation(session, evaluation, result)
+        budget.record(result, evaluation_id)
+
+        complete_evaluation(session, evaluation, result, token_usage=usage.as_dict())
         logger.info(
             "cv_analysis handler completed", extra={"evaluation_id": evaluation_id}
         )
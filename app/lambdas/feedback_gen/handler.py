@@ -5,8 +5,6 @@ from typing import Any
 sys.path.insert(0, "/opt/python")
 sys.path.insert(0, "/var/task")
 
-from sqlalchemy.orm import Session
-
 from shared import bedrock as bedrock_module
 from shared.evaluation_lifecycle import complete_evaluation, run_evaluation
 from shared.prompts.feedback_gen import (
@@ -14,26 +12,13 @@ from shared.prompts.feedback_gen import (
     TOOL_SCHEMA,
     build_feedback_gen_prompt,
 )
-from shared.queries import fetch_latest_completed_result
+from shared.queries import fetch_latest_completed_results
 
 logger = logging.getLogger(__name__)
 
 _UPSTREAM_STEP_TYPES = ("cv_analysis", "screening_eval", "technical_eval")
 
 
-def _collect_completed_evaluations(
-    session: Session, candidate_position_id: int
-) -> dict[str, Any]:
-    results: dict[str, Any] = {}
-    for step_type in _UPSTREAM_STEP_TYPES:
-        result = fetch_latest_completed_result(
-            session, candidate_position_id, step_type
-        )
-        if result is not None:
-            results[step_type] = result
-    return results
-
-
 def _determine_rejection_stage(evaluation_results: dict[str, Any]) -> str:
     if "technical_eval" in evaluation_results:
         return "technical"
@@ -47,9 +32,12 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     evaluation_id: int = detail["evaluation_id"]
     logger.info("feedback_gen handler started", extra={"evaluation_id": evaluation_id})
 
-    with run_evaluation(evaluation_id) as (session, evaluation):
-        evaluation_results = _collect_completed_evaluations(
-            session, evaluation.candidate_position_id
+    with run_evaluation(evaluation_id) as claimed:
+        if claimed is None:
+            return {}
+        session, evaluation = claimed
+        evaluation_results = fetch_latest_completed_results(
+            session, evaluation.candidate_position_id, _UPSTREAM_STEP_TYPES
         )
 
         rejection_stage = _determine_rejection_stage(evaluation_results)
@@ -59,12 +47,15 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             rejection_stage=rejection_stage,
         )
 
+        usage = bedrock_module.TokenUsage()
         result = bedrock_module.invoke_claude_structured(
             prompt=user_prompt,
             tool_name=TOOL_NAME,
             tool_schema=TOOL_SCHEMA,
             system_prompt=system_prompt,
             step_type="feedback_gen",
+            usage=usage,
+            use_cache=not evaluation.skip_response_cache,
         )
 
         if "feedback_text" not in result:
@@ -72,7 +63,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
         result["rejection_stage"] = rejection_stage
 
-        complete_evaluation(session, evaluation, result)
+        complete_evaluation(session, evaluation, result, token_usage=usage.as_dict())
         logger.info(
             "feedback_gen handler completed",
             extra={"evaluation_id": evaluation_id},
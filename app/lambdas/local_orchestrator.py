@@ -1,6 +1,12 @@
 import importlib
 import logging
-import time
+import os
+import signal
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from sqlalchemy import select
 
 from shared import config
 from shared.db import get_session
@@ -8,7 +14,7 @@ from shared.models import Evaluation
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
+    format="%(asctime)s [%(levelname)s] %(threadName)s %(message)s",
 )
 logger = logging.getLogger("local-orchestrator")
 
@@ -23,6 +29,25 @@ HANDLER_MODULES = {
 }
 
 
+def _parse_step_limits(raw: str) -> dict[str, int]:
+    """Parse ``"cv_analysis=2,technical_eval=1"`` into per-step limits."""
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        step_type, sep, value = item.strip().partition("=")
+        if sep and step_type in HANDLER_MODULES:
+            limits[step_type] = int(value)
+    return limits
+
+
+WORKERS = int(os.environ.get("ORCHESTRATOR_WORKERS", "4"))
+MAX_IN_FLIGHT_PER_STEP = int(
+    os.environ.get("ORCHESTRATOR_MAX_IN_FLIGHT_PER_STEP", str(WORKERS))
+)
+STEP_MAX_IN_FLIGHT = _parse_step_limits(
+    os.environ.get("ORCHESTRATOR_STEP_MAX_IN_FLIGHT", "")
+)
+
+
 def build_event(evaluation: Evaluation) -> dict:
     return {
         "detail": {
@@ -55,42 +80,142 @@ def dispatch(evaluation: Evaluation) -> None:
         logger.exception(f"Evaluation {evaluation.id} failed")
 
 
-def poll_and_dispatch() -> None:
-    to_dispatch: list[int] = []
+def claim_pending(capacity: dict[str, int]) -> list[Evaluation]:
+    """Claim up to ``capacity[step_type]`` pending evaluations per step type.
+
+    Rows are locked with ``FOR UPDATE SKIP LOCKED`` and flipped to running in
+    the same transaction, so concurrent orchestrator replicas never claim the
+    same evaluation.
+    """
+    claimed: list[Evaluation] = []
     with get_session() as session:
-        pending = (
-            session.query(Evaluation)
-            .filter(Evaluation.status == "pending")
-            .order_by(Evaluation.created_at.asc())
-            .all()
-        )
-        for evaluation in pending:
-            evaluation.status = "running"
-            session.add(evaluation)
-            to_dispatch.append(evaluation.id)
-        if to_dispatch:
+        for step_type, limit in capacity.items():
+            if limit <= 0:
+                continue
+            stmt = (
+                select(Evaluation)
+                .where(
+                    Evaluation.status == "pending",
+                    Evaluation.step_type == step_type,
+                )
+                .order_by(Evaluation.created_at.asc())
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            for evaluation in session.scalars(stmt):
+                evaluation.status = "running"
+                session.add(evaluation)
+                claimed.append(evaluation)
+        if claimed:
             session.commit()
-
-    for eval_id in to_dispatch:
-        with get_session() as session:
-            evaluation = session.get(Evaluation, eval_id)
-            if evaluation is not None and evaluation.status == "running":
-                dispatch(evaluation)
+    return claimed
+
+
+class WorkerPool:
+    """Runs claimed evaluations on a thread pool with per-step concurrency caps."""
+
+    def __init__(
+        self,
+        workers: int = WORKERS,
+        max_in_flight_per_step: int = MAX_IN_FLIGHT_PER_STEP,
+        step_max_in_flight: dict[str, int] | None = None,
+    ) -> None:
+        if step_max_in_flight is None:
+            step_max_in_flight = STEP_MAX_IN_FLIGHT
+        self.workers = workers
+        self.step_limits = {
+            step_type: min(
+                step_max_in_flight.get(step_type, max_in_flight_per_step), workers
+            )
+            for step_type in HANDLER_MODULES
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="evaluator"
+        )
+        self._in_flight: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Event()
+        self._stopping = threading.Event()
+
+    def capacity(self) -> dict[str, int]:
+        with self._lock:
+            free = self.workers - sum(self._in_flight.values())
+            return {
+                step_type: min(limit - self._in_flight[step_type], free)
+                for step_type, limit in self.step_limits.items()
+            }
+
+    def poll_and_dispatch(self) -> int:
+        """Claim work for every free slot and submit it. Returns the claim count."""
+        capacity = self.capacity()
+        if not any(limit > 0 for limit in capacity.values()):
+            return 0
+
+        claimed = claim_pending(capacity)
+        for evaluation in claimed:
+            with self._lock:
+                self._in_flight[evaluation.step_type] += 1
+            future = self._executor.submit(dispatch, evaluation)
+            future.add_done_callback(
+                lambda f, step_type=evaluation.step_type: self._release(step_type, f)
+            )
+        return len(claimed)
+
+    def _release(self, step_type: str, future: Future[None]) -> None:
+        with self._lock:
+            self._in_flight[step_type] -= 1
+        self._slot_freed.set()
+
+    def wait(self, timeout: float) -> None:
+        """Sleep until the next poll, waking early when a worker frees a slot."""
+        self._slot_freed.wait(timeout)
+        self._slot_freed.clear()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._slot_freed.set()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            in_flight = sum(self._in_flight.values())
+        logger.info(f"Waiting for {in_flight} in-flight evaluation(s) to finish")
+        self._executor.shutdown(wait=True)
 
 
 def main() -> None:
+    # Each worker thread holds one connection; keep one spare for claiming.
+    config.DB_POOL_SIZE = max(config.DB_POOL_SIZE, WORKERS + 1)
+
+    pool = WorkerPool()
     logger.info("Local orchestrator started")
     logger.info(f"  MOCK_BEDROCK={config.MOCK_BEDROCK}")
     logger.info(f"  MOCK_BEDROCK_DELAY_SECONDS={config.MOCK_BEDROCK_DELAY_SECONDS}")
     logger.info(f"  MOCK_EVALUATION_FAILURES={config.MOCK_EVALUATION_FAILURES}")
+    logger.info(f"  WORKERS={pool.workers} STEP_LIMITS={pool.step_limits}")
     logger.info(f"  DB: {config.DB_HOST}:{config.DB_PORT}/{config.DB_NAME}")
 
-    while True:
+    def _handle_signal(signum: int, frame: object) -> None:
+        logger.info(f"Received {signal.Signals(signum).name}, shutting down")
+        pool.stop()
+        # A second signal terminates immediately without draining.
+        signal.signal(signum, signal.SIG_DFL)
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    while not pool.stopping:
         try:
-            poll_and_dispatch()
+            pool.poll_and_dispatch()
         except Exception:
             logger.exception("Error during poll cycle")
-        time.sleep(POLL_INTERVAL_SECONDS)
+        pool.wait(POLL_INTERVAL_SECONDS)
+
+    pool.shutdown()
+    logger.info("Local orchestrator stopped")
 
 
 if __name__ == "__main__":
@@ -5,17 +5,14 @@ from typing import Any
 sys.path.insert(0, "/opt/python")
 sys.path.insert(0, "/var/task")
 
-from sqlalchemy.orm import Session
-
 from shared import bedrock as bedrock_module
 from shared.evaluation_lifecycle import complete_evaluation, run_evaluation
-from shared.models import CandidatePosition, Position
 from shared.prompts.recommendation import (
     TOOL_NAME,
     TOOL_SCHEMA,
     build_recommendation_prompt,
 )
-from shared.queries import fetch_latest_completed_result
+from shared.queries import load_evaluation_context
 
 logger = logging.getLogger(__name__)
 
@@ -24,19 +21,6 @@ VALID_CONFIDENCE_LEVELS = {"high", "medium", "low"}
 UPSTREAM_STEP_TYPES = ("cv_analysis", "screening_eval", "technical_eval")
 
 
-def _fetch_latest_completed_results(
-    session: Session, candidate_position_id: int
-) -> dict[str, dict[str, Any] | None]:
-    results: dict[str, dict[str, Any] | None] = dict.fromkeys(UPSTREAM_STEP_TYPES)
-
-    for step_type in UPSTREAM_STEP_TYPES:
-        results[step_type] = fetch_latest_completed_result(
-            session, candidate_position_id, step_type
-        )
-
-    return results
-
-
 def _validate_and_fix_result(
     result: dict[str, Any],
     missing_step_types: list[str],
@@ -70,47 +54,43 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         "recommendation handler started", extra={"evaluation_id": evaluation_id}
     )
 
-    with run_evaluation(evaluation_id) as (session, evaluation):
-        candidate_position = session.get(
-            CandidatePosition, evaluation.candidate_position_id
-        )
-        if candidate_position is None:
-            raise ValueError(
-                f"CandidatePosition {evaluation.candidate_position_id} not found"
-            )
-
-        position = session.get(Position, candidate_position.position_id)
-        if position is None:
-            raise ValueError(f"Position {candidate_position.position_id} not found")
-
-        upstream_results = _fetch_latest_completed_results(
-            session, evaluation.candidate_position_id
+    with run_evaluation(evaluation_id) as claimed:
+        if claimed is None:
+            return {}
+        session, evaluation = claimed
+        eval_context = load_evaluation_context(
+            session, evaluation, result_step_types=UPSTREAM_STEP_TYPES
         )
+        position = eval_context.position
+        upstream_results = eval_context.latest_results
 
         missing_step_types = [
-            step for step, result in upstream_results.items() if result is None
+            step for step in UPSTREAM_STEP_TYPES if step not in upstream_results
         ]
 
         system_prompt, user_prompt = build_recommendation_prompt(
-            cv_analysis_result=upstream_results["cv_analysis"],
-            screening_eval_result=upstream_results["screening_eval"],
-            technical_eval_result=upstream_results["technical_eval"],
+            cv_analysis_result=upstream_results.get("cv_analysis"),
+            screening_eval_result=upstream_results.get("screening_eval"),
+            technical_eval_result=upstream_results.get("technical_eval"),
             position_title=position.title,
             position_description=position.requirements or "",
             evaluation_instructions=position.evaluation_instructions or "",
         )
 
+        usage = bedrock_module.TokenUsage()
         result = bedrock_module.invoke_claude_structured(
             prompt=user_prompt,
             tool_name=TOOL_NAME,
             tool_schema=TOOL_SCHEMA,
             system_prompt=system_prompt,
             step_type="recommendation",
+            usage=usage,
+            use_cache=not evaluation.skip_response_cache,
         )
 
         result = _validate_and_fix_result(result, missing_step_types)
 
-        complete_evaluation(session, evaluation, result)
+        complete_evaluation(session, evaluation, result, token_usage=usage.as_dict())
         logger.info(
             "recommendation handler completed",
             extra={"evaluation_id": evaluation_id},
@@ -6,14 +6,22 @@ sys.path.insert(0, "/opt/python")
 sys.path.insert(0, "/var/task")
 
 from shared import bedrock as bedrock_module
+from shared import config
 from shared import s3 as s3_module
-from shared.evaluation_lifecycle import complete_evaluation, run_evaluation
-from shared.models import CandidatePosition, Document, Position
+from shared import transcripts as transcripts_module
+from shared.evaluation_lifecycle import (
+    complete_evaluation,
+    run_evaluation,
+    save_partial_result,
+)
+from shared.prompts.budget import PromptBudget
 from shared.prompts.screening_eval import (
     TOOL_NAME,
     TOOL_SCHEMA,
     build_screening_eval_prompt,
+    evidence_focus,
 )
+from shared.queries import load_evaluation_context
 
 logger = logging.getLogger(__name__)
 
@@ -53,34 +61,39 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         "screening_eval handler started", extra={"evaluation_id": evaluation_id}
     )
 
-    with run_evaluation(evaluation_id) as (session, evaluation):
+    with run_evaluation(evaluation_id) as claimed:
+        if claimed is None:
+            return {}
+        session, evaluation = claimed
         if evaluation.source_document_id is None:
             raise ValueError(f"Evaluation {evaluation_id} has no source_document_id")
 
-        document = session.get(Document, evaluation.source_document_id)
+        eval_context = load_evaluation_context(session, evaluation)
+        document = eval_context.source_document
         if document is None:
             raise ValueError(f"Document {evaluation.source_document_id} not found")
-
-        candidate_position = session.get(
-            CandidatePosition, evaluation.candidate_position_id
-        )
-        if candidate_position is None:
-            raise ValueError(
-                f"CandidatePosition {evaluation.candidate_position_id} not found"
-            )
-
-        position = session.get(Position, candidate_position.position_id)
-        if position is None:
-            raise ValueError(f"Position {candidate_position.position_id} not found")
+        position = eval_context.position
 
         transcript_text = s3_module.get_document_text(document.s3_key)
         _validate_transcript_length(transcript_text)
 
+        usage = bedrock_module.TokenUsage()
+        transcript_chunks = 0
+        if transcripts_module.needs_condensing(transcript_text):
+            transcript_text, transcript_chunks = transcripts_module.condense_transcript(
+                transcript_text,
+                evidence_focus(position.requirements or ""),
+                usage,
+                use_cache=not evaluation.skip_response_cache,
+            )
+
+        budget = PromptBudget(config.PROMPT_TOKEN_BUDGET)
         system_prompt, user_prompt = build_screening_eval_prompt(
             position_title=position.title,
             position_description=position.requirements or "",
             transcript_text=transcript_text,
             evaluation_instructions=position.evaluation_instructions or "",
+            budget=budget,
         )
 
         result = bedrock_module.invoke_claude_structured(
@@ -89,10 +102,20 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             tool_schema=TOOL_SCHEMA,
             system_prompt=system_prompt,
             step_type="screening_eval",
+            usage=usage,
+            use_cache=not evaluation.skip_response_cache,
+            on_partial=lambda partial: save_partial_result(
+                session, evaluation, partial
+            ),
         )
         _validate_result_sections(result)
 
-        complete_evaluation(session, evaluation, result)
+        budget.record(result, evaluation_id)
+
+        if transcript_chunks:
+            result["transcript_chunks"] = transcript_chunks
+
+        complete_evaluation(session, evaluation, result, token_usage=usage.as_dict())
         logger.info(
             "screening_eval handler completed",
             extra={"evaluation_id": evaluation_id},
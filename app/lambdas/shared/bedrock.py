@@ -1,59 +1,113 @@
 import json
+import logging
+import threading
 import time
 from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from typing import Any
 
-import boto3
 import botocore.exceptions
 
-from shared import config
+from shared import config, rate_limiter, response_cache
+from shared.prompts.formatters import CACHE_BREAKPOINT
+
+logger = logging.getLogger(__name__)
 
 _client = None
 
 _RETRIES = 3
 _INITIAL_DELAY = 1.0
+_MAX_DELAY = 20.0
 _RETRIABLE_STATUS_CODES = {429, 500, 502, 503, 529}
+_THROTTLING_STATUS_CODES = {429, 529}
+_CACHE_CONTROL = {"type": "ephemeral"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+@dataclass
+class TokenUsage:
+    """Token counts reported by Bedrock, accumulated across calls.
+
+    Safe to share between threads making concurrent calls.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def add(self, usage: dict[str, Any]) -> None:
+        with self._lock:
+            for name, value in self._counts().items():
+                setattr(self, name, value + int(usage.get(name) or 0))
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return self._counts()
+
+    def _counts(self) -> dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
 
 def get_client():
     global _client
     if _client is None:
+        import boto3
+
         _client = boto3.client("bedrock-runtime", region_name=config.AWS_REGION)
     return _client
 
 
+def _status_code(exc: botocore.exceptions.ClientError) -> int:
+    return exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+
+
 def _is_retriable_client_error(exc: botocore.exceptions.ClientError) -> bool:
-    status_code = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
-    return status_code in _RETRIABLE_STATUS_CODES
+    return _status_code(exc) in _RETRIABLE_STATUS_CODES
+
+
+def _backoff_delay(attempt: int) -> float:
+    return rate_limiter.full_jitter(attempt, _INITIAL_DELAY, _MAX_DELAY)
 
 
 def _invoke_with_retry[T](fn: Callable[[], T]) -> T:
+    """Call ``fn`` under the shared admission controller, retrying transient errors.
+
+    Retries use full-jitter backoff. Throttling (429/529) is reported back to
+    the limiter so the shared concurrency window shrinks.
+    """
     client = get_client()
     last_error: Exception | None = None
 
     for attempt in range(_RETRIES):
-        try:
-            return fn()
-        except client.exceptions.ThrottlingException as exc:
-            last_error = exc
-        except client.exceptions.ModelTimeoutException as exc:
-            last_error = exc
-        except client.exceptions.ModelNotReadyException as exc:
-            last_error = exc
-        except client.exceptions.ServiceUnavailableException as exc:
-            last_error = exc
-        except botocore.exceptions.ClientError as exc:
-            if not _is_retriable_client_error(exc):
-                raise
-            last_error = exc
-        except (
-            botocore.exceptions.EndpointConnectionError,
-            botocore.exceptions.ReadTimeoutError,
-        ) as exc:
-            last_error = exc
+        with rate_limiter.admission(config.BEDROCK_MODEL_ID) as permit:
+            try:
+                return fn()
+            except client.exceptions.ThrottlingException as exc:
+                permit.throttled = True
+                last_error = exc
+            except client.exceptions.ModelTimeoutException as exc:
+                last_error = exc
+            except client.exceptions.ModelNotReadyException as exc:
+                last_error = exc
+            except client.exceptions.ServiceUnavailableException as exc:
+                last_error = exc
+            except botocore.exceptions.ClientError as exc:
+                if not _is_retriable_client_error(exc):
+                    raise
+                permit.throttled = _status_code(exc) in _THROTTLING_STATUS_CODES
+                last_error = exc
+            except (
+                botocore.exceptions.EndpointConnectionError,
+                botocore.exceptions.ReadTimeoutError,
+            ) as exc:
+                last_error = exc
 
         if attempt < _RETRIES - 1:
-            time.sleep(_INITIAL_DELAY * (2**attempt))
+            time.sleep(_backoff_delay(attempt))
 
     raise RuntimeError(
         f"Bedrock invocation failed after {_RETRIES} attempts"
@@ -64,6 +118,83 @@ def _parse_invoke_response(response: Any) -> dict[str, Any]:
     return json.loads(response["body"].read())
 
 
+class PartialJson:
+    """Accumulates a streamed JSON document and parses what is complete so far.
+
+    ``feed`` tracks nesting as text arrives, remembering the last point where a
+    value ended. ``snapshot`` closes the open containers at that point, so it
+    only ever returns fully written members, never half a string.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._length = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._cut = 0
+        self._cut_closers = ""
+        self._snapshot_cut = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> None:
+        for offset, char in enumerate(chunk, start=self._length):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in _CLOSERS:
+                self._stack.append(char)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                self._mark_cut(offset + 1)
+            elif char == ",":
+                self._mark_cut(offset)
+        self._parts.append(chunk)
+        self._length += len(chunk)
+
+    def _mark_cut(self, position: int) -> None:
+        self._cut = position
+        self._cut_closers = "".join(_CLOSERS[c] for c in reversed(self._stack))
+
+    def snapshot(self) -> dict[str, Any] | None:
+        """Parse the complete part, or ``None`` if nothing new has completed."""
+        if self._cut == self._snapshot_cut:
+            return None
+        self._snapshot_cut = self._cut
+        try:
+            value = json.loads(self.text[: self._cut] + self._cut_closers)
+        except ValueError:
+            return None
+        return value if isinstance(value, dict) else None
+
+
+def _user_content(prompt: str, cache: bool) -> str | list[dict[str, Any]]:
+    """Split ``prompt`` at ``CACHE_BREAKPOINT`` into a cached prefix block.
+
+    The marker itself is never sent. Without a marker, or with caching
+    disabled, the prompt goes out as a single string.
+    """
+    prefix, marker, rest = prompt.partition(CACHE_BREAKPOINT)
+    if not marker:
+        return prompt
+    if not cache:
+        return prefix + rest
+    return [
+        {"type": "text", "text": prefix, "cache_control": _CACHE_CONTROL},
+        {"type": "text", "text": rest},
+    ]
+
+
 def invoke_claude(
     prompt: str,
     max_tokens: int = 4096,
@@ -79,7 +210,7 @@ def invoke_claude(
     body = {
         "anthropic_version": "bedrock-2023-05-31",
         "max_tokens": max_tokens,
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": [{"role": "user", "content": _user_content(prompt, cache=False)}],
     }
     if system_prompt:
         body["system"] = system_prompt
@@ -107,28 +238,84 @@ def invoke_claude_structured(
     max_tokens: int = 4096,
     system_prompt: str = "",
     step_type: str = "",
+    usage: TokenUsage | None = None,
+    on_partial: Callable[[dict[str, Any]], None] | None = None,
+    use_cache: bool = True,
+    tools: dict[str, dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
+    """Force a single tool call and return its input.
+
+    With ``BEDROCK_PROMPT_CACHING`` on, the tool definition, the system prompt
+    and the part of ``prompt`` before ``CACHE_BREAKPOINT`` are marked as cache
+    breakpoints. Token counts, including cache reads and writes, are added to
+    ``usage`` when given.
+
+    When ``on_partial`` is given and ``BEDROCK_STREAMING`` is on, the response
+    is streamed and ``on_partial`` receives the input completed so far while
+    the model is still writing. If streaming fails for any reason the call is
+    repeated with ``invoke_model``; the returned dict is the same either way.
+
+    With ``BEDROCK_RESPONSE_CACHE`` on, a result cached for an identical
+    request (model, prompts, tool and ``max_tokens``) is returned without
+    calling Bedrock; a cache hit adds nothing to ``usage``. Pass
+    ``use_cache=False`` to force a fresh call, which still refreshes the
+    cached entry.
+
+    ``tools`` (name to schema, in order) declares every tool in it instead of
+    only ``tool_name``, which must be one of them. Tools come first in the
+    cached prefix, so calls that force different tools from the same
+    ``tools`` can still share the cache.
+    """
+    if tools is not None and tools.get(tool_name) != tool_schema:
+        raise ValueError(f"tools must declare {tool_name} with its tool_schema")
     if config.MOCK_BEDROCK and step_type:
         from shared.mock_bedrock import mock_invoke_claude_structured
 
         return mock_invoke_claude_structured(step_type)
 
+    cache_key: str | None = None
+    if config.BEDROCK_RESPONSE_CACHE:
+        cache_key = response_cache.fingerprint(
+            config.BEDROCK_MODEL_ID,
+            system_prompt,
+            prompt,
+            tool_name,
+            tool_schema,
+            max_tokens,
+            tools,
+        )
+        if use_cache:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Bedrock response cache hit for %s", tool_name)
+                return cached
+
     client = get_client()
+    cache = config.BEDROCK_PROMPT_CACHING
+    tool_list: list[dict[str, Any]] = [
+        {
+            "name": name,
+            "description": f"Record the structured {name} result.",
+            "input_schema": schema,
+        }
+        for name, schema in (tools or {tool_name: tool_schema}).items()
+    ]
+    if cache:
+        # One breakpoint after the last tool caches the whole tool list.
+        tool_list[-1]["cache_control"] = _CACHE_CONTROL
     body: dict[str, Any] = {
         "anthropic_version": "bedrock-2023-05-31",
         "max_tokens": max_tokens,
-        "messages": [{"role": "user", "content": prompt}],
-        "tools": [
-            {
-                "name": tool_name,
-                "description": f"Record the structured {tool_name} result.",
-                "input_schema": tool_schema,
-            }
-        ],
+        "messages": [{"role": "user", "content": _user_content(prompt, cache)}],
+        "tools": tool_list,
         "tool_choice": {"type": "tool", "name": tool_name},
     }
     if system_prompt:
-        body["system"] = system_prompt
+        body["system"] = (
+            [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
+            if cache
+            else system_prompt
+        )
 
     def _call() -> dict[str, Any]:
         response = client.invoke_model(
@@ -147,6 +334,81 @@ def invoke_claude_structured(
             raise RuntimeError(
                 f"Bedrock response contained no tool_use block: {payload}"
             )
+        if usage is not None:
+            usage.add(payload.get("usage", {}))
         return tool_block["input"]
 
-    return _invoke_with_retry(_call)
+    result: dict[str, Any] | None = None
+    if on_partial is not None and config.BEDROCK_STREAMING:
+
+        def _stream() -> dict[str, Any]:
+            response = client.invoke_model_with_response_stream(
+                modelId=config.BEDROCK_MODEL_ID,
+                body=json.dumps(body),
+                contentType="application/json",
+                accept="application/json",
+            )
+            return _read_tool_stream(response["body"], on_partial, usage)
+
+        try:
+            result = _invoke_with_retry(_stream)
+        except Exception:
+            logger.warning(
+                "Streaming Bedrock invocation failed, retrying without streaming",
+                exc_info=True,
+            )
+
+    if result is None:
+        result = _invoke_with_retry(_call)
+    if cache_key is not None:
+        response_cache.put(cache_key, config.BEDROCK_MODEL_ID, result)
+    return result
+
+
+def _read_tool_stream(
+    events: Any,
+    on_partial: Callable[[dict[str, Any]], None],
+    usage: TokenUsage | None,
+) -> dict[str, Any]:
+    """Assemble the tool input from a response stream.
+
+    ``on_partial`` gets the members completed so far at most once every
+    ``PARTIAL_RESULT_INTERVAL_SECONDS``. Usage is recorded only once the
+    stream has finished, so a stream abandoned for the fallback is not counted.
+    """
+    tool_input = PartialJson()
+    stream_usage: dict[str, Any] = {}
+    in_tool_block = False
+    saw_tool_block = False
+    last_partial_at = time.monotonic()
+
+    for event in events:
+        chunk = event.get("chunk")
+        if chunk is None:
+            raise RuntimeError(f"Bedrock stream error: {event}")
+        data = json.loads(chunk["bytes"])
+        kind = data.get("type")
+        if kind == "message_start":
+            stream_usage.update(data.get("message", {}).get("usage", {}))
+        elif kind == "message_delta":
+            stream_usage.update(data.get("usage", {}))
+        elif kind == "content_block_start":
+            in_tool_block = data.get("content_block", {}).get("type") == "tool_use"
+            saw_tool_block = saw_tool_block or in_tool_block
+        elif kind == "content_block_stop":
+            in_tool_block = False
+        elif kind == "content_block_delta" and in_tool_block:
+            tool_input.feed(data.get("delta", {}).get("partial_json", ""))
+            now = time.monotonic()
+            if now - last_partial_at >= config.PARTIAL_RESULT_INTERVAL_SECONDS:
+                partial = tool_input.snapshot()
+                if partial is not None:
+                    on_partial(partial)
+                    last_partial_at = now
+
+    if not saw_tool_block:
+        raise RuntimeError("Bedrock response stream contained no tool_use block")
+    result = json.loads(tool_input.text or "{}")
+    if usage is not None:
+        usage.add(stream_usage)
+    return result
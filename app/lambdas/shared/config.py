@@ -1,36 +1,51 @@
+"""Lambda configuration.
+
+Plain settings are read from the environment at import. Database connection
+settings are resolved lazily on first access (``config.DB_HOST`` and so on,
+via module ``__getattr__``): every SSM parameter under ``DB_SSM_PREFIX`` is
+fetched with a single ``GetParametersByPath`` call, and the password from
+Secrets Manager, then cached for the life of the execution environment.
+"""
+
+import functools
 import json
 import logging
 import os
 
-import boto3
-
 logger = logging.getLogger(__name__)
 
-_ssm_cache: dict[str, str] = {}
+_DB_SETTINGS = {
+    "DB_HOST": ("host", "localhost"),
+    "DB_PORT": ("port", "5432"),
+    "DB_NAME": ("name", "lauter"),
+    "DB_USERNAME": ("username", "postgres"),
+}
 
 
-def _read_ssm_param(name: str) -> str:
-    if name in _ssm_cache:
-        return _ssm_cache[name]
-    prefix = os.environ.get("DB_SSM_PREFIX", "")
+@functools.cache
+def _ssm_params() -> dict[str, str]:
+    prefix = os.environ.get("DB_SSM_PREFIX", "").rstrip("/")
     if not prefix:
-        return ""
+        return {}
+    import boto3
+
     client = boto3.client("ssm")
-    resp = client.get_parameter(Name=f"{prefix}/{name}")
-    value: str = resp["Parameter"]["Value"]
-    _ssm_cache[name] = value
-    return value
+    params: dict[str, str] = {}
+    paginator = client.get_paginator("get_parameters_by_path")
+    for page in paginator.paginate(Path=prefix, WithDecryption=True):
+        for param in page["Parameters"]:
+            params[param["Name"].rsplit("/", 1)[-1]] = param["Value"]
+    return params
+
+
+def _read_ssm_param(name: str) -> str:
+    return _ssm_params().get(name, "")
 
 
-DB_HOST: str = os.environ.get("DB_HOST") or _read_ssm_param("host") or "localhost"
-DB_PORT: str = os.environ.get("DB_PORT") or _read_ssm_param("port") or "5432"
-DB_NAME: str = os.environ.get("DB_NAME") or _read_ssm_param("name") or "lauter"
-DB_USERNAME: str = (
-    os.environ.get("DB_USERNAME") or _read_ssm_param("username") or "postgres"
-)
 DB_PASSWORD_SECRET_ARN: str = os.environ.get("DB_PASSWORD_SECRET_ARN", "")
 
 
+@functools.cache
 def _resolve_db_password() -> str:
     env_password = os.environ.get("DB_PASSWORD", "")
     if env_password:
@@ -38,6 +53,8 @@ def _resolve_db_password() -> str:
     if not DB_PASSWORD_SECRET_ARN:
         return "postgres"
     try:
+        import boto3
+
         client = boto3.client("secretsmanager")
         resp = client.get_secret_value(SecretId=DB_PASSWORD_SECRET_ARN)
         secret = json.loads(resp["SecretString"])
@@ -47,7 +64,16 @@ def _resolve_db_password() -> str:
         raise
 
 
-DB_PASSWORD: str = _resolve_db_password()
+def __getattr__(name: str) -> str:
+    if name == "DB_PASSWORD":
+        return _resolve_db_password()
+    if name in _DB_SETTINGS:
+        param, default = _DB_SETTINGS[name]
+        return os.environ.get(name) or _read_ssm_param(param) or default
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE", "1"))
 
 S3_BUCKET_NAME: str = os.environ.get("S3_BUCKET_NAME", "lauter-files")
 BEDROCK_MODEL_ID: str = os.environ.get(
@@ -56,6 +82,54 @@ BEDROCK_MODEL_ID: str = os.environ.get(
 AWS_REGION: str = os.environ.get("AWS_REGION", "us-east-1")
 
 S3_ENDPOINT_URL: str = os.environ.get("S3_ENDPOINT_URL", "")
+TEXT_CACHE_PREFIX: str = os.environ.get("TEXT_CACHE_PREFIX", "extracted-text/")
+PDF_TEXT_CHAR_BUDGET: int = int(os.environ.get("PDF_TEXT_CHAR_BUDGET", "400000"))
+PROMPT_TOKEN_BUDGET: int = int(os.environ.get("PROMPT_TOKEN_BUDGET", "150000"))
+BEDROCK_RATE_LIMIT_ENABLED: bool = os.environ.get(
+    "BEDROCK_RATE_LIMIT_ENABLED", "true"
+).lower() in ("true", "1", "yes")
+BEDROCK_REQUESTS_PER_MINUTE: float = float(
+    os.environ.get("BEDROCK_REQUESTS_PER_MINUTE", "60")
+)
+BEDROCK_BURST: float = float(os.environ.get("BEDROCK_BURST", "10"))
+BEDROCK_MAX_CONCURRENCY: float = float(os.environ.get("BEDROCK_MAX_CONCURRENCY", "20"))
+BEDROCK_ADMISSION_TIMEOUT_SECONDS: float = float(
+    os.environ.get("BEDROCK_ADMISSION_TIMEOUT_SECONDS", "120")
+)
+BEDROCK_PROMPT_CACHING: bool = os.environ.get(
+    "BEDROCK_PROMPT_CACHING", "true"
+).lower() in ("true", "1", "yes")
+BEDROCK_STREAMING: bool = os.environ.get("BEDROCK_STREAMING", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+PARTIAL_RESULT_INTERVAL_SECONDS: float = float(
+    os.environ.get("PARTIAL_RESULT_INTERVAL_SECONDS", "2")
+)
+BEDROCK_RESPONSE_CACHE: bool = os.environ.get("BEDROCK_RESPONSE_CACHE", "").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+BEDROCK_RESPONSE_CACHE_TTL_SECONDS: int = int(
+    os.environ.get("BEDROCK_RESPONSE_CACHE_TTL_SECONDS", "604800")
+)
+BEDROCK_RESPONSE_CACHE_MAX_ENTRIES: int = int(
+    os.environ.get("BEDROCK_RESPONSE_CACHE_MAX_ENTRIES", "10000")
+)
+TRANSCRIPT_CHUNKING_THRESHOLD_CHARS: int = int(
+    os.environ.get("TRANSCRIPT_CHUNKING_THRESHOLD_CHARS", "200000")
+)
+TRANSCRIPT_SEGMENT_CHARS: int = int(os.environ.get("TRANSCRIPT_SEGMENT_CHARS", "40000"))
+TRANSCRIPT_SEGMENT_OVERLAP_CHARS: int = int(
+    os.environ.get("TRANSCRIPT_SEGMENT_OVERLAP_CHARS", "2000")
+)
+TRANSCRIPT_SEGMENT_WORKERS: int = int(os.environ.get("TRANSCRIPT_SEGMENT_WORKERS", "4"))
+PARALLEL_RUBRIC_SCORING: bool = os.environ.get(
+    "PARALLEL_RUBRIC_SCORING", ""
+).lower() in ("true", "1", "yes")
+RUBRIC_SCORING_WORKERS: int = int(os.environ.get("RUBRIC_SCORING_WORKERS", "8"))
 MOCK_BEDROCK: bool = os.environ.get("MOCK_BEDROCK", "").lower() in ("true", "1", "yes")
 MOCK_BEDROCK_DELAY_SECONDS: float = float(
     os.environ.get("MOCK_BEDROCK_DELAY_SECONDS", "3")
@@ -10,18 +10,23 @@ from shared import config
 _engine = None
 
 
+def database_url() -> URL:
+    return URL.create(
+        drivername="postgresql+psycopg2",
+        username=config.DB_USERNAME,
+        password=config.DB_PASSWORD,
+        host=config.DB_HOST,
+        port=int(config.DB_PORT),
+        database=config.DB_NAME,
+    )
+
+
 def get_engine():
     global _engine
     if _engine is None:
-        url = URL.create(
-            drivername="postgresql+psycopg2",
-            username=config.DB_USERNAME,
-            password=config.DB_PASSWORD,
-            host=config.DB_HOST,
-            port=int(config.DB_PORT),
-            database=config.DB_NAME,
+        _engine = create_engine(
+            database_url(), pool_size=config.DB_POOL_SIZE, max_overflow=0
         )
-        _engine = create_engine(url, pool_size=1, max_overflow=0)
     return _engine
 
 
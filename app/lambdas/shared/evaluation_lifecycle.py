@@ -1,27 +1,77 @@
+import json
+import logging
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from shared import db as db_module
 from shared.models import Evaluation
 
+logger = logging.getLogger(__name__)
+
+# Must match EVALUATION_STATUS_CHANNEL in the backend's evaluation_notify_service.
+EVALUATION_STATUS_CHANNEL = "evaluation_status"
+
+
+def notify_status_change(session: Session, evaluation: Evaluation) -> None:
+    """Queue a NOTIFY for the evaluation, delivered when the session commits.
+
+    ``progress`` is the row's ``updated_at`` after this write. It moves with
+    every result write, so a stream can tell a partial result from a status
+    change even while the status stays ``running``.
+    """
+    # Set here rather than by the column's onupdate, so the payload knows the
+    # stored value without a flush and a read back.
+    evaluation.updated_at = datetime.now(tz=UTC).replace(tzinfo=None)
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    payload = json.dumps(
+        {
+            "evaluation_id": evaluation.id,
+            "candidate_position_id": evaluation.candidate_position_id,
+            "step_type": evaluation.step_type,
+            "status": evaluation.status,
+            "version": evaluation.version,
+            "progress": evaluation.updated_at.isoformat(),
+        }
+    )
+    session.execute(select(func.pg_notify(EVALUATION_STATUS_CHANNEL, payload)))
+
 
 @contextmanager
 def run_evaluation(
     evaluation_id: int,
-) -> Generator[tuple[Session, Evaluation], None, None]:
+) -> Generator[tuple[Session, Evaluation] | None, None, None]:
+    """Claim a pending evaluation and mark it ``running`` for the caller.
+
+    Events are delivered at least once. The row is locked while its status
+    is checked, so of two deliveries of the same event only the first finds
+    it ``pending``; the other gets ``None`` and should return without work.
+    """
     with db_module.get_session() as session:
-        evaluation = session.get(Evaluation, evaluation_id)
+        evaluation = session.get(Evaluation, evaluation_id, with_for_update=True)
         if evaluation is None:
             raise ValueError(f"Evaluation {evaluation_id} not found")
+        if evaluation.status != "pending":
+            logger.info(
+                "Skipping evaluation %s already %s",
+                evaluation_id,
+                evaluation.status,
+            )
+            session.rollback()
+            yield None
+            return
 
         try:
             evaluation.status = "running"
             evaluation.started_at = datetime.now(tz=UTC)
             session.add(evaluation)
+            notify_status_change(session, evaluation)
             session.commit()
             session.refresh(evaluation)
 
@@ -30,6 +80,7 @@ def run_evaluation(
         except Exception as exc:
             session.rollback()
             evaluation.status = "failed"
+            evaluation.result = None
             error_msg = str(exc)
             sensitive_patterns = ("password=", "host=", "dbname=", "://")
             if any(p in error_msg.lower() for p in sensitive_patterns):
@@ -37,6 +88,7 @@ def run_evaluation(
             evaluation.error_message = f"{type(exc).__name__}: {error_msg}"
             evaluation.completed_at = datetime.now(tz=UTC)
             session.add(evaluation)
+            notify_status_change(session, evaluation)
             session.commit()
             raise
 
@@ -45,10 +97,40 @@ def complete_evaluation(
     session: Session,
     evaluation: Evaluation,
     result: dict[str, Any],
+    token_usage: dict[str, int] | None = None,
 ) -> None:
     evaluation.status = "completed"
     evaluation.result = result
+    if token_usage is not None:
+        evaluation.token_usage = token_usage
     evaluation.error_message = None
     evaluation.completed_at = datetime.now(tz=UTC)
     session.add(evaluation)
+    notify_status_change(session, evaluation)
     session.commit()
+
+
+def save_partial_result(
+    session: Session,
+    evaluation: Evaluation,
+    partial: dict[str, Any],
+) -> None:
+    """Store the result produced so far on a running evaluation.
+
+    The notification carries a new ``progress`` marker with the status still
+    ``running``. The backend stream turns that into a ``result_update``
+    event, and clients refetch to show results as they arrive. Best effort:
+    a failed write is rolled back and logged, and the evaluation carries on.
+    """
+    try:
+        evaluation.result = partial
+        session.add(evaluation)
+        notify_status_change(session, evaluation)
+        session.commit()
+    except SQLAlchemyError:
+        session.rollback()
+        logger.warning(
+            "Failed to save partial result for evaluation %s",
+            evaluation.id,
+            exc_info=True,
+        )
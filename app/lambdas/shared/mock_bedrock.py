@@ -159,6 +159,21 @@ MOCK_RESPONSES: dict[str, dict] = {
         "feedback_text": "Thank you for taking the time to interview with us for the Backend Engineer position. We genuinely appreciated your thoughtful preparation and the depth of experience you shared throughout the process.\n\nYour strong problem-solving skills were evident during the technical interview, particularly your ability to optimize solutions and write clean, well-structured code. Your communication style is clear and collaborative, which stood out positively.\n\nWhile your technical fundamentals are solid, we felt that deeper experience with distributed systems architecture would better align with the current needs of this particular role. We would encourage you to explore topics like eventual consistency patterns and event-driven architectures, as these would complement your already strong skill set.\n\nWe were impressed by your profile and would welcome the opportunity to stay connected for future roles that may be a better match. Please don't hesitate to reach out or apply again as our team continues to grow.",
         "rejection_stage": "technical",
     },
+    "transcript_evidence": {
+        "summary": "The candidate walks through a recent backend project and answers follow-up questions on data modelling and testing.",
+        "evidence": [
+            {
+                "topic": "System Design",
+                "quote": "We split the ingestion path into a queue and idempotent workers.",
+                "observation": "Chose a decoupled design and considered retries.",
+            },
+            {
+                "topic": "Testing",
+                "quote": "Honestly we didn't have integration tests for that part.",
+                "observation": "Acknowledged a gap in test coverage.",
+            },
+        ],
+    },
 }
 
 
@@ -14,14 +14,17 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    false,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.types import JSON
 from sqlmodel import Field, SQLModel
 
@@ -176,8 +179,16 @@ class Evaluation(SQLModel, table=True):
         ),
     )
     result: dict[str, Any] | None = Field(
+        default=None,
+        sa_column=Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True),
+    )
+    token_usage: dict[str, int] | None = Field(
         default=None, sa_column=Column(JSON, nullable=True)
     )
+    skip_response_cache: bool = Field(
+        default=False,
+        sa_column=Column(Boolean, nullable=False, server_default=false()),
+    )
     error_message: str | None = Field(
         default=None, sa_column=Column(Text, nullable=True)
     )
@@ -198,3 +209,39 @@ class Evaluation(SQLModel, table=True):
             DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
         )
     )
+
+
+class BedrockRateLimit(SQLModel, table=True):
+    __tablename__ = "bedrock_rate_limits"
+
+    model_id: str = Field(sa_column=Column(String, primary_key=True))
+    tokens: float = Field(sa_column=Column(Float, nullable=False))
+    concurrency_limit: float = Field(sa_column=Column(Float, nullable=False))
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime, nullable=False, server_default=func.now())
+    )
+
+
+class BedrockLease(SQLModel, table=True):
+    __tablename__ = "bedrock_leases"
+    __table_args__ = (
+        Index("ix_bedrock_leases_model_expires", "model_id", "expires_at"),
+    )
+
+    id: str = Field(sa_column=Column(String, primary_key=True))
+    model_id: str = Field(sa_column=Column(String, nullable=False))
+    expires_at: datetime = Field(sa_column=Column(DateTime, nullable=False))
+
+
+class BedrockResponseCache(SQLModel, table=True):
+    __tablename__ = "bedrock_response_cache"
+
+    fingerprint: str = Field(sa_column=Column(String, primary_key=True))
+    model_id: str = Field(sa_column=Column(String, nullable=False))
+    response: dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(
+        sa_column=Column(
+            DateTime, nullable=False, server_default=func.now(), index=True
+        )
+    )
+    expires_at: datetime = Field(sa_column=Column(DateTime, nullable=False, index=True))
@@ -0,0 +1,104 @@
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+TrimStrategy = Literal["head", "head_tail"]
+
+_HEAD_TAIL_HEAD_SHARE = 0.6
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for Claude models (about four characters per token)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass(frozen=True)
+class PromptSection:
+    """A variable-length part of a prompt that may be trimmed to fit the budget.
+
+    Sections with a lower ``priority`` are trimmed first. A section is never
+    cut below ``min_tokens``.
+    """
+
+    name: str
+    text: str
+    priority: int
+    strategy: TrimStrategy = "head"
+    min_tokens: int = 0
+
+
+@dataclass
+class PromptBudget:
+    """Token budget for one prompt, recording which sections were truncated.
+
+    Prompt builders call :meth:`fit` with their variable sections and the
+    estimated size of the full prompt. Handlers pass the evaluation result
+    to :meth:`record`.
+    """
+
+    max_tokens: int
+    truncated_sections: list[dict[str, Any]] = field(default_factory=list)
+
+    def fit(self, sections: list[PromptSection], prompt_tokens: int) -> dict[str, str]:
+        texts = {section.name: section.text for section in sections}
+        overflow = prompt_tokens - self.max_tokens
+        if overflow <= 0:
+            return texts
+
+        for section in sorted(sections, key=lambda s: s.priority):
+            original_tokens = estimate_tokens(section.text)
+            reduction = min(overflow, original_tokens - section.min_tokens)
+            if reduction <= 0:
+                continue
+            kept_tokens = original_tokens - reduction
+            texts[section.name] = _trim(section.text, kept_tokens, section.strategy)
+            self.truncated_sections.append(
+                {
+                    "section": section.name,
+                    "strategy": section.strategy,
+                    "original_tokens": original_tokens,
+                    "kept_tokens": kept_tokens,
+                }
+            )
+            overflow -= reduction
+            if overflow <= 0:
+                break
+        return texts
+
+    def record(self, result: dict[str, Any], evaluation_id: int) -> None:
+        """Log any truncation and copy it into ``result["truncated_sections"]``."""
+        if not self.truncated_sections:
+            return
+        logger.warning(
+            "Prompt truncated to fit token budget",
+            extra={
+                "evaluation_id": evaluation_id,
+                "truncated_sections": self.truncated_sections,
+            },
+        )
+        result["truncated_sections"] = self.truncated_sections
+
+
+def _omitted_marker(omitted: int) -> str:
+    return f"\n[... {omitted} characters omitted ...]\n"
+
+
+def _trim(text: str, kept_tokens: int, strategy: TrimStrategy) -> str:
+    # Size the marker for the largest count it can show, then report the
+    # characters actually dropped once the kept slice is known.
+    reserved = len(_omitted_marker(len(text)))
+    kept_chars = max(0, kept_tokens * CHARS_PER_TOKEN - reserved)
+    marker = _omitted_marker(len(text) - kept_chars)
+
+    if strategy == "head_tail":
+        head_chars = int(kept_chars * _HEAD_TAIL_HEAD_SHARE)
+        tail_chars = kept_chars - head_chars
+        tail = text[len(text) - tail_chars :] if tail_chars else ""
+        return text[:head_chars] + marker + tail
+
+    return text[:kept_chars] + marker.rstrip("\n")
@@ -1,5 +1,10 @@
 from typing import Any
 
+# Separates the per-position prompt prefix, which is identical for every
+# candidate, from the per-candidate remainder. shared.bedrock strips it and
+# marks the prefix as a prompt-cache breakpoint.
+CACHE_BREAKPOINT = "<cache_breakpoint/>"
+
 CV_ANALYSIS_ALL_FIELDS = (
     "experience_relevance",
     "education",
@@ -1,6 +1,12 @@
+import json
 from typing import Any
 
-from shared.prompts.formatters import format_cv_analysis_result, format_screening_result
+from shared.prompts.budget import PromptBudget, PromptSection, estimate_tokens
+from shared.prompts.formatters import (
+    CACHE_BREAKPOINT,
+    format_cv_analysis_result,
+    format_screening_result,
+)
 
 SYSTEM_PROMPT = """You score candidate technical interviews against a rubric. You assign scores based solely on evidence from the transcript, but use additional context (CV, position requirements, screening results) to provide deeper analysis.
 
@@ -109,19 +115,70 @@ TOOL_SCHEMA: dict[str, Any] = {
     ],
 }
 
+# Parallel scoring splits TOOL_SCHEMA: one call per rubric category returns
+# its criteria_scores, one summary call returns everything else.
+CATEGORY_TOOL_NAME = "technical_eval_category"
+
+CATEGORY_TOOL_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "criteria_scores": TOOL_SCHEMA["properties"]["criteria_scores"],
+    },
+    "required": ["criteria_scores"],
+}
+
+SUMMARY_TOOL_NAME = "technical_eval_summary"
+
+_PER_CRITERION_FIELDS = ("criteria_scores", "weighted_total")
+
+SUMMARY_TOOL_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        name: schema
+        for name, schema in TOOL_SCHEMA["properties"].items()
+        if name not in _PER_CRITERION_FIELDS
+    },
+    "required": [
+        name for name in TOOL_SCHEMA["required"] if name not in _PER_CRITERION_FIELDS
+    ],
+}
+
+# Declared together on every parallel scoring call, whichever one it forces,
+# so all of the calls send the same tool list and share its cached prefix.
+SCORING_TOOLS: dict[str, dict[str, Any]] = {
+    SUMMARY_TOOL_NAME: SUMMARY_TOOL_SCHEMA,
+    CATEGORY_TOOL_NAME: CATEGORY_TOOL_SCHEMA,
+}
+
+
+def _category_name(category: dict[str, Any]) -> str:
+    return category.get("name", "Uncategorized")
+
+
+def _format_category_criteria(category: dict[str, Any]) -> str:
+    lines = [f"### {_category_name(category)}"]
+    for criterion in category.get("criteria", []):
+        name = criterion.get("name", "")
+        weight = criterion.get("weight", 0)
+        description = criterion.get("description", "")
+        lines.append(f"- **{name}** (weight: {weight}): {description}")
+    return "\n".join(lines)
+
 
 def _format_rubric_criteria(rubric_structure: dict[str, Any]) -> str:
-    lines: list[str] = []
-    for category in rubric_structure.get("categories", []):
-        category_name = category.get("name", "Uncategorized")
-        lines.append(f"### {category_name}")
-        for criterion in category.get("criteria", []):
-            name = criterion.get("name", "")
-            weight = criterion.get("weight", 0)
-            description = criterion.get("description", "")
-            lines.append(f"- **{name}** (weight: {weight}): {description}")
-        lines.append("")
-    return "\n".join(lines).strip()
+    return "\n\n".join(
+        _format_category_criteria(category)
+        for category in rubric_structure.get("categories", [])
+    ).strip()
+
+
+def evidence_focus(rubric_structure: dict[str, Any]) -> str:
+    """What segment evidence extraction should look for in a long interview."""
+    return (
+        "Every rubric criterion below, plus anything that confirms or "
+        "contradicts the candidate's stated background:\n\n"
+        + _format_rubric_criteria(rubric_structure)
+    )
 
 
 def _format_cv_context(
@@ -153,33 +210,166 @@ def build_technical_eval_prompt(
     cv_text: str | None = None,
     screening_result: dict[str, Any] | None = None,
     evaluation_instructions: str = "",
+    budget: PromptBudget | None = None,
 ) -> tuple[str, str]:
     formatted_criteria = _format_rubric_criteria(rubric_structure)
+    texts = {
+        "position_description": position_description,
+        "transcript": transcript_text,
+        "cv_context": _format_cv_context(cv_analysis_result, cv_text),
+        "screening_context": _format_screening_context(screening_result),
+        "evaluation_instructions": evaluation_instructions,
+    }
+
+    user_prompt = _render_user_prompt(position_title, formatted_criteria, **texts)
+    if budget is None:
+        return SYSTEM_PROMPT, user_prompt
+
+    texts = _fit_to_budget(budget, texts, user_prompt)
+    if budget.truncated_sections:
+        user_prompt = _render_user_prompt(position_title, formatted_criteria, **texts)
+    return SYSTEM_PROMPT, user_prompt
 
-    context_sections: list[str] = []
 
-    if evaluation_instructions:
-        context_sections.append(
-            f'## Evaluation Instructions\n\n<document type="evaluation_instructions">\n{evaluation_instructions}\n</document>'
+def build_technical_eval_category_prompts(
+    position_title: str,
+    position_description: str,
+    rubric_structure: dict[str, Any],
+    transcript_text: str,
+    cv_analysis_result: dict[str, Any] | None = None,
+    cv_text: str | None = None,
+    screening_result: dict[str, Any] | None = None,
+    evaluation_instructions: str = "",
+    budget: PromptBudget | None = None,
+) -> tuple[str, str, list[str]]:
+    """Build prompts for scoring the rubric one category per call.
+
+    Returns the system prompt, the prompt for ``SUMMARY_TOOL_SCHEMA`` and one
+    prompt for ``CATEGORY_TOOL_SCHEMA`` per rubric category, in rubric order.
+    All of them share everything up to ``CACHE_BREAKPOINT`` (position, full
+    rubric, candidate context and transcript) and differ only in the short
+    task after it, so every call reads the same cached prefix.
+    """
+    formatted_criteria = _format_rubric_criteria(rubric_structure)
+    texts = {
+        "position_description": position_description,
+        "transcript": transcript_text,
+        "cv_context": _format_cv_context(cv_analysis_result, cv_text),
+        "screening_context": _format_screening_context(screening_result),
+        "evaluation_instructions": evaluation_instructions,
+    }
+    if budget is not None:
+        texts = _fit_to_budget(
+            budget,
+            texts,
+            _render_user_prompt(position_title, formatted_criteria, **texts),
         )
 
-    cv_context = _format_cv_context(cv_analysis_result, cv_text)
+    shared_context = _render_shared_context(position_title, formatted_criteria, **texts)
+    summary_prompt = f"""{shared_context}{CACHE_BREAKPOINT}Do not score individual criteria; they are scored separately. Assess the interview as a whole:
+{_ASSESSMENT_TASKS}"""
+    category_prompts = [
+        f"""{shared_context}{CACHE_BREAKPOINT}Score only the criteria in this rubric category:
+
+{_format_category_criteria(category)}
+
+For each, provide a score (1-5), the weight as listed, a direct evidence quote from the transcript, and your reasoning. Use "{_category_name(category)}" as the category_name."""
+        for category in rubric_structure.get("categories", [])
+    ]
+    return SYSTEM_PROMPT, summary_prompt, category_prompts
+
+
+def _fit_to_budget(
+    budget: PromptBudget, texts: dict[str, str], user_prompt: str
+) -> dict[str, str]:
+    return budget.fit(
+        [
+            PromptSection(
+                "cv_context", texts["cv_context"], priority=1, min_tokens=500
+            ),
+            PromptSection(
+                "screening_context",
+                texts["screening_context"],
+                priority=2,
+                min_tokens=250,
+            ),
+            PromptSection(
+                "transcript",
+                texts["transcript"],
+                priority=3,
+                strategy="head_tail",
+                min_tokens=2000,
+            ),
+            PromptSection(
+                "position_description",
+                texts["position_description"],
+                priority=4,
+                min_tokens=250,
+            ),
+            PromptSection(
+                "evaluation_instructions",
+                texts["evaluation_instructions"],
+                priority=5,
+                min_tokens=250,
+            ),
+        ],
+        prompt_tokens=estimate_tokens(
+            SYSTEM_PROMPT + json.dumps(TOOL_SCHEMA) + user_prompt
+        ),
+    )
+
+
+_ASSESSMENT_TASKS = """- Compare interview performance against the candidate's background (CV/prior analysis) and note alignments or contradictions.
+- If screening signals are available, assess consistency with technical performance.
+- Identify specific skill gaps relative to the position requirements.
+- Suggest 2-4 follow-up questions for areas needing deeper exploration."""
+
+
+def _render_instructions_section(evaluation_instructions: str) -> str:
+    if not evaluation_instructions:
+        return ""
+    return f"""## Evaluation Instructions
+
+<document type="evaluation_instructions">
+{evaluation_instructions}
+</document>
+
+---
+
+"""
+
+
+def _render_candidate_context(cv_context: str, screening_context: str) -> str:
+    candidate_sections: list[str] = []
+
     if cv_context:
-        context_sections.append(
+        candidate_sections.append(
             f'## Candidate Background\n\n<document type="cv_context">\n{cv_context}\n</document>'
         )
 
-    screening_context = _format_screening_context(screening_result)
     if screening_context:
-        context_sections.append(
+        candidate_sections.append(
             f'## Prior Screening Signals\n\n<document type="screening_context">\n{screening_context}\n</document>'
         )
 
-    additional_context = ""
-    if context_sections:
-        additional_context = "\n\n---\n\n".join(context_sections) + "\n\n---\n\n"
+    if not candidate_sections:
+        return ""
+    return "\n\n---\n\n".join(candidate_sections) + "\n\n---\n\n"
+
+
+def _render_user_prompt(
+    position_title: str,
+    formatted_criteria: str,
+    position_description: str,
+    transcript: str,
+    cv_context: str,
+    screening_context: str,
+    evaluation_instructions: str,
+) -> str:
+    instructions_section = _render_instructions_section(evaluation_instructions)
+    candidate_context = _render_candidate_context(cv_context, screening_context)
 
-    user_prompt = f"""Score the candidate interview transcript for the position described below using the rubric criteria provided.
+    return f"""Score the candidate interview transcript for the position described below using the rubric criteria provided.
 
 ## Position: {position_title}
 
@@ -190,16 +380,16 @@ def build_technical_eval_prompt(
 
 ---
 
-{additional_context}## Evaluation Rubric
+{instructions_section}## Evaluation Rubric
 
 {formatted_criteria}
 
 ---
 
-## Interview Transcript
+{CACHE_BREAKPOINT}{candidate_context}## Interview Transcript
 
 <document type="transcript">
-{transcript_text}
+{transcript}
 </document>
 
 ---
@@ -207,9 +397,44 @@ def build_technical_eval_prompt(
 Score every criterion from the rubric. For each, provide a score (1-5), the weight as listed, a direct evidence quote from the transcript, and your reasoning.
 
 Additionally:
-- Compare interview performance against the candidate's background (CV/prior analysis) and note alignments or contradictions.
-- If screening signals are available, assess consistency with technical performance.
-- Identify specific skill gaps relative to the position requirements.
-- Suggest 2-4 follow-up questions for areas needing deeper exploration."""
+{_ASSESSMENT_TASKS}"""
 
-    return SYSTEM_PROMPT, user_prompt
+
+def _render_shared_context(
+    position_title: str,
+    formatted_criteria: str,
+    position_description: str,
+    transcript: str,
+    cv_context: str,
+    screening_context: str,
+    evaluation_instructions: str,
+) -> str:
+    instructions_section = _render_instructions_section(evaluation_instructions)
+    candidate_context = _render_candidate_context(cv_context, screening_context)
+
+    return f"""Evaluate the candidate interview transcript for the position described below against the rubric provided.
+
+## Position: {position_title}
+
+### Description
+<document type="position_description">
+{position_description}
+</document>
+
+---
+
+{instructions_section}## Evaluation Rubric
+
+{formatted_criteria}
+
+---
+
+{candidate_context}## Interview Transcript
+
+<document type="transcript">
+{transcript}
+</document>
+
+---
+
+"""
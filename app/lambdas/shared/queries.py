@@ -1,27 +1,123 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
 
-from shared.models import Evaluation
+from shared.models import (
+    CandidatePosition,
+    Document,
+    Evaluation,
+    Position,
+    PositionRubricVersion,
+)
 
 
-def fetch_latest_completed_result(
+@dataclass
+class EvaluationContext:
+    candidate_position: CandidatePosition
+    position: Position
+    source_document: Document | None = None
+    rubric_version: PositionRubricVersion | None = None
+    cv_document_s3_key: str | None = None
+    latest_results: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def fetch_latest_completed_results(
     session: Session,
     candidate_position_id: int,
-    step_type: str,
-) -> dict[str, Any] | None:
-    stmt = (
-        select(Evaluation)
+    step_types: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Latest completed result per step type, in a single round trip.
+
+    Step types without a completed evaluation are absent from the returned dict.
+    """
+    ranked = (
+        select(
+            Evaluation.step_type,
+            Evaluation.result,
+            func.row_number()
+            .over(
+                partition_by=Evaluation.step_type,
+                order_by=Evaluation.version.desc(),
+            )
+            .label("rank"),
+        )
         .where(
             Evaluation.candidate_position_id == candidate_position_id,
-            Evaluation.step_type == step_type,
+            Evaluation.step_type.in_(list(step_types)),
             Evaluation.status == "completed",
         )
-        .order_by(Evaluation.version.desc())
-        .limit(1)
+        .subquery()
+    )
+    stmt = select(ranked.c.step_type, ranked.c.result).where(ranked.c.rank == 1)
+    return {
+        row.step_type: row.result
+        for row in session.execute(stmt).all()
+        if row.result is not None
+    }
+
+
+def load_evaluation_context(
+    session: Session,
+    evaluation: Evaluation,
+    result_step_types: Iterable[str] = (),
+    include_cv_fallback: bool = False,
+) -> EvaluationContext:
+    """Load the rows a handler needs for ``evaluation`` in one or two queries.
+
+    The candidate position, position, source document and rubric version come
+    back from a single joined SELECT. When ``result_step_types`` is given, the
+    latest completed result for each is loaded with one more query.
+    """
+    columns: list[Any] = [CandidatePosition, Position, Document, PositionRubricVersion]
+    if include_cv_fallback:
+        cv_document = aliased(Document)
+        columns.append(
+            select(cv_document.s3_key)
+            .where(
+                cv_document.candidate_position_id == CandidatePosition.id,
+                cv_document.type == "cv",
+                cv_document.status == "active",
+            )
+            .order_by(cv_document.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    stmt = (
+        select(*columns)
+        .select_from(CandidatePosition)
+        .outerjoin(Position, Position.id == CandidatePosition.position_id)
+        .outerjoin(Document, Document.id == evaluation.source_document_id)
+        .outerjoin(
+            PositionRubricVersion,
+            PositionRubricVersion.id == evaluation.rubric_version_id,
+        )
+        .where(CandidatePosition.id == evaluation.candidate_position_id)
+    )
+    row = session.execute(stmt).one_or_none()
+    if row is None:
+        raise ValueError(
+            f"CandidatePosition {evaluation.candidate_position_id} not found"
+        )
+
+    candidate_position, position, document, rubric_version = row[:4]
+    if position is None:
+        raise ValueError(f"Position {candidate_position.position_id} not found")
+
+    context = EvaluationContext(
+        candidate_position=candidate_position,
+        position=position,
+        source_document=document,
+        rubric_version=rubric_version,
+        cv_document_s3_key=row[4] if include_cv_fallback else None,
     )
-    row = session.execute(stmt).scalar_one_or_none()
-    if row is not None:
-        return row.result
-    return None
+
+    result_step_types = tuple(result_step_types)
+    if result_step_types:
+        context.latest_results = fetch_latest_completed_results(
+            session, evaluation.candidate_position_id, result_step_types
+        )
+    return context
@@ -0,0 +1,185 @@
+"""Client-side admission control for Bedrock, shared across Lambda invocations.
+
+Each model ID has a token bucket (``BEDROCK_REQUESTS_PER_MINUTE`` refill,
+``BEDROCK_BURST`` capacity) and an AIMD concurrency window stored in
+``bedrock_rate_limits``. In-flight calls are leases in ``bedrock_leases``.
+They expire on their own, so a crashed invocation cannot hold a slot forever.
+If the store itself is unreachable the limiter fails open.
+"""
+
+import logging
+import secrets
+import time
+import uuid
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from shared import config, db
+from shared.models import BedrockLease, BedrockRateLimit
+
+logger = logging.getLogger(__name__)
+
+_LEASE_TTL = timedelta(minutes=15)
+_MIN_CONCURRENCY = 1.0
+_DECREASE_FACTOR = 0.5
+_WAIT_BASE_SECONDS = 0.25
+_WAIT_CAP_SECONDS = 5.0
+
+_engine = None
+_random = secrets.SystemRandom()
+
+
+@dataclass
+class Permit:
+    model_id: str
+    lease_id: str | None
+    throttled: bool = False
+
+
+def full_jitter(attempt: int, base: float, cap: float) -> float:
+    return _random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def refill(tokens: float, elapsed_seconds: float) -> float:
+    rate = config.BEDROCK_REQUESTS_PER_MINUTE / 60
+    return min(config.BEDROCK_BURST, tokens + max(elapsed_seconds, 0.0) * rate)
+
+
+def next_concurrency_limit(limit: float, throttled: bool) -> float:
+    """Additive increase (about +1 per window of successes), multiplicative decrease."""
+    if throttled:
+        return max(_MIN_CONCURRENCY, limit * _DECREASE_FACTOR)
+    return min(config.BEDROCK_MAX_CONCURRENCY, limit + 1 / max(limit, 1.0))
+
+
+def _get_engine():
+    # Separate from shared.db's engine: the handler's session keeps that
+    # single connection checked out for the whole invocation. Parallel
+    # segment and category calls each need a connection for admission.
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            db.database_url(), pool_size=_pool_size(), max_overflow=0
+        )
+    return _engine
+
+
+def _pool_size() -> int:
+    return max(1, config.TRANSCRIPT_SEGMENT_WORKERS, config.RUBRIC_SCORING_WORKERS)
+
+
+def _try_acquire(model_id: str) -> str | None:
+    with Session(_get_engine()) as session, session.begin():
+        session.execute(
+            insert(BedrockRateLimit)
+            .values(
+                model_id=model_id,
+                tokens=config.BEDROCK_BURST,
+                concurrency_limit=config.BEDROCK_MAX_CONCURRENCY,
+            )
+            .on_conflict_do_nothing(index_elements=["model_id"])
+        )
+        state, elapsed = session.execute(
+            select(
+                BedrockRateLimit,
+                func.extract("epoch", func.now() - BedrockRateLimit.updated_at),
+            )
+            .where(BedrockRateLimit.model_id == model_id)
+            .with_for_update()
+        ).one()
+        session.execute(
+            delete(BedrockLease).where(
+                BedrockLease.model_id == model_id,
+                BedrockLease.expires_at <= func.now(),
+            )
+        )
+        in_flight = session.scalar(
+            select(func.count())
+            .select_from(BedrockLease)
+            .where(BedrockLease.model_id == model_id)
+        )
+
+        tokens = refill(state.tokens, float(elapsed or 0))
+        admitted = tokens >= 1 and in_flight < int(state.concurrency_limit)
+        lease_id = None
+        if admitted:
+            tokens -= 1
+            lease_id = uuid.uuid4().hex
+            session.add(
+                BedrockLease(
+                    id=lease_id,
+                    model_id=model_id,
+                    expires_at=func.now() + _LEASE_TTL,
+                )
+            )
+        state.tokens = tokens
+        state.updated_at = func.now()
+        return lease_id
+
+
+def _release(permit: Permit) -> None:
+    with Session(_get_engine()) as session, session.begin():
+        session.execute(delete(BedrockLease).where(BedrockLease.id == permit.lease_id))
+        state = session.get(BedrockRateLimit, permit.model_id, with_for_update=True)
+        if state is not None:
+            state.concurrency_limit = next_concurrency_limit(
+                state.concurrency_limit, permit.throttled
+            )
+
+
+def acquire(model_id: str) -> Permit:
+    """Wait for a token and a concurrency slot for ``model_id``.
+
+    Raises ``RuntimeError`` after ``BEDROCK_ADMISSION_TIMEOUT_SECONDS``.
+    """
+    if not config.BEDROCK_RATE_LIMIT_ENABLED:
+        return Permit(model_id, None)
+
+    deadline = time.monotonic() + config.BEDROCK_ADMISSION_TIMEOUT_SECONDS
+    attempt = 0
+    while True:
+        try:
+            lease_id = _try_acquire(model_id)
+        except SQLAlchemyError:
+            logger.warning(
+                "Bedrock rate limiter unavailable, admitting call", exc_info=True
+            )
+            return Permit(model_id, None)
+        if lease_id is not None:
+            return Permit(model_id, lease_id)
+        if time.monotonic() >= deadline:
+            raise RuntimeError(
+                f"Timed out waiting for Bedrock admission for {model_id}"
+            )
+        time.sleep(full_jitter(attempt, _WAIT_BASE_SECONDS, _WAIT_CAP_SECONDS))
+        attempt += 1
+
+
+def release(permit: Permit) -> None:
+    if permit.lease_id is None:
+        return
+    try:
+        _release(permit)
+    except SQLAlchemyError:
+        logger.warning("Failed to release Bedrock lease", exc_info=True)
+
+
+@contextmanager
+def admission(model_id: str) -> Generator[Permit, None, None]:
+    """Hold an admission permit for one Bedrock call.
+
+    Set ``permit.throttled`` when the call was rejected with 429/529 so the
+    shared concurrency window shrinks on release.
+    """
+    permit = acquire(model_id)
+    try:
+        yield permit
+    finally:
+        release(permit)
@@ -0,0 +1,117 @@
+"""Cache of structured Bedrock results, shared across Lambda invocations.
+
+Reruns with unchanged inputs build byte-identical requests. Their results are
+stored in ``bedrock_response_cache`` under a fingerprint of everything that
+determines the request, and kept for ``BEDROCK_RESPONSE_CACHE_TTL_SECONDS``.
+Each write removes expired rows and the oldest ones beyond
+``BEDROCK_RESPONSE_CACHE_MAX_ENTRIES``. If the store is unreachable the cache
+is skipped.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from shared import config, db
+from shared.models import BedrockResponseCache
+
+logger = logging.getLogger(__name__)
+
+_engine = None
+
+
+def fingerprint(
+    model_id: str,
+    system_prompt: str,
+    prompt: str,
+    tool_name: str,
+    tool_schema: dict[str, Any],
+    max_tokens: int,
+    tools: dict[str, dict[str, Any]] | None = None,
+) -> str:
+    parts: list[Any] = [
+        model_id,
+        system_prompt,
+        prompt,
+        tool_name,
+        tool_schema,
+        max_tokens,
+    ]
+    if tools is not None:
+        parts.append(tools)
+    request = json.dumps(
+        parts,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(request.encode()).hexdigest()
+
+
+def _get_engine():
+    # Separate from shared.db's engine, like the rate limiter's: the handler's
+    # session keeps that single connection checked out.
+    global _engine
+    if _engine is None:
+        _engine = create_engine(db.database_url(), pool_size=1, max_overflow=0)
+    return _engine
+
+
+def get(key: str) -> dict[str, Any] | None:
+    try:
+        with Session(_get_engine()) as session:
+            return session.scalar(
+                select(BedrockResponseCache.response).where(
+                    BedrockResponseCache.fingerprint == key,
+                    BedrockResponseCache.expires_at > func.now(),
+                )
+            )
+    except SQLAlchemyError:
+        logger.warning("Bedrock response cache unavailable", exc_info=True)
+        return None
+
+
+def put(key: str, model_id: str, response: dict[str, Any]) -> None:
+    expires_at = func.now() + timedelta(
+        seconds=config.BEDROCK_RESPONSE_CACHE_TTL_SECONDS
+    )
+    stmt = insert(BedrockResponseCache).values(
+        fingerprint=key,
+        model_id=model_id,
+        response=response,
+        expires_at=expires_at,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["fingerprint"],
+        set_={
+            "response": stmt.excluded.response,
+            "created_at": func.now(),
+            "expires_at": stmt.excluded.expires_at,
+        },
+    )
+    overflow = (
+        select(BedrockResponseCache.fingerprint)
+        .order_by(BedrockResponseCache.created_at.desc())
+        .offset(config.BEDROCK_RESPONSE_CACHE_MAX_ENTRIES)
+    )
+    try:
+        with Session(_get_engine()) as session, session.begin():
+            session.execute(stmt)
+            session.execute(
+                delete(BedrockResponseCache).where(
+                    BedrockResponseCache.expires_at <= func.now()
+                )
+            )
+            session.execute(
+                delete(BedrockResponseCache).where(
+                    BedrockResponseCache.fingerprint.in_(overflow)
+                )
+            )
+    except SQLAlchemyError:
+        logger.warning("Failed to store Bedrock response in cache", exc_info=True)
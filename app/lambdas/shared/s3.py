@@ -1,19 +1,27 @@
+import hashlib
 import io
+import logging
+import time
 
-import boto3
-import docx
-from pypdf import PdfReader
+from botocore.exceptions import ClientError
 
 from shared import config
 
+logger = logging.getLogger(__name__)
+
 _client = None
 
 _MAX_DOCUMENT_SIZE_BYTES = 50 * 1024 * 1024
 
+_PARSED_EXTENSIONS = (".pdf", ".docx")
+_CACHE_MISS_ERROR_CODES = frozenset({"NoSuchKey", "404", "NotFound", "AccessDenied"})
+
 
 def get_client():
     global _client
     if _client is None:
+        import boto3
+
         kwargs = {"region_name": config.AWS_REGION}
         if config.S3_ENDPOINT_URL:
             kwargs["endpoint_url"] = config.S3_ENDPOINT_URL
@@ -22,22 +30,96 @@ def get_client():
 
 
 def get_document_text(s3_key: str) -> str:
+    """Return the plain text of a document stored in S3.
+
+    PDF and DOCX text is cached in a sidecar object addressed by the source
+    key and ETag, so repeat calls for an unchanged document skip both the
+    download and the parse. Plain text is always read directly.
+    """
     client = get_client()
+    cacheable = bool(config.TEXT_CACHE_PREFIX) and s3_key.lower().endswith(
+        _PARSED_EXTENSIONS
+    )
+
+    if cacheable:
+        etag = _head_etag(client, s3_key)
+        cached = _read_cached_text(client, _text_cache_key(s3_key, etag))
+        if cached is not None:
+            return cached
+
+    body, etag = _download(client, s3_key)
+    text = _extract_text(s3_key, body)
+
+    if cacheable:
+        _write_cached_text(client, _text_cache_key(s3_key, etag), text)
+    return text
+
+
+def _download(client, s3_key: str) -> tuple[bytes, str]:
     try:
         response = client.get_object(Bucket=config.S3_BUCKET_NAME, Key=s3_key)
-        content_length = int(response.get("ContentLength", 0))
-        if content_length > _MAX_DOCUMENT_SIZE_BYTES:
-            raise ValueError(
-                f"Document exceeds maximum allowed size of "
-                f"{_MAX_DOCUMENT_SIZE_BYTES // (1024 * 1024)}MB: "
-                f"key={s3_key} size={content_length}"
-            )
-        body = response["Body"].read()
+        _check_size(s3_key, int(response.get("ContentLength", 0)))
+        return response["Body"].read(), response.get("ETag", "")
     except client.exceptions.NoSuchKey as exc:
-        raise FileNotFoundError(
-            f"Document not found in S3: bucket={config.S3_BUCKET_NAME} key={s3_key}"
-        ) from exc
+        raise _not_found(s3_key) from exc
+
+
+def _head_etag(client, s3_key: str) -> str:
+    try:
+        response = client.head_object(Bucket=config.S3_BUCKET_NAME, Key=s3_key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            raise _not_found(s3_key) from exc
+        raise
+    _check_size(s3_key, int(response.get("ContentLength", 0)))
+    return response.get("ETag", "")
+
+
+def _check_size(s3_key: str, content_length: int) -> None:
+    if content_length > _MAX_DOCUMENT_SIZE_BYTES:
+        raise ValueError(
+            f"Document exceeds maximum allowed size of "
+            f"{_MAX_DOCUMENT_SIZE_BYTES // (1024 * 1024)}MB: "
+            f"key={s3_key} size={content_length}"
+        )
 
+
+def _not_found(s3_key: str) -> FileNotFoundError:
+    return FileNotFoundError(
+        f"Document not found in S3: bucket={config.S3_BUCKET_NAME} key={s3_key}"
+    )
+
+
+def _text_cache_key(s3_key: str, etag: str) -> str:
+    etag = etag.strip('"')
+    fingerprint = f"{s3_key}\0{etag}\0{config.PDF_TEXT_CHAR_BUDGET}"
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+    return f"{config.TEXT_CACHE_PREFIX}{digest}.txt"
+
+
+def _read_cached_text(client, cache_key: str) -> str | None:
+    try:
+        response = client.get_object(Bucket=config.S3_BUCKET_NAME, Key=cache_key)
+        return response["Body"].read().decode("utf-8")
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") not in _CACHE_MISS_ERROR_CODES:
+            logger.warning("Failed to read cached text %s", cache_key, exc_info=True)
+        return None
+
+
+def _write_cached_text(client, cache_key: str, text: str) -> None:
+    try:
+        client.put_object(
+            Bucket=config.S3_BUCKET_NAME,
+            Key=cache_key,
+            Body=text.encode("utf-8"),
+            ContentType="text/plain; charset=utf-8",
+        )
+    except ClientError:
+        logger.warning("Failed to write cached text %s", cache_key, exc_info=True)
+
+
+def _extract_text(s3_key: str, body: bytes) -> str:
     key_lower = s3_key.lower()
 
     if key_lower.endswith(".pdf"):
@@ -49,13 +131,55 @@ def get_document_text(s3_key: str) -> str:
     return body.decode("utf-8")
 
 
-def _extract_pdf_text(data: bytes) -> str:
+def _extract_pdf_text(data: bytes, char_budget: int | None = None) -> str:
+    """Extract PDF text page by page.
+
+    Extraction stops as soon as the accumulated text reaches ``char_budget``
+    (``PDF_TEXT_CHAR_BUDGET`` by default, 0 means unlimited), so pages past
+    the budget are never parsed.
+    """
+    from pypdf import PdfReader
+
+    budget = config.PDF_TEXT_CHAR_BUDGET if char_budget is None else char_budget
     reader = PdfReader(io.BytesIO(data))
-    pages = [page.extract_text() or "" for page in reader.pages]
-    return "\n".join(pages)
+    page_count = len(reader.pages)
+
+    pages: list[str] = []
+    timings: list[float] = []
+    total_chars = 0
+    started = time.perf_counter()
+    for page in reader.pages:
+        page_started = time.perf_counter()
+        text = page.extract_text() or ""
+        seconds = time.perf_counter() - page_started
+        logger.debug(
+            "Extracted PDF page %d/%d: %d chars in %.3fs",
+            len(pages) + 1,
+            page_count,
+            len(text),
+            seconds,
+        )
+        pages.append(text)
+        timings.append(seconds)
+        total_chars += len(text) + 1
+        if budget and total_chars >= budget:
+            break
+
+    logger.info(
+        "Extracted %d/%d PDF pages (%d chars) in %.3fs, slowest page %.3fs",
+        len(pages),
+        page_count,
+        total_chars,
+        time.perf_counter() - started,
+        max(timings, default=0.0),
+    )
+    result = "\n".join(pages)
+    return result[:budget] if budget else result
 
 
 def _extract_docx_text(data: bytes) -> str:
+    import docx
+
     doc = docx.Document(io.BytesIO(data))
     paragraphs = [para.text for para in doc.paragraphs]
     return "\n".join(paragraphs)
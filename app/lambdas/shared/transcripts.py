@@ -0,0 +1,114 @@
+"""Map-reduce condensing for transcripts too long to score in one prompt.
+
+The transcript is split into overlapping segments at speaker turns, evidence
+is extracted from every segment in parallel Bedrock calls, and the rendered
+evidence stands in for the transcript in the scoring prompt.
+"""
+
+import itertools
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from shared import bedrock as bedrock_module
+from shared import config
+from shared.prompts.transcript_evidence import (
+    TOOL_NAME,
+    TOOL_SCHEMA,
+    build_transcript_evidence_prompt,
+    format_transcript_evidence,
+)
+
+# A line opening a speaker turn: "Interviewer:", "[00:12:31] Jane Doe:", ...
+_SPEAKER_TURN = re.compile(
+    r"^(?=[ \t]*(?:\[[\d:.]+\][ \t]*)?[A-Z][^\n:]{0,40}:)", re.MULTILINE
+)
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+
+
+def _split_turns(text: str, max_chars: int) -> list[str]:
+    """Split at speaker turns, or at blank lines if there are no speaker labels.
+
+    Concatenating the pieces gives back ``text``; pieces longer than
+    ``max_chars`` are cut into ``max_chars`` slices.
+    """
+    starts = [m.start() for m in _SPEAKER_TURN.finditer(text) if m.start() > 0]
+    if not starts:
+        starts = [m.end() for m in _PARAGRAPH_BREAK.finditer(text)]
+    bounds = [0, *starts, len(text)]
+    turns: list[str] = []
+    for start, end in itertools.pairwise(bounds):
+        turn = text[start:end]
+        turns.extend(turn[i : i + max_chars] for i in range(0, len(turn), max_chars))
+    return [turn for turn in turns if turn]
+
+
+def split_transcript(text: str, segment_chars: int, overlap_chars: int) -> list[str]:
+    """Pack whole turns into segments of about ``segment_chars``.
+
+    Each segment after the first repeats the trailing turns of the previous
+    one, up to ``overlap_chars``, so an exchange cut at a boundary is seen
+    whole at least once.
+    """
+    segments: list[str] = []
+    current: list[str] = []
+    size = 0
+    for turn in _split_turns(text, segment_chars):
+        if current and size + len(turn) > segment_chars:
+            segments.append("".join(current))
+            carried: list[str] = []
+            carried_size = 0
+            for previous in reversed(current):
+                if carried_size + len(previous) > overlap_chars:
+                    break
+                carried.insert(0, previous)
+                carried_size += len(previous)
+            if carried_size + len(turn) > segment_chars:
+                carried, carried_size = [], 0
+            current, size = carried, carried_size
+        current.append(turn)
+        size += len(turn)
+    if current:
+        segments.append("".join(current))
+    return segments
+
+
+def needs_condensing(transcript_text: str) -> bool:
+    return len(transcript_text) > config.TRANSCRIPT_CHUNKING_THRESHOLD_CHARS
+
+
+def condense_transcript(
+    transcript_text: str,
+    focus: str,
+    usage: bedrock_module.TokenUsage,
+    use_cache: bool = True,
+) -> tuple[str, int]:
+    """Return the condensed evidence for ``transcript_text`` and its segment count.
+
+    Token usage of every segment call is added to ``usage``.
+    """
+    segments = split_transcript(
+        transcript_text,
+        config.TRANSCRIPT_SEGMENT_CHARS,
+        config.TRANSCRIPT_SEGMENT_OVERLAP_CHARS,
+    )
+
+    def _extract(number: int, segment: str) -> dict[str, Any]:
+        system_prompt, user_prompt = build_transcript_evidence_prompt(
+            segment, number, len(segments), focus
+        )
+        return bedrock_module.invoke_claude_structured(
+            prompt=user_prompt,
+            tool_name=TOOL_NAME,
+            tool_schema=TOOL_SCHEMA,
+            system_prompt=system_prompt,
+            step_type="transcript_evidence",
+            usage=usage,
+            use_cache=use_cache,
+        )
+
+    workers = max(1, min(config.TRANSCRIPT_SEGMENT_WORKERS, len(segments)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        extracted = list(pool.map(_extract, range(1, len(segments) + 1), segments))
+
+    return format_transcript_evidence(extracted), len(segments)
@@ -1,31 +1,42 @@
 import logging
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
 
 sys.path.insert(0, "/opt/python")
 sys.path.insert(0, "/var/task")
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from shared import bedrock as bedrock_module
+from shared import config
 from shared import s3 as s3_module
-from shared.evaluation_lifecycle import complete_evaluation, run_evaluation
-from shared.models import (
-    CandidatePosition,
-    Document,
-    Position,
-    PositionRubricVersion,
+from shared import transcripts as transcripts_module
+from shared.evaluation_lifecycle import (
+    complete_evaluation,
+    run_evaluation,
+    save_partial_result,
 )
+from shared.models import Evaluation
+from shared.prompts.budget import PromptBudget
 from shared.prompts.technical_eval import (
+    CATEGORY_TOOL_NAME,
+    CATEGORY_TOOL_SCHEMA,
+    SCORING_TOOLS,
+    SUMMARY_TOOL_NAME,
+    SUMMARY_TOOL_SCHEMA,
     TOOL_NAME,
     TOOL_SCHEMA,
+    build_technical_eval_category_prompts,
     build_technical_eval_prompt,
+    evidence_focus,
 )
-from shared.queries import fetch_latest_completed_result
+from shared.queries import fetch_latest_completed_results, load_evaluation_context
 
 logger = logging.getLogger(__name__)
 
+_UPSTREAM_STEP_TYPES = ("cv_analysis", "screening_eval")
+
 
 def _calculate_weighted_total(criteria_scores: list[dict[str, Any]]) -> float:
     total_weight = sum(c.get("weight", 0) for c in criteria_scores)
@@ -35,138 +46,242 @@ def _calculate_weighted_total(criteria_scores: list[dict[str, Any]]) -> float:
     return round(weighted_sum / total_weight, 4)
 
 
-def _fetch_cv_context(
+def _fetch_upstream_results(
     session: Session,
     candidate_position_id: int,
-) -> tuple[dict[str, Any] | None, str | None, str | None]:
-    cv_analysis_result: dict[str, Any] | None = None
-    cv_text: str | None = None
-    errors: list[str] = []
-
+) -> tuple[dict[str, dict[str, Any]], str | None]:
     try:
-        cv_analysis_result = fetch_latest_completed_result(
-            session, candidate_position_id, "cv_analysis"
+        results = fetch_latest_completed_results(
+            session, candidate_position_id, _UPSTREAM_STEP_TYPES
         )
+        return results, None
     except Exception as exc:
-        errors.append(f"cv_analysis query failed: {exc}")
         try:
             session.rollback()
         except Exception:
             pass
+        return {}, f"upstream results query failed: {exc}"
 
-    if cv_analysis_result is None:
-        try:
-            stmt = (
-                select(Document)
-                .where(
-                    Document.candidate_position_id == candidate_position_id,
-                    Document.type == "cv",
-                    Document.status == "uploaded",
-                )
-                .limit(1)
-            )
-            doc = session.execute(stmt).scalar_one_or_none()
-            if doc is not None:
-                cv_text = s3_module.get_document_text(doc.s3_key)
-        except Exception as exc:
-            errors.append(f"CV document fetch failed: {exc}")
-            try:
-                session.rollback()
-            except Exception:
-                pass
 
-    error_msg = "; ".join(errors) if errors else None
-    return cv_analysis_result, cv_text, error_msg
+def _fetch_cv_text(cv_document_s3_key: str | None) -> tuple[str | None, str | None]:
+    if cv_document_s3_key is None:
+        return None, None
+    try:
+        return s3_module.get_document_text(cv_document_s3_key), None
+    except Exception as exc:
+        return None, f"CV document fetch failed: {exc}"
 
 
-def _fetch_screening_result(
+def _invoke(
+    prompt: str,
+    tool_name: str,
+    tool_schema: dict[str, Any],
+    system_prompt: str,
+    usage: bedrock_module.TokenUsage,
+    use_cache: bool,
+    tools: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    return bedrock_module.invoke_claude_structured(
+        prompt=prompt,
+        tool_name=tool_name,
+        tool_schema=tool_schema,
+        system_prompt=system_prompt,
+        step_type="technical_eval",
+        usage=usage,
+        use_cache=use_cache,
+        tools=tools,
+    )
+
+
+def _score_by_category(
     session: Session,
-    candidate_position_id: int,
-) -> tuple[dict[str, Any] | None, str | None]:
-    try:
-        result = fetch_latest_completed_result(
-            session, candidate_position_id, "screening_eval"
+    evaluation: Evaluation,
+    system_prompt: str,
+    summary_prompt: str,
+    category_prompts: list[str],
+    usage: bedrock_module.TokenUsage,
+) -> dict[str, Any]:
+    """Score each rubric category and the summary fields in concurrent calls.
+
+    The first category is scored alone so its call writes the prompt cache,
+    then the rest fan out and read it. Every call declares ``SCORING_TOOLS``,
+    so even the summary, which forces a different tool, reuses the cached
+    tools and system prompt.
+
+    Criteria scores are merged in rubric order. Every call that finishes
+    before the last one saves a partial result holding the summary fields
+    and the scores so far, so recruiters see the evaluation fill in.
+    """
+    use_cache = not evaluation.skip_response_cache
+    summary: dict[str, Any] = {}
+    scores: dict[int, list[dict[str, Any]]] = {}
+    # None marks the summary call; categories carry their rubric index.
+    calls: list[tuple[int | None, str]] = [
+        *enumerate(category_prompts),
+        (None, summary_prompt),
+    ]
+
+    def _call(prompt: str, index: int | None) -> dict[str, Any]:
+        if index is None:
+            tool_name, tool_schema = SUMMARY_TOOL_NAME, SUMMARY_TOOL_SCHEMA
+        else:
+            tool_name, tool_schema = CATEGORY_TOOL_NAME, CATEGORY_TOOL_SCHEMA
+        return _invoke(
+            prompt,
+            tool_name,
+            tool_schema,
+            system_prompt,
+            usage,
+            use_cache,
+            SCORING_TOOLS,
         )
-        return result, None
-    except Exception as exc:
-        try:
-            session.rollback()
-        except Exception:
-            pass
-        return None, f"screening_eval query failed: {exc}"
+
+    def _record(index: int | None, call_result: dict[str, Any]) -> None:
+        nonlocal summary
+        if index is None:
+            summary = call_result
+        else:
+            scores[index] = call_result.get("criteria_scores", [])
+
+    def _merged() -> dict[str, Any]:
+        merged = [score for index in sorted(scores) for score in scores[index]]
+        return {**summary, "criteria_scores": merged}
+
+    (first_index, first_prompt), rest = calls[0], calls[1:]
+    _record(first_index, _call(first_prompt, first_index))
+    if not rest:
+        return _merged()
+    save_partial_result(session, evaluation, _merged())
+
+    workers = max(1, min(config.RUBRIC_SCORING_WORKERS, len(rest)))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    futures: dict[Future, int | None] = {
+        pool.submit(_call, prompt, index): index for index, prompt in rest
+    }
+    try:
+        for finished, future in enumerate(as_completed(futures), start=1):
+            _record(futures[future], future.result())
+            if finished < len(futures):
+                save_partial_result(session, evaluation, _merged())
+    except BaseException:
+        # Drop the queued calls and fail now. Calls already in flight cannot
+        # be interrupted; their results are discarded.
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+    return _merged()
 
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     detail = event.get("detail", event)
     evaluation_id: int = detail["evaluation_id"]
 
-    with run_evaluation(evaluation_id) as (session, evaluation):
+    with run_evaluation(evaluation_id) as claimed:
+        if claimed is None:
+            return {}
+        session, evaluation = claimed
         if evaluation.source_document_id is None:
             raise ValueError(f"Evaluation {evaluation_id} has no source_document_id")
 
         if evaluation.rubric_version_id is None:
             raise ValueError("No rubric assigned")
 
-        document = session.get(Document, evaluation.source_document_id)
+        eval_context = load_evaluation_context(
+            session, evaluation, include_cv_fallback=True
+        )
+        document = eval_context.source_document
         if document is None:
             raise ValueError(f"Document {evaluation.source_document_id} not found")
 
-        candidate_position = session.get(
-            CandidatePosition, evaluation.candidate_position_id
-        )
-        if candidate_position is None:
-            raise ValueError(
-                f"CandidatePosition {evaluation.candidate_position_id} not found"
-            )
-
-        position = session.get(Position, candidate_position.position_id)
-        if position is None:
-            raise ValueError(f"Position {candidate_position.position_id} not found")
-
-        rubric_version = session.get(
-            PositionRubricVersion, evaluation.rubric_version_id
-        )
+        rubric_version = eval_context.rubric_version
         if rubric_version is None:
             raise ValueError(
                 f"PositionRubricVersion {evaluation.rubric_version_id} not found"
             )
+        position = eval_context.position
 
-        cv_analysis_result, cv_text, cv_error = _fetch_cv_context(
+        upstream_results, upstream_error = _fetch_upstream_results(
             session, evaluation.candidate_position_id
         )
-        if cv_error:
-            logger.error("CV context fetch failed: %s", cv_error)
+        if upstream_error:
+            logger.error("Upstream context fetch failed: %s", upstream_error)
 
-        screening_result, screening_error = _fetch_screening_result(
-            session, evaluation.candidate_position_id
-        )
-        if screening_error:
-            logger.error("Screening result fetch failed: %s", screening_error)
+        cv_analysis_result = upstream_results.get("cv_analysis")
+        screening_result = upstream_results.get("screening_eval")
+
+        cv_text: str | None = None
+        if cv_analysis_result is None:
+            cv_text, cv_error = _fetch_cv_text(eval_context.cv_document_s3_key)
+            if cv_error:
+                logger.error("CV context fetch failed: %s", cv_error)
 
         transcript_text = s3_module.get_document_text(document.s3_key)
 
-        system_prompt, user_prompt = build_technical_eval_prompt(
-            position_title=position.title,
-            position_description=position.requirements or "",
-            rubric_structure=rubric_version.structure,
-            transcript_text=transcript_text,
-            cv_analysis_result=cv_analysis_result,
-            cv_text=cv_text,
-            screening_result=screening_result,
-            evaluation_instructions=position.evaluation_instructions or "",
-        )
+        usage = bedrock_module.TokenUsage()
+        transcript_chunks = 0
+        if transcripts_module.needs_condensing(transcript_text):
+            transcript_text, transcript_chunks = transcripts_module.condense_transcript(
+                transcript_text,
+                evidence_focus(rubric_version.structure),
+                usage,
+                use_cache=not evaluation.skip_response_cache,
+            )
 
-        result = bedrock_module.invoke_claude_structured(
-            prompt=user_prompt,
-            tool_name=TOOL_NAME,
-            tool_schema=TOOL_SCHEMA,
-            system_prompt=system_prompt,
-            step_type="technical_eval",
-        )
+        budget = PromptBudget(config.PROMPT_TOKEN_BUDGET)
+        prompt_args: dict[str, Any] = {
+            "position_title": position.title,
+            "position_description": position.requirements or "",
+            "rubric_structure": rubric_version.structure,
+            "transcript_text": transcript_text,
+            "cv_analysis_result": cv_analysis_result,
+            "cv_text": cv_text,
+            "screening_result": screening_result,
+            "evaluation_instructions": position.evaluation_instructions or "",
+            "budget": budget,
+        }
+
+        # The mock returns a whole canned evaluation per call, so mock runs
+        # always take the single-call path.
+        if (
+            config.PARALLEL_RUBRIC_SCORING
+            and not config.MOCK_BEDROCK
+            and len(rubric_version.structure.get("categories", [])) > 1
+        ):
+            system_prompt, summary_prompt, category_prompts = (
+                build_technical_eval_category_prompts(**prompt_args)
+            )
+            result = _score_by_category(
+                session,
+                evaluation,
+                system_prompt,
+                summary_prompt,
+                category_prompts,
+                usage,
+            )
+        else:
+            system_prompt, user_prompt = build_technical_eval_prompt(**prompt_args)
+            result = bedrock_module.invoke_claude_structured(
+                prompt=user_prompt,
+                tool_name=TOOL_NAME,
+                tool_schema=TOOL_SCHEMA,
+                system_prompt=system_prompt,
+                step_type="technical_eval",
+                usage=usage,
+                use_cache=not evaluation.skip_response_cache,
+                on_partial=lambda partial: save_partial_result(
+                    session, evaluation, partial
+                ),
+            )
 
         result["weighted_total"] = _calculate_weighted_total(
             result.get("criteria_scores", [])
         )
 
-        complete_evaluation(session, evaluation, result)
+        budget.record(result, evaluation_id)
+
+        if transcript_chunks:
+            result["transcript_chunks"] = transcript_chunks
+
+        complete_evaluation(session, evaluation, result, token_usage=usage.as_dict())
         return result
@@ -1,4 +1,8 @@
+import os
 import sys
 from pathlib import Path
 
+# The Bedrock admission controller needs Postgres; tests exercise it directly.
+os.environ.setdefault("BEDROCK_RATE_LIMIT_ENABLED", "false")
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -67,7 +67,7 @@ def _make_session_mock(
 ) -> MagicMock:
     session = MagicMock()
 
-    def session_get(model_class, pk):
+    def session_get(model_class, pk, **kwargs):
         if model_class.__name__ == "Evaluation":
             return evaluation
         if model_class.__name__ == "Document":
@@ -79,6 +79,12 @@ def _make_session_mock(
         return None
 
     session.get.side_effect = session_get
+    session.execute.return_value.one_or_none.return_value = (
+        candidate_position,
+        position,
+        document,
+        None,
+    )
     return session
 
 
@@ -122,6 +128,44 @@ class TestCvAnalysisHandlerSuccess:
         assert evaluation.completed_at is not None
         assert result == SAMPLE_RESULT
 
+    def test_stores_token_usage(self):
+        from cv_analysis import handler as handler_module
+
+        evaluation = _make_mock_evaluation()
+        document = _make_mock_document()
+        candidate_position = _make_mock_candidate_position()
+        position = _make_mock_position()
+        session = _make_session_mock(evaluation, document, candidate_position, position)
+
+        def fake_invoke(**kwargs):
+            kwargs["usage"].add({"input_tokens": 50, "cache_read_input_tokens": 1500})
+            return SAMPLE_RESULT
+
+        with (
+            patch(
+                "shared.db.get_session",
+                return_value=_mock_session(session),
+            ),
+            patch.object(
+                handler_module.s3_module,
+                "get_document_text",
+                return_value="John Doe, 5 years Python",
+            ),
+            patch.object(
+                handler_module.bedrock_module,
+                "invoke_claude_structured",
+                side_effect=fake_invoke,
+            ),
+        ):
+            handler_module.handler({"detail": {"evaluation_id": 1}}, context=None)
+
+        assert evaluation.token_usage == {
+            "input_tokens": 50,
+            "output_tokens": 0,
+            "cache_read_input_tokens": 1500,
+            "cache_creation_input_tokens": 0,
+        }
+
     def test_sets_running_status_first(self):
         from cv_analysis import handler as handler_module
 
@@ -288,3 +332,75 @@ class TestCvAnalysisHandlerFailure:
             handler_module.handler({"detail": {"evaluation_id": 1}}, context=None)
 
         assert commit_call_count[0] >= 2
+
+
+class TestCvAnalysisHandlerDuplicateDelivery:
+    def test_same_evaluation_delivered_twice_runs_once(self):
+        from cv_analysis import handler as handler_module
+
+        evaluation = _make_mock_evaluation()
+        session = _make_session_mock(
+            evaluation,
+            _make_mock_document(),
+            _make_mock_candidate_position(),
+            _make_mock_position(),
+        )
+        event = {"detail": {"evaluation_id": 1}}
+
+        with (
+            patch(
+                "shared.db.get_session",
+                side_effect=lambda: _mock_session(session),
+            ),
+            patch.object(
+                handler_module.s3_module,
+                "get_document_text",
+                return_value="John Doe, 5 years Python",
+            ),
+            patch.object(
+                handler_module.bedrock_module,
+                "invoke_claude_structured",
+                return_value=SAMPLE_RESULT,
+            ) as mock_invoke,
+        ):
+            first = handler_module.handler(event, context=None)
+            second = handler_module.handler(event, context=None)
+
+        assert first == SAMPLE_RESULT
+        assert second == {}
+        mock_invoke.assert_called_once()
+        assert evaluation.status == "completed"
+        assert evaluation.result == SAMPLE_RESULT
+        locked_reads = [
+            call.kwargs
+            for call in session.get.call_args_list
+            if call.args[0].__name__ == "Evaluation"
+        ]
+        assert locked_reads == [{"with_for_update": True}] * 2
+
+    def test_delivery_while_running_does_not_start_again(self):
+        from cv_analysis import handler as handler_module
+
+        evaluation = _make_mock_evaluation()
+        evaluation.status = "running"
+        session = _make_session_mock(
+            evaluation,
+            _make_mock_document(),
+            _make_mock_candidate_position(),
+            _make_mock_position(),
+        )
+
+        with (
+            patch("shared.db.get_session", return_value=_mock_session(session)),
+            patch.object(
+                handler_module.bedrock_module, "invoke_claude_structured"
+            ) as mock_invoke,
+        ):
+            result = handler_module.handler(
+                {"detail": {"evaluation_id": 1}}, context=None
+            )
+
+        assert result == {}
+        mock_invoke.assert_not_called()
+        assert evaluation.status == "running"
+        session.commit.assert_not_called()
@@ -79,7 +79,7 @@ def _make_session_mock(
 ) -> MagicMock:
     session = MagicMock()
 
-    def session_get(model_class, pk):
+    def session_get(model_class, pk, **kwargs):
         if model_class.__name__ == "Evaluation":
             return evaluation
         return None
@@ -88,16 +88,10 @@ def _make_session_mock(
 
     def execute_side_effect(stmt):
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-
-        compiled = str(stmt.compile(compile_kwargs={"literal_binds": True}))
-
-        for step_type, result in completed_evals.items():
-            if step_type in compiled:
-                row = _make_completed_eval_row(step_type, result)
-                mock_result.scalar_one_or_none.return_value = row
-                break
-
+        mock_result.all.return_value = [
+            _make_completed_eval_row(step_type, result)
+            for step_type, result in completed_evals.items()
+        ]
         return mock_result
 
     session.execute.side_effect = execute_side_effect
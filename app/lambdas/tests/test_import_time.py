@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+LAMBDAS_ROOT = Path(__file__).parent.parent
+
+HANDLER_MODULES = [
+    "cv_analysis.handler",
+    "screening_eval.handler",
+    "technical_eval.handler",
+    "recommendation.handler",
+    "feedback_gen.handler",
+]
+
+# Imported on demand only: SDK clients and document parsers.
+DEFERRED_MODULES = {"boto3", "pypdf", "docx"}
+
+
+def _import_profile(module: str) -> list[tuple[int, str]]:
+    """Return ``(cumulative_us, top_level_package)`` for every module imported."""
+    env = {
+        **os.environ,
+        "DB_SSM_PREFIX": "/unused/db",
+        "DB_PASSWORD_SECRET_ARN": "arn:unused",
+        "PYTHONPATH": str(LAMBDAS_ROOT),
+    }
+    for name in ("DB_HOST", "DB_PASSWORD"):
+        env.pop(name, None)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=LAMBDAS_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: list[tuple[int, str]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[12:].split("|"))
+        profile.append((int(cumulative), name.strip()))
+    return profile
+
+
+def _report(module: str, profile: list[tuple[int, str]], top: int = 10) -> str:
+    total_us = max(cumulative for cumulative, _ in profile)
+    lines = [f"{module}: {total_us / 1000:.1f} ms total import time"]
+    for cumulative, name in sorted(profile, reverse=True)[:top]:
+        lines.append(f"  {cumulative / 1000:8.1f} ms  {name}")
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("module", HANDLER_MODULES)
+def test_handler_import_defers_heavy_modules(module):
+    profile = _import_profile(module)
+    report = _report(module, profile)
+    print(report)
+
+    imported = {name.split(".")[0] for _, name in profile}
+    eager = DEFERRED_MODULES & imported
+    assert not eager, f"{sorted(eager)} imported eagerly\n{report}"
+
+
+def test_db_settings_resolve_with_one_ssm_call():
+    from shared import config
+
+    ssm = MagicMock()
+    ssm.get_paginator.return_value.paginate.return_value = [
+        {
+            "Parameters": [
+                {"Name": "/lauter/db/host", "Value": "db.internal"},
+                {"Name": "/lauter/db/port", "Value": "6432"},
+            ]
+        }
+    ]
+    config._ssm_params.cache_clear()
+    env = {"DB_SSM_PREFIX": "/lauter/db", "DB_HOST": "", "DB_PORT": ""}
+
+    try:
+        with (
+            patch.dict(os.environ, env),
+            patch("boto3.client", return_value=ssm) as mock_client,
+        ):
+            assert config.DB_HOST == "db.internal"
+            assert config.DB_PORT == "6432"
+    finally:
+        config._ssm_params.cache_clear()
+
+    mock_client.assert_called_once_with("ssm")
+    ssm.get_paginator.assert_called_once_with("get_parameters_by_path")
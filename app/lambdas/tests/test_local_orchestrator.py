@@ -0,0 +1,103 @@
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_NAME", "test")
+os.environ.setdefault("DB_USERNAME", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ.setdefault("S3_BUCKET_NAME", "test-bucket")
+os.environ.setdefault("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-6-v1:0")
+os.environ.setdefault("AWS_REGION", "us-east-1")
+
+
+def _make_evaluation(evaluation_id: int, step_type: str) -> MagicMock:
+    evaluation = MagicMock()
+    evaluation.id = evaluation_id
+    evaluation.step_type = step_type
+    return evaluation
+
+
+class TestClaimPending:
+    def test_claims_with_skip_locked_per_step_type(self):
+        from contextlib import contextmanager
+
+        from sqlalchemy.dialects import postgresql
+
+        import local_orchestrator
+
+        session = MagicMock()
+        evaluation = _make_evaluation(1, "cv_analysis")
+        session.scalars.return_value = [evaluation]
+
+        @contextmanager
+        def fake_session():
+            yield session
+
+        with patch.object(local_orchestrator, "get_session", fake_session):
+            claimed = local_orchestrator.claim_pending(
+                {"cv_analysis": 2, "technical_eval": 0}
+            )
+
+        assert claimed == [evaluation]
+        assert evaluation.status == "running"
+        session.commit.assert_called_once()
+        assert session.scalars.call_count == 1
+        sql = str(
+            session.scalars.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "LIMIT" in sql
+
+
+class TestWorkerPool:
+    def test_capacity_respects_step_limits_and_worker_count(self):
+        import local_orchestrator
+
+        pool = local_orchestrator.WorkerPool(
+            workers=3,
+            max_in_flight_per_step=2,
+            step_max_in_flight={"technical_eval": 1},
+        )
+        try:
+            capacity = pool.capacity()
+        finally:
+            pool.shutdown()
+
+        assert capacity["cv_analysis"] == 2
+        assert capacity["technical_eval"] == 1
+
+    def test_in_flight_work_reduces_capacity_until_released(self):
+        import local_orchestrator
+
+        release = threading.Event()
+        pool = local_orchestrator.WorkerPool(workers=2, max_in_flight_per_step=2)
+        claimed = [
+            _make_evaluation(1, "cv_analysis"),
+            _make_evaluation(2, "cv_analysis"),
+        ]
+
+        with (
+            patch.object(local_orchestrator, "claim_pending", return_value=claimed),
+            patch.object(
+                local_orchestrator, "dispatch", side_effect=lambda e: release.wait(5)
+            ),
+        ):
+            assert pool.poll_and_dispatch() == 2
+            assert all(limit == 0 for limit in pool.capacity().values())
+            assert pool.poll_and_dispatch() == 0
+
+            release.set()
+            pool.shutdown()
+
+        assert pool.capacity()["cv_analysis"] == 2
+
+    def test_stop_wakes_waiting_loop(self):
+        import local_orchestrator
+
+        pool = local_orchestrator.WorkerPool(workers=1)
+        pool.stop()
+        pool.wait(timeout=5)
+
+        assert pool.stopping
+        pool.shutdown()
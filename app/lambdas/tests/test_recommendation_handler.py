@@ -105,23 +105,17 @@ def _make_session_with_upstream(
     screening_result: dict | None,
     technical_result: dict | None,
 ) -> MagicMock:
-    """Build a session mock that intercepts session.execute(stmt).scalar_one_or_none()
-    calls for upstream evaluation lookups.
+    """Build a session mock for the handler's two queries.
 
-    The handler calls _fetch_latest_completed_results which runs one
-    select(Evaluation).where(...) per step type in UPSTREAM_STEP_TYPES order
-    (cv_analysis, screening_eval, technical_eval). We return the matching
-    result row or None based on whether the test provides a result dict.
+    The context query returns the (candidate_position, position, document,
+    rubric_version) row; the batched upstream-results query returns one row
+    per step type that has a result.
     """
     session = MagicMock()
 
-    def session_get(model_class, pk):
+    def session_get(model_class, pk, **kwargs):
         if model_class.__name__ == "Evaluation":
             return evaluation
-        if model_class.__name__ == "CandidatePosition":
-            return candidate_position
-        if model_class.__name__ == "Position":
-            return position
         return None
 
     session.get.side_effect = session_get
@@ -132,27 +126,24 @@ def _make_session_with_upstream(
         "technical_eval": technical_result,
     }
 
-    step_order = ["cv_analysis", "screening_eval", "technical_eval"]
-    call_index = [0]
-
     def execute_side_effect(stmt):
         result_proxy = MagicMock()
-        current_index = call_index[0]
-        call_index[0] += 1
-
-        step = step_order[current_index % 3]
-        step_result = results_by_step.get(step)
-
-        if step_result is None:
-            result_proxy.scalar_one_or_none.return_value = None
+        if "row_number" in str(stmt):
+            rows = []
+            for step, step_result in results_by_step.items():
+                if step_result is not None:
+                    row = MagicMock()
+                    row.step_type = step
+                    row.result = step_result
+                    rows.append(row)
+            result_proxy.all.return_value = rows
         else:
-            row = MagicMock()
-            row.step_type = step
-            row.status = "completed"
-            row.result = step_result
-            row.version = 1
-            result_proxy.scalar_one_or_none.return_value = row
-
+            result_proxy.one_or_none.return_value = (
+                candidate_position,
+                position,
+                None,
+                None,
+            )
         return result_proxy
 
     session.execute.side_effect = execute_side_effect
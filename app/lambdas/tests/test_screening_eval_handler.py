@@ -79,7 +79,7 @@ def _make_session_mock(
 ) -> MagicMock:
     session = MagicMock()
 
-    def session_get(model_class, pk):
+    def session_get(model_class, pk, **kwargs):
         if model_class.__name__ == "Evaluation":
             return evaluation
         if model_class.__name__ == "Document":
@@ -91,6 +91,12 @@ def _make_session_mock(
         return None
 
     session.get.side_effect = session_get
+    session.execute.return_value.one_or_none.return_value = (
+        candidate_position,
+        position,
+        document,
+        None,
+    )
     return session
 
 
@@ -169,6 +175,91 @@ class TestScreeningEvalHandlerSuccess:
         assert evaluation.completed_at is not None
         assert result == SAMPLE_RESULT
 
+    def test_oversized_transcript_is_trimmed_and_recorded(self):
+        from screening_eval import handler as handler_module
+
+        evaluation = _make_mock_evaluation()
+        document = _make_mock_document()
+        candidate_position = _make_mock_candidate_position()
+        position = _make_mock_position()
+        position.evaluation_instructions = ""
+        session = _make_session_mock(evaluation, document, candidate_position, position)
+        transcript = LONG_TRANSCRIPT * 200
+
+        with (
+            patch(
+                "shared.db.get_session",
+                return_value=_mock_session(session),
+            ),
+            patch.object(handler_module.config, "PROMPT_TOKEN_BUDGET", 6000),
+            patch.object(
+                handler_module.s3_module,
+                "get_document_text",
+                return_value=transcript,
+            ),
+            patch.object(
+                handler_module.bedrock_module,
+                "invoke_claude_structured",
+                return_value=dict(SAMPLE_RESULT),
+            ) as mock_invoke,
+        ):
+            result = handler_module.handler(
+                {"detail": {"evaluation_id": 1}}, context=None
+            )
+
+        prompt = mock_invoke.call_args.kwargs["prompt"]
+        assert "characters omitted" in prompt
+        assert transcript[-200:] in prompt
+        assert [s["section"] for s in result["truncated_sections"]] == ["transcript"]
+        assert evaluation.result["truncated_sections"][0]["strategy"] == "head_tail"
+
+    def test_long_transcript_is_condensed_and_chunk_count_recorded(self):
+        from screening_eval import handler as handler_module
+
+        evaluation = _make_mock_evaluation()
+        session = _make_session_mock(
+            evaluation,
+            _make_mock_document(),
+            _make_mock_candidate_position(),
+            _make_mock_position(),
+        )
+        transcript = "\n\n".join([LONG_TRANSCRIPT] * 20)
+        prompts: dict[str, list[str]] = {}
+
+        def fake_invoke(**kwargs):
+            prompts.setdefault(kwargs["tool_name"], []).append(kwargs["prompt"])
+            if kwargs["tool_name"] == "transcript_evidence":
+                return {"summary": "segment summary", "evidence": []}
+            return dict(SAMPLE_RESULT)
+
+        with (
+            patch("shared.db.get_session", return_value=_mock_session(session)),
+            patch.object(
+                handler_module.config, "TRANSCRIPT_CHUNKING_THRESHOLD_CHARS", 5000
+            ),
+            patch.object(handler_module.config, "TRANSCRIPT_SEGMENT_CHARS", 4000),
+            patch.object(
+                handler_module.s3_module,
+                "get_document_text",
+                return_value=transcript,
+            ),
+            patch.object(
+                handler_module.bedrock_module,
+                "invoke_claude_structured",
+                side_effect=fake_invoke,
+            ),
+        ):
+            result = handler_module.handler(
+                {"detail": {"evaluation_id": 1}}, context=None
+            )
+
+        chunks = len(prompts["transcript_evidence"])
+        assert chunks > 1
+        assert result["transcript_chunks"] == chunks
+        scoring_prompt = prompts["screening_eval"][0]
+        assert "Summary: segment summary" in scoring_prompt
+        assert LONG_TRANSCRIPT not in scoring_prompt
+
 
 class TestScreeningEvalHandlerFailure:
     def test_short_transcript_sets_failed_status(self):
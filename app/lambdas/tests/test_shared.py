@@ -1,6 +1,8 @@
+import itertools
 import json
 import os
-from unittest.mock import MagicMock, patch
+from datetime import datetime
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -30,14 +32,34 @@ class TestS3GetDocumentText:
             Bucket="test-bucket", Key="resume.txt"
         )
 
+    def _make_cached_client(
+        self, body: bytes, etag: str = '"abc123"', cached: dict | None = None
+    ) -> MagicMock:
+        from botocore.exceptions import ClientError
+
+        cached = {} if cached is None else cached
+        mock_client = MagicMock()
+        mock_client.head_object.return_value = {"ETag": etag, "ContentLength": 10}
+
+        def get_object(Bucket, Key):
+            if Key.startswith("extracted-text/"):
+                if Key not in cached:
+                    raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+                text = cached[Key]
+                return {"Body": MagicMock(read=lambda: text.encode())}
+            return {"Body": MagicMock(read=lambda: body), "ETag": etag}
+
+        def put_object(Bucket, Key, Body, ContentType):
+            cached[Key] = Body.decode()
+
+        mock_client.get_object.side_effect = get_object
+        mock_client.put_object.side_effect = put_object
+        return mock_client
+
     def test_pdf_extraction(self):
         from shared import s3 as s3_module
 
-        mock_client = MagicMock()
-        pdf_bytes = b"%PDF-1.4 fake content"
-        mock_client.get_object.return_value = {
-            "Body": MagicMock(read=lambda: pdf_bytes)
-        }
+        mock_client = self._make_cached_client(b"%PDF-1.4 fake content")
 
         mock_reader = MagicMock()
         mock_page = MagicMock()
@@ -46,7 +68,7 @@ class TestS3GetDocumentText:
 
         with (
             patch.object(s3_module, "get_client", return_value=mock_client),
-            patch.object(s3_module, "PdfReader", return_value=mock_reader),
+            patch("pypdf.PdfReader", return_value=mock_reader),
         ):
             result = s3_module.get_document_text("resume.pdf")
 
@@ -55,10 +77,7 @@ class TestS3GetDocumentText:
     def test_docx_extraction(self):
         from shared import s3 as s3_module
 
-        mock_client = MagicMock()
-        mock_client.get_object.return_value = {
-            "Body": MagicMock(read=lambda: b"fake docx bytes")
-        }
+        mock_client = self._make_cached_client(b"fake docx bytes")
 
         mock_doc = MagicMock()
         mock_para = MagicMock()
@@ -67,13 +86,105 @@ class TestS3GetDocumentText:
 
         with (
             patch.object(s3_module, "get_client", return_value=mock_client),
-            patch.object(s3_module, "docx") as mock_docx_module,
+            patch("docx.Document", return_value=mock_doc),
         ):
-            mock_docx_module.Document.return_value = mock_doc
             result = s3_module.get_document_text("resume.docx")
 
         assert result == "Paragraph text"
 
+    def test_extracted_text_is_cached_by_key_and_etag(self):
+        from shared import s3 as s3_module
+
+        cached: dict[str, str] = {}
+        mock_client = self._make_cached_client(b"%PDF-1.4", cached=cached)
+        mock_page = MagicMock()
+        mock_page.extract_text.return_value = "Parsed once"
+        mock_reader = MagicMock()
+        mock_reader.pages = [mock_page]
+
+        with (
+            patch.object(s3_module, "get_client", return_value=mock_client),
+            patch("pypdf.PdfReader", return_value=mock_reader),
+        ):
+            first = s3_module.get_document_text("resume.pdf")
+            second = s3_module.get_document_text("resume.pdf")
+
+        assert first == second == "Parsed once"
+        mock_page.extract_text.assert_called_once()
+        assert list(cached) == [s3_module._text_cache_key("resume.pdf", "abc123")]
+        source_downloads = [
+            c
+            for c in mock_client.get_object.call_args_list
+            if c.kwargs["Key"] == "resume.pdf"
+        ]
+        assert len(source_downloads) == 1
+
+    def test_changed_etag_misses_cache(self):
+        from shared import s3 as s3_module
+
+        stale_key = s3_module._text_cache_key("resume.pdf", "old-etag")
+        mock_client = self._make_cached_client(
+            b"%PDF-1.4", etag='"new-etag"', cached={stale_key: "Stale text"}
+        )
+        mock_reader = MagicMock()
+        mock_reader.pages = [MagicMock(extract_text=lambda: "Fresh text")]
+
+        with (
+            patch.object(s3_module, "get_client", return_value=mock_client),
+            patch("pypdf.PdfReader", return_value=mock_reader),
+        ):
+            result = s3_module.get_document_text("resume.pdf")
+
+        assert result == "Fresh text"
+
+    def test_cache_write_failure_still_returns_text(self):
+        from botocore.exceptions import ClientError
+
+        from shared import s3 as s3_module
+
+        mock_client = self._make_cached_client(b"%PDF-1.4")
+        mock_client.put_object.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "PutObject"
+        )
+        mock_reader = MagicMock()
+        mock_reader.pages = [MagicMock(extract_text=lambda: "Text")]
+
+        with (
+            patch.object(s3_module, "get_client", return_value=mock_client),
+            patch("pypdf.PdfReader", return_value=mock_reader),
+        ):
+            result = s3_module.get_document_text("resume.pdf")
+
+        assert result == "Text"
+
+    def test_missing_parsed_document_raises(self):
+        from botocore.exceptions import ClientError
+
+        from shared import s3 as s3_module
+
+        mock_client = MagicMock()
+        mock_client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+
+        with (
+            patch.object(s3_module, "get_client", return_value=mock_client),
+            pytest.raises(FileNotFoundError),
+        ):
+            s3_module.get_document_text("missing.pdf")
+
+    def test_plain_text_skips_cache(self):
+        from shared import s3 as s3_module
+
+        mock_client = MagicMock()
+        mock_client.get_object.return_value = {"Body": MagicMock(read=lambda: b"Hi")}
+
+        with patch.object(s3_module, "get_client", return_value=mock_client):
+            s3_module.get_document_text("notes.txt")
+
+        mock_client.head_object.assert_not_called()
+        mock_client.put_object.assert_not_called()
+
     def test_file_not_found_raises(self):
         from shared import s3 as s3_module
 
@@ -88,6 +199,54 @@ class TestS3GetDocumentText:
             s3_module.get_document_text("missing.txt")
 
 
+class TestPdfExtraction:
+    def _make_reader(self, page_texts: list[str]) -> tuple[MagicMock, list[MagicMock]]:
+        pages = [MagicMock() for _ in page_texts]
+        for page, text in zip(pages, page_texts, strict=True):
+            page.extract_text.return_value = text
+        reader = MagicMock()
+        reader.pages = pages
+        return reader, pages
+
+    def test_pages_are_joined_in_order(self):
+        from shared import s3 as s3_module
+
+        texts = [f"page {i}" for i in range(10)]
+        reader, _ = self._make_reader(texts)
+
+        with patch("pypdf.PdfReader", return_value=reader):
+            result = s3_module._extract_pdf_text(b"%PDF", char_budget=0)
+
+        assert result == "\n".join(texts)
+
+    def test_stops_at_char_budget(self):
+        from shared import s3 as s3_module
+
+        reader, pages = self._make_reader(["x" * 100] * 50)
+
+        with patch("pypdf.PdfReader", return_value=reader):
+            result = s3_module._extract_pdf_text(b"%PDF", char_budget=250)
+
+        assert len(result) == 250
+        extracted = sum(page.extract_text.call_count for page in pages)
+        assert extracted == 3
+
+    def test_logs_page_timings(self, caplog):
+        from shared import s3 as s3_module
+
+        reader, _ = self._make_reader(["a", "b"])
+
+        with (
+            patch("pypdf.PdfReader", return_value=reader),
+            caplog.at_level("DEBUG", logger="shared.s3"),
+        ):
+            s3_module._extract_pdf_text(b"%PDF", char_budget=0)
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("Extracted PDF page 1/2" in m for m in messages)
+        assert any("Extracted 2/2 PDF pages" in m for m in messages)
+
+
 class TestBedrockInvokeClaude:
     def _make_mock_client(self, response_text: str) -> MagicMock:
         mock_client = MagicMock()
@@ -154,6 +313,471 @@ class TestBedrockInvokeClaude:
         assert mock_client.invoke_model.call_count == 2
 
 
+class TestBedrockPromptCaching:
+    def _make_mock_client(self, usage: dict | None = None) -> MagicMock:
+        mock_client = MagicMock()
+        payload = {
+            "content": [{"type": "tool_use", "input": {"ok": True}}],
+            "usage": usage or {},
+        }
+        mock_client.invoke_model.return_value = {
+            "body": MagicMock(read=lambda: json.dumps(payload).encode())
+        }
+        return mock_client
+
+    def _invoke(self, mock_client: MagicMock, prompt: str, **kwargs) -> dict:
+        from shared import bedrock as bedrock_module
+
+        with patch.object(bedrock_module, "get_client", return_value=mock_client):
+            bedrock_module.invoke_claude_structured(
+                prompt=prompt,
+                tool_name="t",
+                tool_schema={"type": "object"},
+                system_prompt="system",
+                **kwargs,
+            )
+        return json.loads(mock_client.invoke_model.call_args.kwargs["body"])
+
+    def test_marks_tools_system_and_prefix_as_cache_breakpoints(self):
+        from shared.prompts.formatters import CACHE_BREAKPOINT
+
+        body = self._invoke(self._make_mock_client(), f"prefix{CACHE_BREAKPOINT}rest")
+
+        ephemeral = {"type": "ephemeral"}
+        assert body["tools"][0]["cache_control"] == ephemeral
+        assert body["system"] == [
+            {"type": "text", "text": "system", "cache_control": ephemeral}
+        ]
+        assert body["messages"][0]["content"] == [
+            {"type": "text", "text": "prefix", "cache_control": ephemeral},
+            {"type": "text", "text": "rest"},
+        ]
+
+    def test_caching_disabled_sends_plain_strings(self):
+        from shared import config
+        from shared.prompts.formatters import CACHE_BREAKPOINT
+
+        with patch.object(config, "BEDROCK_PROMPT_CACHING", False):
+            body = self._invoke(
+                self._make_mock_client(), f"prefix{CACHE_BREAKPOINT}rest"
+            )
+
+        assert "cache_control" not in body["tools"][0]
+        assert body["system"] == "system"
+        assert body["messages"][0]["content"] == "prefixrest"
+
+    def test_records_cache_token_usage(self):
+        from shared.bedrock import TokenUsage
+
+        usage = TokenUsage()
+        mock_client = self._make_mock_client(
+            {
+                "input_tokens": 120,
+                "output_tokens": 300,
+                "cache_read_input_tokens": 2048,
+                "cache_creation_input_tokens": 0,
+            }
+        )
+
+        self._invoke(mock_client, "prompt", usage=usage)
+
+        assert usage.as_dict() == {
+            "input_tokens": 120,
+            "output_tokens": 300,
+            "cache_read_input_tokens": 2048,
+            "cache_creation_input_tokens": 0,
+        }
+
+    def test_token_usage_can_be_shared_between_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from shared.bedrock import TokenUsage
+
+        usage = TokenUsage()
+
+        def add_many(_: int) -> None:
+            for _ in range(1000):
+                usage.add({"input_tokens": 1, "output_tokens": 2})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(add_many, range(8)))
+
+        assert usage.as_dict() == {
+            "input_tokens": 8000,
+            "output_tokens": 16000,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+        }
+
+    def test_technical_prompt_prefix_is_shared_across_candidates(self):
+        from shared.prompts.formatters import CACHE_BREAKPOINT
+        from shared.prompts.technical_eval import build_technical_eval_prompt
+
+        rubric = {"categories": [{"name": "Skills", "criteria": [{"name": "Coding"}]}]}
+        prompts = [
+            build_technical_eval_prompt(
+                position_title="Engineer",
+                position_description="Python",
+                rubric_structure=rubric,
+                transcript_text=transcript,
+                cv_text=cv_text,
+                evaluation_instructions="Focus on depth",
+            )[1]
+            for transcript, cv_text in [("first", "cv one"), ("second", None)]
+        ]
+
+        prefixes = [p.partition(CACHE_BREAKPOINT)[0] for p in prompts]
+        assert prefixes[0] == prefixes[1]
+        assert "Coding" in prefixes[0]
+        assert "Focus on depth" in prefixes[0]
+        assert "cv one" not in prefixes[0]
+
+    def test_category_prompts_share_transcript_prefix(self):
+        from shared.prompts.formatters import CACHE_BREAKPOINT
+        from shared.prompts.technical_eval import (
+            build_technical_eval_category_prompts,
+        )
+
+        rubric = {
+            "categories": [
+                {"name": "Skills", "criteria": [{"name": "Coding"}]},
+                {"name": "Soft", "criteria": [{"name": "Clarity"}]},
+            ]
+        }
+        _, summary_prompt, category_prompts = build_technical_eval_category_prompts(
+            position_title="Engineer",
+            position_description="Python",
+            rubric_structure=rubric,
+            transcript_text="the transcript",
+        )
+
+        split = [
+            p.partition(CACHE_BREAKPOINT) for p in [summary_prompt, *category_prompts]
+        ]
+        assert len({prefix for prefix, _, _ in split}) == 1
+        assert "the transcript" in split[0][0]
+        assert "Coding" in split[1][2] and "Clarity" not in split[1][2]
+        assert "Clarity" in split[2][2] and "Coding" not in split[2][2]
+
+
+STREAMED_TOOL_INPUT = {
+    "criteria_scores": [
+        {"criterion": "Coding", "score": 4, "weight": 2},
+        {"criterion": "Design", "score": 3, "weight": 1},
+    ],
+    "summary": 'Solid "hands-on" engineer, {mostly}',
+}
+
+
+class TestBedrockStreaming:
+    def _stream_events(self, text: str, chunk_size: int = 7) -> list[dict]:
+        messages = [
+            {
+                "type": "message_start",
+                "message": {"usage": {"input_tokens": 50, "output_tokens": 1}},
+            },
+            {"type": "content_block_start", "content_block": {"type": "tool_use"}},
+            *(
+                {
+                    "type": "content_block_delta",
+                    "delta": {
+                        "type": "input_json_delta",
+                        "partial_json": text[i : i + chunk_size],
+                    },
+                }
+                for i in range(0, len(text), chunk_size)
+            ),
+            {"type": "content_block_stop"},
+            {"type": "message_delta", "usage": {"output_tokens": 80}},
+            {"type": "message_stop"},
+        ]
+        return [{"chunk": {"bytes": json.dumps(m).encode()}} for m in messages]
+
+    def _invoke(self, mock_client: MagicMock, **kwargs) -> dict:
+        from shared import bedrock as bedrock_module
+        from shared import config
+
+        with (
+            patch.object(bedrock_module, "get_client", return_value=mock_client),
+            patch.object(config, "PARTIAL_RESULT_INTERVAL_SECONDS", 0),
+        ):
+            return bedrock_module.invoke_claude_structured(
+                prompt="prompt", tool_name="t", tool_schema={"type": "object"}, **kwargs
+            )
+
+    def test_partial_json_snapshots_only_complete_members(self):
+        from shared.bedrock import PartialJson
+
+        partial = PartialJson()
+        partial.feed('{"scores": [{"name": "a", "score": 1}, {"name": "b", "sc')
+        assert partial.snapshot() == {
+            "scores": [{"name": "a", "score": 1}, {"name": "b"}]
+        }
+        assert partial.snapshot() is None
+
+        partial.feed('ore": 2}], "note": "x, y}')
+        assert partial.snapshot() == {
+            "scores": [{"name": "a", "score": 1}, {"name": "b", "score": 2}]
+        }
+        partial.feed('"}')
+        assert json.loads(partial.text) == partial.snapshot()
+
+    def test_streams_tool_input_and_reports_partials(self):
+        from shared.bedrock import TokenUsage
+
+        mock_client = MagicMock()
+        mock_client.invoke_model_with_response_stream.return_value = {
+            "body": self._stream_events(json.dumps(STREAMED_TOOL_INPUT))
+        }
+        partials: list[dict] = []
+        usage = TokenUsage()
+
+        result = self._invoke(mock_client, on_partial=partials.append, usage=usage)
+
+        assert result == STREAMED_TOOL_INPUT
+        mock_client.invoke_model.assert_not_called()
+        scored = [len(p.get("criteria_scores", [])) for p in partials]
+        assert scored == sorted(scored)
+        assert any(
+            p.get("criteria_scores") == STREAMED_TOOL_INPUT["criteria_scores"][:1]
+            for p in partials
+        )
+        assert usage.input_tokens == 50
+        assert usage.output_tokens == 80
+
+    def test_falls_back_to_invoke_model_on_stream_error(self):
+        from shared.bedrock import TokenUsage
+
+        mock_client = MagicMock()
+        events = self._stream_events(json.dumps(STREAMED_TOOL_INPUT))
+        mock_client.invoke_model_with_response_stream.return_value = {
+            "body": [*events[:4], {"modelStreamErrorException": {"message": "x"}}]
+        }
+        payload = {
+            "content": [{"type": "tool_use", "input": STREAMED_TOOL_INPUT}],
+            "usage": {"input_tokens": 50, "output_tokens": 90},
+        }
+        mock_client.invoke_model.return_value = {
+            "body": MagicMock(read=lambda: json.dumps(payload).encode())
+        }
+        usage = TokenUsage()
+
+        result = self._invoke(mock_client, on_partial=lambda partial: None, usage=usage)
+
+        assert result == STREAMED_TOOL_INPUT
+        assert mock_client.invoke_model.call_count == 1
+        assert usage.output_tokens == 90
+
+    def test_streaming_needs_callback_and_flag(self):
+        from shared import config
+
+        payload = {"content": [{"type": "tool_use", "input": {"ok": True}}]}
+        mock_client = MagicMock()
+        mock_client.invoke_model.return_value = {
+            "body": MagicMock(read=lambda: json.dumps(payload).encode())
+        }
+
+        self._invoke(mock_client)
+        with patch.object(config, "BEDROCK_STREAMING", False):
+            self._invoke(mock_client, on_partial=lambda partial: None)
+
+        mock_client.invoke_model_with_response_stream.assert_not_called()
+        assert mock_client.invoke_model.call_count == 2
+
+
+class TestBedrockResponseCache:
+    def _make_mock_client(self) -> MagicMock:
+        payload = {
+            "content": [{"type": "tool_use", "input": {"fresh": True}}],
+            "usage": {"input_tokens": 10, "output_tokens": 5},
+        }
+        mock_client = MagicMock()
+        mock_client.invoke_model.return_value = {
+            "body": MagicMock(read=lambda: json.dumps(payload).encode())
+        }
+        return mock_client
+
+    def _invoke(self, mock_client: MagicMock, cached: dict | None, **kwargs):
+        from shared import bedrock as bedrock_module
+        from shared import config
+
+        usage = bedrock_module.TokenUsage()
+        with (
+            patch.object(bedrock_module, "get_client", return_value=mock_client),
+            patch.object(config, "BEDROCK_RESPONSE_CACHE", True),
+            patch.object(
+                bedrock_module.response_cache, "get", return_value=cached
+            ) as cache_get,
+            patch.object(bedrock_module.response_cache, "put") as cache_put,
+        ):
+            result = bedrock_module.invoke_claude_structured(
+                prompt="prompt",
+                tool_name="t",
+                tool_schema={"type": "object"},
+                usage=usage,
+                **kwargs,
+            )
+        return result, usage, cache_get, cache_put
+
+    def test_fingerprint_covers_every_request_input(self):
+        from shared.response_cache import fingerprint
+
+        base = ("model", "system", "prompt", "tool", {"type": "object"}, 4096)
+        variants = [
+            ("other-model", *base[1:]),
+            (base[0], "other system", *base[2:]),
+            (*base[:2], "other prompt", *base[3:]),
+            (*base[:3], "other-tool", *base[4:]),
+            (*base[:4], {"type": "array"}, base[5]),
+            (*base[:5], 1024),
+            (*base, {"tool": {"type": "object"}, "other": {}}),
+        ]
+
+        assert fingerprint(*base) == fingerprint(*base)
+        assert len({fingerprint(*v) for v in [base, *variants]}) == 8
+
+    def test_hit_skips_bedrock(self):
+        mock_client = self._make_mock_client()
+
+        result, usage, _, cache_put = self._invoke(mock_client, {"cached": True})
+
+        assert result == {"cached": True}
+        mock_client.invoke_model.assert_not_called()
+        cache_put.assert_not_called()
+        assert usage.input_tokens == 0
+
+    def test_miss_stores_result(self):
+        mock_client = self._make_mock_client()
+
+        result, usage, cache_get, cache_put = self._invoke(mock_client, None)
+
+        assert result == {"fresh": True}
+        assert usage.input_tokens == 10
+        key = cache_get.call_args.args[0]
+        assert cache_put.call_args.args == (key, ANY, {"fresh": True})
+
+    def test_fresh_call_bypasses_lookup_but_refreshes_entry(self):
+        mock_client = self._make_mock_client()
+
+        result, _, cache_get, cache_put = self._invoke(
+            mock_client, {"cached": True}, use_cache=False
+        )
+
+        assert result == {"fresh": True}
+        cache_get.assert_not_called()
+        cache_put.assert_called_once()
+
+
+class TestBedrockRateLimiter:
+    def test_refill_caps_at_burst(self):
+        from shared import config, rate_limiter
+
+        with (
+            patch.object(config, "BEDROCK_REQUESTS_PER_MINUTE", 60.0),
+            patch.object(config, "BEDROCK_BURST", 5.0),
+        ):
+            assert rate_limiter.refill(1.0, 2.0) == 3.0
+            assert rate_limiter.refill(1.0, 3600.0) == 5.0
+
+    def test_aimd_window(self):
+        from shared import config, rate_limiter
+
+        with patch.object(config, "BEDROCK_MAX_CONCURRENCY", 10.0):
+            assert rate_limiter.next_concurrency_limit(8.0, throttled=True) == 4.0
+            assert rate_limiter.next_concurrency_limit(1.0, throttled=True) == 1.0
+            assert rate_limiter.next_concurrency_limit(4.0, throttled=False) == 4.25
+            assert rate_limiter.next_concurrency_limit(10.0, throttled=False) == 10.0
+
+    def test_engine_pool_fits_parallel_workers(self):
+        from shared import config, rate_limiter
+
+        with (
+            patch.object(config, "TRANSCRIPT_SEGMENT_WORKERS", 4),
+            patch.object(config, "RUBRIC_SCORING_WORKERS", 8),
+            patch.object(rate_limiter, "_engine", None),
+            patch.object(rate_limiter, "create_engine") as create_engine,
+        ):
+            rate_limiter._get_engine()
+
+        assert create_engine.call_args.kwargs["pool_size"] == 8
+
+    def test_acquire_waits_with_jitter_until_admitted(self):
+        from shared import config, rate_limiter
+
+        with (
+            patch.object(config, "BEDROCK_RATE_LIMIT_ENABLED", True),
+            patch.object(
+                rate_limiter, "_try_acquire", side_effect=[None, None, "lease-1"]
+            ),
+            patch("shared.rate_limiter.time.sleep") as mock_sleep,
+        ):
+            permit = rate_limiter.acquire("model")
+
+        assert permit.lease_id == "lease-1"
+        assert mock_sleep.call_count == 2
+
+    def test_acquire_times_out(self):
+        from shared import config, rate_limiter
+
+        with (
+            patch.object(config, "BEDROCK_RATE_LIMIT_ENABLED", True),
+            patch.object(config, "BEDROCK_ADMISSION_TIMEOUT_SECONDS", 0.0),
+            patch.object(rate_limiter, "_try_acquire", return_value=None),
+            pytest.raises(RuntimeError, match="admission"),
+        ):
+            rate_limiter.acquire("model")
+
+    def test_acquire_fails_open_when_store_unavailable(self):
+        from sqlalchemy.exc import OperationalError
+
+        from shared import config, rate_limiter
+
+        with (
+            patch.object(config, "BEDROCK_RATE_LIMIT_ENABLED", True),
+            patch.object(
+                rate_limiter,
+                "_try_acquire",
+                side_effect=OperationalError("select", {}, Exception("down")),
+            ),
+            patch.object(rate_limiter, "_release") as mock_release,
+            rate_limiter.admission("model") as permit,
+        ):
+            pass
+
+        assert permit.lease_id is None
+        mock_release.assert_not_called()
+
+    def test_throttled_call_is_reported_to_limiter(self):
+        from shared import bedrock as bedrock_module
+        from shared import rate_limiter
+
+        ThrottlingException = type("ThrottlingException", (Exception,), {})
+        mock_client = MagicMock()
+        mock_client.exceptions.ThrottlingException = ThrottlingException
+        payload = {"content": [{"text": "ok"}]}
+        mock_client.invoke_model.side_effect = [
+            ThrottlingException("slow down"),
+            {"body": MagicMock(read=lambda: json.dumps(payload).encode())},
+        ]
+        permits = iter(
+            [rate_limiter.Permit("m", "lease-1"), rate_limiter.Permit("m", "lease-2")]
+        )
+
+        with (
+            patch.object(bedrock_module, "get_client", return_value=mock_client),
+            patch.object(rate_limiter, "acquire", side_effect=lambda _: next(permits)),
+            patch.object(rate_limiter, "_release") as mock_release,
+            patch("shared.bedrock.time.sleep"),
+        ):
+            assert bedrock_module.invoke_claude("Hello") == "ok"
+
+        released = [call.args[0] for call in mock_release.call_args_list]
+        assert [(p.lease_id, p.throttled) for p in released] == [
+            ("lease-1", True),
+            ("lease-2", False),
+        ]
+
+
 class TestCvAnalysisPromptBuilder:
     def test_returns_tuple(self):
         from shared.prompts.cv_analysis import build_cv_analysis_prompt
@@ -196,3 +820,386 @@ class TestCvAnalysisPromptBuilder:
         assert "overall_fit" in props
         assert "experience_relevance" in props
         assert "thinking" in props
+
+
+class TestPromptBudget:
+    def test_within_budget_leaves_sections_untouched(self):
+        from shared.prompts.budget import PromptBudget, PromptSection
+
+        budget = PromptBudget(max_tokens=1000)
+        texts = budget.fit([PromptSection("cv", "short cv", priority=1)], 100)
+
+        assert texts == {"cv": "short cv"}
+        assert budget.truncated_sections == []
+
+    def test_lowest_priority_section_is_trimmed_first(self):
+        from shared.prompts.budget import PromptBudget, PromptSection, estimate_tokens
+
+        cv = "c" * 4000
+        transcript = "t" * 4000
+        sections = [
+            PromptSection("transcript", transcript, priority=2),
+            PromptSection("cv", cv, priority=1, min_tokens=100),
+        ]
+        prompt_tokens = estimate_tokens(cv + transcript) + 50
+        budget = PromptBudget(max_tokens=prompt_tokens - 500)
+
+        texts = budget.fit(sections, prompt_tokens)
+
+        assert texts["transcript"] == transcript
+        assert estimate_tokens(texts["cv"]) <= 500
+        assert budget.truncated_sections == [
+            {
+                "section": "cv",
+                "strategy": "head",
+                "original_tokens": 1000,
+                "kept_tokens": 500,
+            }
+        ]
+
+    def test_min_tokens_spills_over_to_next_section(self):
+        from shared.prompts.budget import PromptBudget, PromptSection
+
+        sections = [
+            PromptSection("cv", "c" * 4000, priority=1, min_tokens=800),
+            PromptSection("transcript", "t" * 4000, priority=2),
+        ]
+        budget = PromptBudget(max_tokens=1500)
+
+        budget.fit(sections, 2000)
+
+        assert [s["section"] for s in budget.truncated_sections] == [
+            "cv",
+            "transcript",
+        ]
+        assert budget.truncated_sections[1]["kept_tokens"] == 700
+
+    def test_record_copies_truncation_into_result(self, caplog):
+        from shared.prompts.budget import PromptBudget, PromptSection
+
+        budget = PromptBudget(max_tokens=100)
+        budget.fit([PromptSection("cv", "c" * 4000, priority=1)], 1000)
+        result: dict = {}
+
+        with caplog.at_level("WARNING", logger="shared.prompts.budget"):
+            budget.record(result, evaluation_id=7)
+
+        assert result["truncated_sections"] == budget.truncated_sections
+        assert "Prompt truncated to fit token budget" in caplog.text
+
+    def test_record_leaves_result_alone_without_truncation(self):
+        from shared.prompts.budget import PromptBudget
+
+        result: dict = {}
+        PromptBudget(max_tokens=100).record(result, evaluation_id=7)
+
+        assert "truncated_sections" not in result
+
+    def test_head_tail_keeps_both_ends(self):
+        from shared.prompts.budget import PromptBudget, PromptSection
+
+        transcript = "BEGIN" + "x" * 8000 + "END"
+        budget = PromptBudget(max_tokens=500)
+
+        texts = budget.fit(
+            [PromptSection("transcript", transcript, priority=1, strategy="head_tail")],
+            2002,
+        )
+
+        assert texts["transcript"].startswith("BEGIN")
+        assert texts["transcript"].endswith("END")
+        assert "characters omitted" in texts["transcript"]
+        assert len(texts["transcript"]) <= 500 * 4
+
+    def test_marker_reports_the_characters_dropped(self):
+        import re
+
+        from shared.prompts.budget import PromptBudget, PromptSection
+
+        for strategy in ("head", "head_tail"):
+            text = "y" * 10000
+            texts = PromptBudget(max_tokens=500).fit(
+                [PromptSection("cv", text, priority=1, strategy=strategy)], 2500
+            )
+
+            trimmed = texts["cv"]
+            marker = re.search(
+                r"\n\[\.\.\. (\d+) characters omitted \.\.\.\]\n?", trimmed
+            )
+            assert marker is not None
+            kept = len(trimmed) - len(marker.group(0))
+            assert int(marker.group(1)) == len(text) - kept
+            assert len(trimmed) <= 500 * 4
+
+    def test_builder_without_budget_is_unchanged(self):
+        from shared.prompts.budget import PromptBudget
+        from shared.prompts.screening_eval import build_screening_eval_prompt
+
+        args = ("Engineer", "Python", "transcript " * 100)
+        unbounded = build_screening_eval_prompt(*args)
+        bounded = build_screening_eval_prompt(*args, budget=PromptBudget(100_000))
+
+        assert unbounded == bounded
+
+
+INTERVIEW_TURNS = [
+    f"{'Interviewer' if i % 2 else 'Candidate'}: answer {i} " + "x" * 80 + "\n"
+    for i in range(40)
+]
+
+
+class TestTranscriptChunking:
+    def test_segments_break_at_speaker_turns_with_overlap(self):
+        from shared.transcripts import split_transcript
+
+        text = "".join(INTERVIEW_TURNS)
+        segments = split_transcript(text, segment_chars=1000, overlap_chars=200)
+
+        assert len(segments) > 1
+        assert all(len(s) <= 1000 for s in segments)
+        assert all(s.startswith(("Interviewer:", "Candidate:")) for s in segments)
+        for previous, segment in itertools.pairwise(segments):
+            first_turn = segment.splitlines(keepends=True)[0]
+            assert previous.endswith(first_turn)
+        assert segments[0].startswith(INTERVIEW_TURNS[0])
+        assert INTERVIEW_TURNS[-1] in segments[-1]
+
+    def test_falls_back_to_paragraphs_and_slices_long_turns(self):
+        from shared.transcripts import split_transcript
+
+        paragraphs = ["a" * 300, "b" * 300, "c" * 2500]
+        segments = split_transcript(
+            "\n\n".join(paragraphs), segment_chars=1000, overlap_chars=0
+        )
+
+        assert "".join(segments) == "\n\n".join(paragraphs)
+        assert segments[0] == "a" * 300 + "\n\n" + "b" * 300 + "\n\n"
+        assert all(len(s) <= 1000 for s in segments)
+
+    def test_condense_extracts_every_segment_in_order(self):
+        from shared import bedrock as bedrock_module
+        from shared import config
+        from shared.transcripts import condense_transcript
+
+        def fake_invoke(**kwargs):
+            number = kwargs["prompt"].split("segment ", 1)[1].split(" ", 1)[0]
+            kwargs["usage"].add({"input_tokens": 100, "output_tokens": 20})
+            return {
+                "summary": f"part {number}",
+                "evidence": [
+                    {"topic": "Coding", "quote": f"q{number}", "observation": "o"}
+                ],
+            }
+
+        usage = bedrock_module.TokenUsage()
+        with (
+            patch.object(config, "TRANSCRIPT_SEGMENT_CHARS", 1000),
+            patch.object(config, "TRANSCRIPT_SEGMENT_OVERLAP_CHARS", 200),
+            patch.object(
+                bedrock_module, "invoke_claude_structured", side_effect=fake_invoke
+            ) as mock_invoke,
+        ):
+            condensed, chunks = condense_transcript(
+                "".join(INTERVIEW_TURNS), "Coding", usage
+            )
+
+        assert chunks == mock_invoke.call_count > 1
+        summaries = [line for line in condensed.splitlines() if "Summary:" in line]
+        assert summaries == [f"Summary: part {n}" for n in range(1, chunks + 1)]
+        assert f'- [Coding] "q{chunks}" — o' in condensed
+        assert usage.input_tokens == 100 * chunks
+
+
+class TestEvaluationLifecycleNotify:
+    def _make_session(self, dialect_name: str) -> MagicMock:
+        evaluation = MagicMock()
+        evaluation.id = 1
+        evaluation.candidate_position_id = 5
+        evaluation.step_type = "cv_analysis"
+        evaluation.version = 1
+        evaluation.status = "pending"
+        evaluation.updated_at = datetime(2026, 1, 1, 12, 0, 0)
+        session = MagicMock()
+        session.get.return_value = evaluation
+        session.get_bind.return_value.dialect.name = dialect_name
+        return session
+
+    def _notified_statuses(self, session: MagicMock) -> list[str]:
+        statuses = []
+        for call in session.execute.call_args_list:
+            params = call.args[0].compile().params
+            assert "evaluation_status" in params.values()
+            payload = next(v for v in params.values() if v.startswith("{"))
+            statuses.append(json.loads(payload)["status"])
+        return statuses
+
+    def test_notifies_running_and_completed_on_postgres(self):
+        from contextlib import contextmanager
+
+        from shared.evaluation_lifecycle import complete_evaluation, run_evaluation
+
+        session = self._make_session("postgresql")
+
+        @contextmanager
+        def _session():
+            yield session
+
+        with (
+            patch("shared.db.get_session", return_value=_session()),
+            run_evaluation(1) as (sess, evaluation),
+        ):
+            complete_evaluation(sess, evaluation, {"ok": True})
+
+        assert self._notified_statuses(session) == ["running", "completed"]
+
+    def test_notifies_failed_on_error(self):
+        from contextlib import contextmanager
+
+        from shared.evaluation_lifecycle import run_evaluation
+
+        session = self._make_session("postgresql")
+
+        @contextmanager
+        def _session():
+            yield session
+
+        with (
+            patch("shared.db.get_session", return_value=_session()),
+            pytest.raises(RuntimeError),
+            run_evaluation(1),
+        ):
+            raise RuntimeError("boom")
+
+        assert self._notified_statuses(session) == ["running", "failed"]
+
+    def test_partial_result_notifies_running(self):
+        from shared.evaluation_lifecycle import save_partial_result
+
+        session = self._make_session("postgresql")
+        evaluation = session.get.return_value
+        evaluation.status = "running"
+
+        save_partial_result(session, evaluation, {"criteria_scores": []})
+
+        assert evaluation.result == {"criteria_scores": []}
+        assert self._notified_statuses(session) == ["running"]
+        session.commit.assert_called_once()
+
+    def test_notification_carries_progress_marker(self):
+        from shared.evaluation_lifecycle import save_partial_result
+
+        session = self._make_session("postgresql")
+        evaluation = session.get.return_value
+        evaluation.status = "running"
+
+        save_partial_result(session, evaluation, {"criteria_scores": []})
+
+        session.flush.assert_not_called()
+        params = session.execute.call_args.args[0].compile().params
+        payload = json.loads(next(v for v in params.values() if v.startswith("{")))
+        assert evaluation.updated_at > datetime(2026, 1, 1, 12, 0, 0)
+        assert payload["progress"] == evaluation.updated_at.isoformat()
+
+    def test_failed_partial_write_is_rolled_back(self):
+        from sqlalchemy.exc import OperationalError
+
+        from shared.evaluation_lifecycle import save_partial_result
+
+        session = self._make_session("sqlite")
+        session.commit.side_effect = OperationalError("UPDATE", {}, Exception())
+
+        save_partial_result(session, session.get.return_value, {"x": 1})
+
+        session.rollback.assert_called_once()
+
+    def test_failure_clears_partial_result(self):
+        from contextlib import contextmanager
+
+        from shared.evaluation_lifecycle import run_evaluation, save_partial_result
+
+        session = self._make_session("sqlite")
+
+        @contextmanager
+        def _session():
+            yield session
+
+        with (
+            patch("shared.db.get_session", return_value=_session()),
+            pytest.raises(RuntimeError),
+            run_evaluation(1) as (sess, evaluation),
+        ):
+            save_partial_result(sess, evaluation, {"x": 1})
+            raise RuntimeError("boom")
+
+        assert session.get.return_value.status == "failed"
+        assert session.get.return_value.result is None
+
+    def test_skips_notify_on_other_dialects(self):
+        from shared.evaluation_lifecycle import notify_status_change
+
+        session = self._make_session("sqlite")
+
+        notify_status_change(session, session.get.return_value)
+
+        session.execute.assert_not_called()
+
+
+class TestBatchedQueries:
+    def test_latest_results_use_single_windowed_query(self):
+        from sqlalchemy.dialects import postgresql
+
+        from shared.queries import fetch_latest_completed_results
+
+        row = MagicMock(step_type="cv_analysis", result={"overall_fit": "Good"})
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [row]
+
+        results = fetch_latest_completed_results(
+            session, 5, ("cv_analysis", "screening_eval")
+        )
+
+        assert results == {"cv_analysis": {"overall_fit": "Good"}}
+        session.execute.assert_called_once()
+        sql = str(
+            session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "row_number() OVER (PARTITION BY evaluations.step_type" in sql
+
+    def test_context_loader_raises_for_missing_candidate_position(self):
+        from shared.queries import load_evaluation_context
+
+        evaluation = MagicMock(candidate_position_id=5)
+        session = MagicMock()
+        session.execute.return_value.one_or_none.return_value = None
+
+        with pytest.raises(ValueError, match="CandidatePosition 5 not found"):
+            load_evaluation_context(session, evaluation)
+
+    def test_context_loader_fetches_results_when_requested(self):
+        from shared.queries import load_evaluation_context
+
+        evaluation = MagicMock(
+            candidate_position_id=5, source_document_id=None, rubric_version_id=None
+        )
+        candidate_position, position = MagicMock(), MagicMock()
+        context_result = MagicMock()
+        context_result.one_or_none.return_value = (
+            candidate_position,
+            position,
+            None,
+            None,
+        )
+        results_result = MagicMock()
+        results_result.all.return_value = [
+            MagicMock(step_type="technical_eval", result={"weighted_total": 4.0})
+        ]
+        session = MagicMock()
+        session.execute.side_effect = [context_result, results_result]
+
+        context = load_evaluation_context(
+            session, evaluation, result_step_types=("technical_eval",)
+        )
+
+        assert context.position is position
+        assert context.latest_results == {"technical_eval": {"weighted_total": 4.0}}
+        assert session.execute.call_count == 2
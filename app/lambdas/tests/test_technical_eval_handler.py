@@ -3,6 +3,8 @@ from contextlib import contextmanager
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 os.environ.setdefault("DB_HOST", "localhost")
 os.environ.setdefault("DB_NAME", "test")
 os.environ.setdefault("DB_USERNAME", "test")
@@ -174,28 +176,32 @@ def _make_session_mock(
     rubric_version: MagicMock | None = None,
     cv_analysis_eval: MagicMock | None = None,
     screening_eval: MagicMock | None = None,
+    cv_document_s3_key: str | None = None,
+    results_error: Exception | None = None,
 ) -> MagicMock:
     session = MagicMock()
 
-    def session_get(model_class, pk):
+    def session_get(model_class, pk, **kwargs):
         if model_class.__name__ == "Evaluation":
             return evaluation
-        if model_class.__name__ == "Document":
-            return document
-        if model_class.__name__ == "CandidatePosition":
-            return candidate_position
-        if model_class.__name__ == "Position":
-            return position
-        if model_class.__name__ == "PositionRubricVersion":
-            return rubric_version
         return None
 
-    execute_results = iter([cv_analysis_eval, screening_eval])
+    upstream_rows = [row for row in (cv_analysis_eval, screening_eval) if row]
 
     def session_execute(stmt):
-        row = next(execute_results, None)
         result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = row
+        if "row_number" in str(stmt):
+            if results_error is not None:
+                raise results_error
+            result_mock.all.return_value = upstream_rows
+        else:
+            result_mock.one_or_none.return_value = (
+                candidate_position,
+                position,
+                document,
+                rubric_version,
+                cv_document_s3_key,
+            )
         return result_mock
 
     session.get.side_effect = session_get
@@ -594,9 +600,13 @@ class TestTechnicalEvalContextEnrichment:
         rubric_version = _make_mock_rubric_version()
 
         session = _make_session_mock(
-            evaluation, document, candidate_position, position, rubric_version
+            evaluation,
+            document,
+            candidate_position,
+            position,
+            rubric_version,
+            results_error=RuntimeError("DB connection lost"),
         )
-        session.execute.side_effect = RuntimeError("DB connection lost")
 
         with (
             patch(
@@ -668,3 +678,239 @@ class TestTechnicalEvalContextEnrichment:
         assert "Prior Screening Signals" not in prompt
         assert "Evaluation Rubric" in prompt
         assert "Interview Transcript" in prompt
+
+    def test_cv_text_fallback_uses_document_from_context_query(self):
+        from technical_eval import handler as handler_module
+
+        evaluation = _make_mock_evaluation()
+        document = _make_mock_document()
+        candidate_position = _make_mock_candidate_position()
+        position = _make_mock_position()
+        rubric_version = _make_mock_rubric_version()
+        session = _make_session_mock(
+            evaluation,
+            document,
+            candidate_position,
+            position,
+            rubric_version,
+            cv_document_s3_key="uploads/cv.pdf",
+        )
+
+        captured_prompt = {}
+
+        def capture_bedrock_call(**kwargs):
+            captured_prompt["user_prompt"] = kwargs.get("prompt", "")
+            return SAMPLE_LLM_RESULT
+
+        def fake_get_document_text(s3_key):
+            return "Raw CV contents" if s3_key == "uploads/cv.pdf" else "Transcript."
+
+        with (
+            patch(
+                "shared.db.get_session",
+                return_value=_mock_session(session),
+            ),
+            patch.object(
+                handler_module.s3_module,
+                "get_document_text",
+                side_effect=fake_get_document_text,
+            ),
+            patch.object(
+                handler_module.bedrock_module,
+                "invoke_claude_structured",
+                side_effect=capture_bedrock_call,
+            ),
+        ):
+            handler_module.handler({"detail": {"evaluation_id": 1}}, context=None)
+
+        assert "Raw CV Text:\nRaw CV contents" in captured_prompt["user_prompt"]
+        assert session.execute.call_count == 2
+
+
+class TestTechnicalEvalParallelScoring:
+    def _run(self, invoke) -> tuple[dict[str, Any], MagicMock, MagicMock]:
+        from shared import config
+        from technical_eval import handler as handler_module
+
+        evaluation = _make_mock_evaluation()
+        session = _make_session_mock(
+            evaluation,
+            _make_mock_document(),
+            _make_mock_candidate_position(),
+            _make_mock_position(),
+            _make_mock_rubric_version(),
+        )
+
+        with (
+            patch("shared.db.get_session", return_value=_mock_session(session)),
+            patch.object(
+                handler_module.s3_module,
+                "get_document_text",
+                return_value="Transcript text here.",
+            ),
+            patch.object(
+                handler_module.bedrock_module,
+                "invoke_claude_structured",
+                side_effect=invoke,
+            ),
+            patch.object(handler_module, "save_partial_result") as save_partial_result,
+            patch.object(config, "PARALLEL_RUBRIC_SCORING", True),
+        ):
+            result = handler_module.handler(
+                {"detail": {"evaluation_id": 1}}, context=None
+            )
+        return result, evaluation, save_partial_result
+
+    def test_merges_category_scores_in_rubric_order(self):
+        import time
+
+        calls: list[dict[str, Any]] = []
+
+        def fake_invoke(**kwargs):
+            calls.append(kwargs)
+            kwargs["usage"].add({"input_tokens": 100, "output_tokens": 10})
+            if kwargs["tool_name"] == "technical_eval_summary":
+                return {
+                    k: v
+                    for k, v in SAMPLE_LLM_RESULT.items()
+                    if k not in ("criteria_scores", "weighted_total")
+                }
+            category = kwargs["prompt"].rsplit('Use "', 1)[1].split('"', 1)[0]
+            if category == "Soft Skills":
+                time.sleep(0.05)
+            return {
+                "criteria_scores": [
+                    score
+                    for score in SAMPLE_LLM_RESULT["criteria_scores"]
+                    if score["category_name"] == category
+                ]
+            }
+
+        result, evaluation, save_partial_result = self._run(fake_invoke)
+
+        assert result == {**SAMPLE_LLM_RESULT, "weighted_total": 4.3}
+        assert [c["tool_name"] for c in calls].count("technical_eval_category") == 2
+        assert evaluation.token_usage["input_tokens"] == 300
+        assert evaluation.token_usage["output_tokens"] == 30
+        # The first category is saved on its own, then the summary fields
+        # join it while the slow second category is still running.
+        assert save_partial_result.call_count == 2
+        first, second = (c.args[2] for c in save_partial_result.call_args_list)
+        assert "strengths_summary" not in first
+        assert [s["criterion_name"] for s in second["criteria_scores"]] == [
+            "System Design",
+            "Coding",
+        ]
+        assert second["strengths_summary"] == SAMPLE_LLM_RESULT["strengths_summary"]
+
+    def test_category_failure_fails_the_evaluation(self):
+        def fake_invoke(**kwargs):
+            if kwargs["tool_name"] == "technical_eval_category":
+                raise RuntimeError("Bedrock invocation failed")
+            return {}
+
+        with pytest.raises(RuntimeError):
+            self._run(fake_invoke)
+
+    def test_category_failure_does_not_wait_for_calls_in_flight(self):
+        import threading
+        import time
+
+        release = threading.Event()
+        category_calls = 0
+
+        def fake_invoke(**kwargs):
+            nonlocal category_calls
+            if kwargs["tool_name"] == "technical_eval_summary":
+                release.wait(timeout=5)
+                return {}
+            category_calls += 1
+            if category_calls == 1:
+                return {"criteria_scores": []}
+            raise RuntimeError("Bedrock invocation failed")
+
+        started = time.monotonic()
+        try:
+            with pytest.raises(RuntimeError):
+                self._run(fake_invoke)
+            assert time.monotonic() - started < 1
+        finally:
+            release.set()
+
+    def test_first_category_warms_the_cache_before_the_fan_out(self):
+        import io
+        import json
+        import threading
+
+        from shared import config
+        from shared.prompts.formatters import CACHE_BREAKPOINT
+        from technical_eval import handler as handler_module
+
+        lock = threading.Lock()
+        events: list[tuple[str, str]] = []
+        bodies: list[dict[str, Any]] = []
+
+        def invoke_model(**kwargs):
+            body = json.loads(kwargs["body"])
+            task = body["messages"][0]["content"][1]["text"]
+            with lock:
+                events.append(("start", task))
+                bodies.append(body)
+            tool_input = (
+                {"criteria_scores": []}
+                if body["tool_choice"]["name"] == "technical_eval_category"
+                else {}
+            )
+            with lock:
+                events.append(("end", task))
+            payload = {"content": [{"type": "tool_use", "input": tool_input}]}
+            return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+        client = MagicMock()
+        client.invoke_model.side_effect = invoke_model
+        evaluation = _make_mock_evaluation()
+        evaluation.skip_response_cache = False
+
+        with (
+            patch.object(
+                handler_module.bedrock_module, "get_client", return_value=client
+            ),
+            patch.object(handler_module, "save_partial_result"),
+            patch.object(config, "MOCK_BEDROCK", False),
+            patch.object(config, "BEDROCK_PROMPT_CACHING", True),
+            patch.object(config, "BEDROCK_RESPONSE_CACHE", False),
+        ):
+            handler_module._score_by_category(
+                MagicMock(),
+                evaluation,
+                "system",
+                f"context{CACHE_BREAKPOINT}summary",
+                [f"context{CACHE_BREAKPOINT}category {n}" for n in range(3)],
+                handler_module.bedrock_module.TokenUsage(),
+            )
+
+        # The first category finishes before any other call starts.
+        assert events[:2] == [("start", "category 0"), ("end", "category 0")]
+        assert sorted(task for kind, task in events[2:] if kind == "start") == [
+            "category 1",
+            "category 2",
+            "summary",
+        ]
+        # Every call sends the same tools, system and cached context prefix,
+        # with one breakpoint after each.
+        for body in bodies:
+            assert body["tools"] == bodies[0]["tools"]
+            assert [t["name"] for t in body["tools"]] == [
+                "technical_eval_summary",
+                "technical_eval_category",
+            ]
+            assert "cache_control" not in body["tools"][0]
+            assert body["tools"][1]["cache_control"] == {"type": "ephemeral"}
+            assert body["system"][0]["cache_control"] == {"type": "ephemeral"}
+            prefix, task = body["messages"][0]["content"]
+            assert prefix == {
+                "type": "text",
+                "text": "context",
+                "cache_control": {"type": "ephemeral"},
+            }
+            assert "cache_control" not in task
@@ -246,6 +246,14 @@ resource "aws_iam_role_policy" "lambda_evaluation" {
           "${var.files_bucket_arn}/*"
         ]
       },
+      {
+        Sid    = "S3WriteExtractedTextCache"
+        Effect = "Allow"
+        Action = ["s3:PutObject"]
+        Resource = [
+          "${var.files_bucket_arn}/extracted-text/*"
+        ]
+      },
       {
         Sid    = "SSMReadDbParams"
         Effect = "Allow"
@@ -257,6 +265,12 @@ resource "aws_iam_role_policy" "lambda_evaluation" {
           aws_ssm_parameter.db_username.arn,
         ]
       },
+      {
+        Sid      = "SSMReadDbParamsByPath"
+        Effect   = "Allow"
+        Action   = ["ssm:GetParametersByPath"]
+        Resource = [trimsuffix(aws_ssm_parameter.db_host.arn, "/host")]
+      },
       {
         Sid    = "SecretsManagerReadDbPassword"
         Effect = "Allow"
@@ -133,6 +133,23 @@ resource "aws_s3_bucket_lifecycle_configuration" "files" {
       noncurrent_days = 90
     }
   }
+
+  rule {
+    id     = "expire-extracted-text-cache"
+    status = "Enabled"
+
+    filter {
+      prefix = "extracted-text/"
+    }
+
+    expiration {
+      days = 30
+    }
+
+    noncurrent_version_expiration {
+      noncurrent_days = 1
+    }
+  }
 }
 
 # CloudFront Access Logs Bucket